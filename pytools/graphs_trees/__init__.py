@@ -8,4 +8,4 @@ arrays and strings for solving problems
 '''
 
 # Import modules
-from . import graphs, trees, utils
\ No newline at end of file
+from . import graph_algorithms, graphs, shortest_paths, trees, utils
\ No newline at end of file
@@ -0,0 +1,239 @@
+# pytools/graphs_trees/graph_algorithms.py
+#
+# Author: Daniel Clark, 2016
+
+'''
+This module contains functions to find the connected components,
+strongly connected components and topological order of graphs data
+structures; all of them are iterative and run in linear time
+'''
+
+class UnionFind(object):
+    '''
+    Disjoint-set forest over the integer items 0..n-1 with union by
+    size and path halving, so any sequence of operations runs in nearly
+    linear time; the forest is stored in flat arrays
+    '''
+
+    def __init__(self, num_items):
+        '''
+        Init the UnionFind object with every item in its own set
+        '''
+
+        # Import packages
+        from array import array
+
+        # Init instance attributes
+        self.parent = array('l', xrange(num_items))
+        self.set_size = array('l', [1]) * num_items
+        self.num_sets = num_items
+
+    def find(self, item):
+        '''
+        Return the root item of the set containing item
+        '''
+
+        # Point every other item on the path at its grandparent
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+
+        # Return the root
+        return item
+
+    def union(self, item1, item2):
+        '''
+        Merge the sets containing item1 and item2; returns True if they
+        were in different sets
+        '''
+
+        # Find both roots
+        root1 = self.find(item1)
+        root2 = self.find(item2)
+        if root1 == root2:
+            return False
+
+        # Hang the smaller tree under the larger one
+        if self.set_size[root1] < self.set_size[root2]:
+            root1, root2 = root2, root1
+        self.parent[root2] = root1
+        self.set_size[root1] += self.set_size[root2]
+        self.num_sets -= 1
+
+        # Sets were merged
+        return True
+
+    def connected(self, item1, item2):
+        '''
+        Check if item1 and item2 are in the same set
+        '''
+        return self.find(item1) == self.find(item2)
+
+    def __len__(self):
+        '''
+        Return the number of items
+        '''
+        return len(self.parent)
+
+
+def connected_components(graph):
+    '''
+    Find the connected components of a graph, treating every edge as
+    undirected (i.e. weakly connected components for directed graphs)
+
+    Parameters
+    ----------
+    graph : Graph or CompactGraph object
+        the graph to partition; any object with get_vertices() and a
+        get_connections(key) method returning neighbor keys works
+
+    Returns
+    -------
+    components : list
+        list of components, each a list of vertex keys
+    '''
+
+    # Import packages
+    from pytools.graphs_trees import graphs
+
+    # Union the endpoints of every edge
+    if isinstance(graph, graphs.CompactGraph):
+        keys = graph.get_vertices()
+        union_find = UnionFind(graph.num_vertices)
+        offsets = graph.offsets
+        neighbors = graph.neighbors
+        for idx in xrange(graph.num_vertices):
+            for pos in xrange(offsets[idx], offsets[idx+1]):
+                union_find.union(idx, neighbors[pos])
+    else:
+        keys = list(graph.get_vertices())
+        key_index = dict((key, idx) for idx, key in enumerate(keys))
+        union_find = UnionFind(len(keys))
+        for idx, key in enumerate(keys):
+            for nbr_key in graph.get_connections(key):
+                union_find.union(idx, key_index[nbr_key])
+
+    # Group the keys by root
+    groups = {}
+    for idx, key in enumerate(keys):
+        root = union_find.find(idx)
+        if root in groups:
+            groups[root].append(key)
+        else:
+            groups[root] = [key]
+
+    # Return the components
+    return groups.values()
+
+
+def strongly_connected_components(graph):
+    '''
+    Find the strongly connected components of a directed graph with an
+    iterative version of Tarjan's algorithm
+
+    Parameters
+    ----------
+    graph : Graph or CompactGraph object
+        the graph to partition; any object with get_vertices() and a
+        get_connections(key) method returning neighbor keys works
+
+    Returns
+    -------
+    components : list
+        list of components, each a list of vertex keys; components are
+        in reverse topological order, so every edge between two
+        components points from a later one to an earlier one
+    '''
+
+    # Init variables
+    get_connections = graph.get_connections
+    index = {}
+    low_link = {}
+    on_stack = set()
+    scc_stack = []
+    components = []
+    counter = 0
+
+    # Start a DFS at every vertex not yet indexed
+    for root in graph.get_vertices():
+        if root in index:
+            continue
+        index[root] = low_link[root] = counter
+        counter += 1
+        scc_stack.append(root)
+        on_stack.add(root)
+        # Stack of (key, iterator over remaining neighbors)
+        call_stack = [(root, iter(get_connections(root)))]
+        while call_stack:
+            key, nbrs = call_stack[-1]
+            # Descend into the next unindexed neighbor
+            for nbr_key in nbrs:
+                if nbr_key not in index:
+                    index[nbr_key] = low_link[nbr_key] = counter
+                    counter += 1
+                    scc_stack.append(nbr_key)
+                    on_stack.add(nbr_key)
+                    nbr_iter = iter(get_connections(nbr_key))
+                    call_stack.append((nbr_key, nbr_iter))
+                    break
+                elif nbr_key in on_stack:
+                    low_link[key] = min(low_link[key], index[nbr_key])
+            # All neighbors done, return to the caller
+            else:
+                call_stack.pop()
+                if call_stack:
+                    caller = call_stack[-1][0]
+                    low_link[caller] = min(low_link[caller], low_link[key])
+                # Key is the root of a component, pop it off
+                if low_link[key] == index[key]:
+                    component = []
+                    while True:
+                        member = scc_stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == key:
+                            break
+                    components.append(component)
+
+    # Return the components
+    return components
+
+
+def topological_sort(graph):
+    '''
+    Order the vertices of a directed acyclic graph so every edge points
+    from an earlier vertex to a later one, using the finish times of a
+    depth-first search: vertices are returned by decreasing finish time
+
+    Parameters
+    ----------
+    graph : Graph or CompactGraph object
+        the graph to sort; any object with get_vertices() and a
+        get_connections(key) method returning neighbor keys works
+
+    Returns
+    -------
+    order : list
+        list of every vertex key in topological order
+    '''
+
+    # Import packages
+    from pytools.graphs_trees import graphs
+
+    # Get the finish times
+    result = graphs.dfs(graph)
+    order = result.finish_order()
+    order.reverse()
+
+    # An edge to a vertex that finished later is a back edge (a cycle)
+    for key in order:
+        key_fin = result.finish(key)
+        for nbr_key in graph.get_connections(key):
+            if result.finish(nbr_key) >= key_fin:
+                err_msg = 'Graph has a cycle through edge: %s -> %s!' \
+                          % (str(key), str(nbr_key))
+                raise ValueError(err_msg)
+
+    # Return the order
+    return order
@@ -109,9 +109,9 @@ class Graph(object):
         '''
 
         # If either key is not in graph, add it
-        if from_key not in self.vert_dict.keys():
+        if from_key not in self.vert_dict:
             from_vert = self.add_vertex(from_key)
-        if to_key not in self.vert_dict.keys():
+        if to_key not in self.vert_dict:
             to_vert = self.add_vertex(to_key)
 
         # Add neighbor connection
@@ -123,6 +123,20 @@ class Graph(object):
         '''
         return self.vert_dict.keys()
 
+    def get_connections(self, key):
+        '''
+        Get a list of the keys connected to the vertex with key
+        '''
+        return [nbr.key for nbr in self.vert_dict[key].connected_to]
+
+    def get_weighted_connections(self, key):
+        '''
+        Get a list of (key, weight) pairs of the vertices connected to
+        the vertex with key
+        '''
+        return [(nbr.key, wght) for nbr, wght in
+                self.vert_dict[key].connected_to.iteritems()]
+
     def clear_visited(self):
         '''
         Set all colors to white
@@ -132,45 +146,41 @@ class Graph(object):
 
     def find_route_dfs(self, start_data, end_data):
         '''
-        Find if there exists a route between two nodes
+        Find if there exists a route between two nodes; the search uses
+        an explicit stack and its own visited set, so it works on any
+        path length and leaves the vertex colors untouched
         '''
 
         # Ensure both nodes are in graph
-        if not (start_data in self.vert_dict.keys() and \
-                end_data in self.vert_dict.keys()):
+        if not (start_data in self.vert_dict and end_data in self.vert_dict):
             err_msg = 'start data and end data both need to be in graph!'
             raise ValueError(err_msg)
 
         # Init variables
-        found = False
-        start_node = self.vert_dict[start_data]
-        children = start_node.get_connections()
-
-        # If there are no children or we visited the node already, return false
-        if len(children) == 0 or start_node.color != 'white':
-            return False
-        # Mark node as visited ('grey')
-        start_node.color = 'grey'
-
-        # Iterate through all node children, and search depth recursively
-        for child in children:
-            # If we found end_data key, return True
-            if child.key == end_data:
-                return True
-            # Otherwise, recursively search downward
-            found = self.find_route_dfs(child.key, end_data)
-            # If we found it on that downward path, break from loop
-            if found:
-                break
-
-        # Return result of search
-        return found
+        visited = set()
+        stack = [self.vert_dict[start_data]]
+
+        # Pop nodes off the stack and push their unvisited children
+        while stack:
+            node = stack.pop()
+            if node in visited:
+                continue
+            visited.add(node)
+            for child in node.connected_to:
+                # If we found end_data key, return True
+                if child.key == end_data:
+                    return True
+                if child not in visited:
+                    stack.append(child)
+
+        # Made it through all reachable nodes without finding end_data
+        return False
 
     def __contains__(self, key):
         '''
         Enable in operator to check graph
         '''
-        return key in self.vert_dict.keys()
+        return key in self.vert_dict
 
     def __iter__(self):
         '''
@@ -179,7 +189,446 @@ class Graph(object):
         return iter(self.vert_dict.values())
 
 
-def build_wordladder_graph(text_filepath):
+class CompactGraph(object):
+    '''
+    Frozen graph stored in compressed-sparse-row (CSR) form; vertices
+    are mapped to integer ids 0..n-1 and the edges leaving vertex i
+    are neighbors[offsets[i]:offsets[i+1]] with the matching entries
+    of weights. All of the storage is in flat array.array buffers, so
+    they can be wrapped with numpy.frombuffer without copying
+    '''
+
+    def __init__(self, offsets, neighbors, weights=None, keys=None):
+        '''
+        Init the CompactGraph object from its CSR arrays
+
+        Parameters
+        ----------
+        offsets : array.array
+            array of length num_vertices+1 where the edges of vertex i
+            are stored at [offsets[i], offsets[i+1])
+        neighbors : array.array
+            array of length num_edges containing the destination
+            vertex id of every edge
+        weights : array.array (optional); default=None
+            array of length num_edges containing the weight of every
+            edge; if None, every edge has a weight of 0
+        keys : list (optional); default=None
+            list mapping vertex id -> vertex key; if None, the vertex
+            keys are the integer ids themselves
+        '''
+
+        # Check array sizes agree
+        if len(offsets) < 1 or offsets[-1] != len(neighbors):
+            err_msg = 'offsets must end with the number of edges: %d!' \
+                      % len(neighbors)
+            raise ValueError(err_msg)
+        if weights is not None and len(weights) != len(neighbors):
+            err_msg = 'weights and neighbors must be the same length!'
+            raise ValueError(err_msg)
+        if keys is not None and len(keys) != len(offsets) - 1:
+            err_msg = 'keys must have an entry for every vertex!'
+            raise ValueError(err_msg)
+
+        # Init instance attributes
+        self.offsets = offsets
+        self.neighbors = neighbors
+        self.weights = weights
+        self.keys = keys
+        self.num_vertices = len(offsets) - 1
+        self.num_edges = len(neighbors)
+        if keys is None:
+            self.key_index = None
+        else:
+            self.key_index = dict((key, idx) for idx, key in enumerate(keys))
+
+    @classmethod
+    def from_graph(cls, graph, weighted=True):
+        '''
+        Build a CompactGraph from an existing Graph object; vertex ids
+        follow the order of graph.vert_dict iteration
+
+        Parameters
+        ----------
+        graph : Graph object
+            the graph to compress
+        weighted : boolean (optional); default=True
+            flag indicating whether to store the edge weights
+
+        Returns
+        -------
+        compact_graph : CompactGraph object
+            the compressed, read-only copy of graph
+        '''
+
+        # Import packages
+        from array import array
+
+        # Init variables
+        keys = list(graph.vert_dict.keys())
+        key_index = dict((key, idx) for idx, key in enumerate(keys))
+        offsets = array('l', [0])
+        neighbors = array('i')
+        weights = array('d') if weighted else None
+
+        # Lay out each vertex's edges contiguously
+        for key in keys:
+            for nbr, wght in graph.vert_dict[key].connected_to.items():
+                neighbors.append(key_index[nbr.key])
+                if weighted:
+                    weights.append(wght)
+            offsets.append(len(neighbors))
+
+        # Return the compact graph
+        return cls(offsets, neighbors, weights, keys)
+
+    @classmethod
+    def from_edges(cls, edges, num_vertices=None, weighted=True):
+        '''
+        Build a CompactGraph from an iterable of directed edges
+
+        Parameters
+        ----------
+        edges : iterable
+            iterable of (from_key, to_key) or (from_key, to_key, weight)
+            tuples; it is only iterated over once
+        num_vertices : integer (optional); default=None
+            if specified, the keys are taken to be integer vertex ids in
+            [0, num_vertices) and no key mapping is stored; otherwise
+            keys can be any hashable and are numbered in the order they
+            are first seen
+        weighted : boolean (optional); default=True
+            flag indicating whether to store the edge weights
+
+        Returns
+        -------
+        compact_graph : CompactGraph object
+            the compressed graph of the edges
+        '''
+
+        # Import packages
+        from array import array
+
+        # Init variables
+        sources = array('i')
+        targets = array('i')
+        edge_weights = array('d')
+        if num_vertices is None:
+            keys = []
+            key_index = {}
+        else:
+            keys = None
+
+        # Gather the edges into flat arrays, mapping keys to ids
+        for edge in edges:
+            from_key, to_key = edge[0], edge[1]
+            if keys is not None:
+                for key in (from_key, to_key):
+                    if key not in key_index:
+                        key_index[key] = len(keys)
+                        keys.append(key)
+                from_key = key_index[from_key]
+                to_key = key_index[to_key]
+            sources.append(from_key)
+            targets.append(to_key)
+            if weighted:
+                edge_weights.append(edge[2] if len(edge) > 2 else 0)
+        if keys is not None:
+            num_vertices = len(keys)
+
+        # Count the out-degree of every vertex and prefix-sum to offsets
+        offsets = array('l', [0]) * (num_vertices + 1)
+        for src in sources:
+            offsets[src + 1] += 1
+        for idx in xrange(num_vertices):
+            offsets[idx + 1] += offsets[idx]
+
+        # Scatter the edges into place (a counting sort by source)
+        cursor = array('l', offsets[:-1])
+        neighbors = array('i', [0]) * len(sources)
+        weights = array('d', [0.0]) * len(sources) if weighted else None
+        for idx, src in enumerate(sources):
+            pos = cursor[src]
+            neighbors[pos] = targets[idx]
+            if weighted:
+                weights[pos] = edge_weights[idx]
+            cursor[src] = pos + 1
+
+        # Return the compact graph
+        return cls(offsets, neighbors, weights, keys)
+
+    def index(self, key):
+        '''
+        Get the integer vertex id associated with a given key
+        '''
+        if self.key_index is None:
+            if not (isinstance(key, (int, long)) and
+                    0 <= key < self.num_vertices):
+                raise KeyError('Vertex with key: %s not in graph!' % str(key))
+            return key
+        try:
+            return self.key_index[key]
+        except KeyError:
+            raise KeyError('Vertex with key: %s not in graph!' % str(key))
+
+    def key(self, idx):
+        '''
+        Get the vertex key associated with a given integer vertex id
+        '''
+        if self.keys is None:
+            return idx
+        return self.keys[idx]
+
+    def get_vertices(self):
+        '''
+        Return a list of vertices by their key value
+        '''
+        if self.keys is None:
+            return range(self.num_vertices)
+        return list(self.keys)
+
+    def get_connections(self, key):
+        '''
+        Get a list of the keys connected to the vertex with key
+        '''
+        idx = self.index(key)
+        nbr_ids = self.neighbors[self.offsets[idx]:self.offsets[idx+1]]
+        return [self.key(nbr) for nbr in nbr_ids]
+
+    def get_weighted_connections(self, key):
+        '''
+        Get a list of (key, weight) pairs of the vertices connected to
+        the vertex with key
+        '''
+        idx = self.index(key)
+        start, end = self.offsets[idx], self.offsets[idx+1]
+        if self.weights is None:
+            return [(self.key(nbr), 0) for nbr in self.neighbors[start:end]]
+        return [(self.key(self.neighbors[pos]), self.weights[pos])
+                for pos in xrange(start, end)]
+
+    def get_weight(self, from_key, to_key):
+        '''
+        Get the weight of the edge from_key -> to_key
+        '''
+        from_idx = self.index(from_key)
+        to_idx = self.index(to_key)
+        for pos in xrange(self.offsets[from_idx], self.offsets[from_idx+1]):
+            if self.neighbors[pos] == to_idx:
+                return 0 if self.weights is None else self.weights[pos]
+        err_msg = 'No edge from: %s to: %s in graph!' % (str(from_key),
+                                                         str(to_key))
+        raise KeyError(err_msg)
+
+    def nbytes(self):
+        '''
+        Return the number of bytes used by the CSR arrays
+        '''
+        num_bytes = 0
+        for arr in (self.offsets, self.neighbors, self.weights):
+            if arr is not None:
+                num_bytes += arr.itemsize * len(arr)
+        return num_bytes
+
+    def find_route_dfs(self, start_data, end_data):
+        '''
+        Find if there exists a route between two vertices; unlike
+        Graph.find_route_dfs, no visited state is left behind
+        '''
+
+        # Ensure both nodes are in graph
+        if not (start_data in self and end_data in self):
+            err_msg = 'start data and end data both need to be in graph!'
+            raise ValueError(err_msg)
+
+        # Init variables
+        offsets = self.offsets
+        neighbors = self.neighbors
+        end_idx = self.index(end_data)
+        visited = bytearray(self.num_vertices)
+        stack = [self.index(start_data)]
+
+        # Pop vertices off the stack and push their unvisited neighbors
+        while stack:
+            idx = stack.pop()
+            if visited[idx]:
+                continue
+            visited[idx] = 1
+            for pos in xrange(offsets[idx], offsets[idx+1]):
+                nbr = neighbors[pos]
+                if nbr == end_idx:
+                    return True
+                if not visited[nbr]:
+                    stack.append(nbr)
+
+        # Made it through all reachable vertices without finding end
+        return False
+
+    def depth_first_search(self):
+        '''
+        Perform a depth-first search over every vertex
+
+        Returns
+        -------
+        result : DFSResult object
+            the discovery/finish times and predecessors of every vertex
+        '''
+        return dfs(self)
+
+    def __contains__(self, key):
+        '''
+        Enable in operator to check graph
+        '''
+        if self.key_index is None:
+            return isinstance(key, (int, long)) and \
+                0 <= key < self.num_vertices
+        return key in self.key_index
+
+    def __len__(self):
+        '''
+        Return the number of vertices in the graph
+        '''
+        return self.num_vertices
+
+
+class WordLadderGraph(object):
+    '''
+    Implicit word-ladder graph which only stores the wildcard bucket
+    index, {'c_t' : [words]}; the neighbors of a word are generated from
+    its buckets when they are asked for, so the bucket cliques are never
+    materialized as edges
+    '''
+
+    def __init__(self, words=None):
+        '''
+        Init the WordLadderGraph object with an optional iterable of
+        words
+        '''
+
+        # Init instance attributes
+        self.buckets = {}
+        self.words = set()
+        self.num_vertices = 0
+
+        # Add initial words
+        if words is not None:
+            self.add_words(words)
+
+    @classmethod
+    def from_file(cls, text_filepath, chunk_size=1 << 20):
+        '''
+        Build a WordLadderGraph from a text file with a word on each line,
+        reading it in chunks so the raw file is never held in memory
+
+        Parameters
+        ----------
+        text_filepath : string
+            filepath to a text document with a word on each line
+        chunk_size : integer (optional); default=1MB
+            approximate number of bytes to read per chunk
+
+        Returns
+        -------
+        word_graph : WordLadderGraph object
+            the implicit word-ladder graph of the words in the file
+        '''
+
+        # Init variables
+        word_graph = cls()
+
+        # Read a chunk of lines at a time and index them
+        with open(text_filepath, 'r') as wfile:
+            lines = wfile.readlines(chunk_size)
+            while lines:
+                word_graph.add_words(line.rstrip('\n') for line in lines)
+                lines = wfile.readlines(chunk_size)
+
+        # Return the graph
+        return word_graph
+
+    def add_words(self, words):
+        '''
+        Add every word of an iterable to the bucket index; empty and
+        repeated words are skipped
+        '''
+
+        # Init variables
+        buckets = self.buckets
+        seen = self.words
+
+        # Add each new word to the bucket of every wildcard position
+        for word in words:
+            if not word or word in seen:
+                continue
+            seen.add(word)
+            for let in xrange(len(word)):
+                bucket = word[:let] + '_' + word[let+1:]
+                if bucket in buckets:
+                    buckets[bucket].append(word)
+                else:
+                    buckets[bucket] = [word]
+        self.num_vertices = len(seen)
+
+    def get_vertices(self):
+        '''
+        Return a list of every word in the graph
+        '''
+        return list(self.words)
+
+    def get_connections(self, word):
+        '''
+        Generate the words that differ from word by exactly one letter;
+        two such words share exactly one bucket, so each is yielded
+        once
+        '''
+
+        # Init variables
+        buckets = self.buckets
+
+        # Yield the other words in each wildcard bucket
+        for let in xrange(len(word)):
+            for nbr in buckets[word[:let] + '_' + word[let+1:]]:
+                if nbr != word:
+                    yield nbr
+
+    def to_graph(self):
+        '''
+        Materialize the bucket cliques as an explicit Graph object
+        '''
+
+        # Init variables
+        word_graph = Graph()
+
+        # Add vertices and edges for words in the same bucket
+        for bucket_words in self.buckets.itervalues():
+            for word1 in bucket_words:
+                for word2 in bucket_words:
+                    if word1 != word2:
+                        word_graph.add_edge(word1, word2)
+
+        # Return the graph
+        return word_graph
+
+    def __contains__(self, word):
+        '''
+        Enable in operator to check graph
+        '''
+        return word in self.words
+
+    def __iter__(self):
+        '''
+        Enable as iterator to return every word in graph
+        '''
+        return iter(self.words)
+
+    def __len__(self):
+        '''
+        Return the number of words in the graph
+        '''
+        return self.num_vertices
+
+
+def build_wordladder_graph(text_filepath, implicit=False):
     '''
     This function builds a word-ladder graph where each word is a
     vertex in the graph and words that differ by exactly one letter
@@ -189,77 +638,415 @@ def build_wordladder_graph(text_filepath):
     ----------
     text_filepath : string
         filepath to a text document with a word on each line
+    implicit : boolean (optional); default=False
+        if True, return a WordLadderGraph which generates neighbors
+        lazily from the bucket index instead of adding every edge;
+        this avoids the quadratic cost per bucket for large word lists
 
     Returns
     -------
-    word_graph : Graph object
-        a Graph object containing the vertices and connections for
+    word_graph : Graph or WordLadderGraph object
+        a graph object containing the vertices and connections for
         the word ladder
     '''
 
+    # Index the words into wildcard buckets
+    word_graph = WordLadderGraph.from_file(text_filepath)
+
+    # Return the graph
+    if implicit:
+        return word_graph
+    else:
+        return word_graph.to_graph()
+
+
+class BFSResult(object):
+    '''
+    Result of a breadth-first search; holds the distance and predecessor
+    state of a single search so the graph itself is never modified
+    '''
+
+    def __init__(self, graph, start_keys, dist, pred, target_key=None,
+                 found=False):
+        '''
+        Init the BFSResult object
+
+        Parameters
+        ----------
+        graph : Graph or CompactGraph object
+            the graph that was searched
+        start_keys : list
+            the keys of the vertices the search started from
+        dist : dictionary or array.array
+            {key : distance} for keyed graphs; for a CompactGraph, an
+            array of distances by vertex id, -1 where unreached
+        pred : dictionary or array.array
+            {key : predecessor key} for keyed graphs (None for start
+            vertices); for a CompactGraph, an array of predecessor ids
+            by vertex id, -1 for start and unreached vertices
+        target_key : object (optional); default=None
+            the key the search was stopped at, if any
+        found : boolean (optional); default=False
+            flag indicating whether target_key was reached
+        '''
+
+        # Init instance attributes
+        self.graph = graph
+        self.start_keys = start_keys
+        self.dist = dist
+        self.pred = pred
+        self.target_key = target_key
+        self.found = found
+        self._compact = isinstance(graph, CompactGraph)
+
+    def distance(self, key):
+        '''
+        Get the number of edges from the nearest start vertex to key;
+        None if key was not reached
+        '''
+        if self._compact:
+            if key not in self.graph:
+                return None
+            dist = self.dist[self.graph.index(key)]
+            return dist if dist >= 0 else None
+        return self.dist.get(key)
+
+    def predecessor(self, key):
+        '''
+        Get the key of the vertex key was discovered from; None for
+        start vertices and unreached vertices
+        '''
+        if self._compact:
+            if key not in self.graph:
+                return None
+            pred = self.pred[self.graph.index(key)]
+            return self.graph.key(pred) if pred >= 0 else None
+        return self.pred.get(key)
+
+    def path_to(self, key):
+        '''
+        Reconstruct the shortest path from a start vertex to key
+
+        Parameters
+        ----------
+        key : object
+            key of the vertex to build the path to
+
+        Returns
+        -------
+        path : list
+            list of vertex keys, starting at a start vertex and ending
+            at key
+        '''
+
+        # Check the vertex was reached
+        if key not in self:
+            raise KeyError('Vertex with key: %s was not reached!' % str(key))
+
+        # Walk the predecessors back to the start
+        if self._compact:
+            graph = self.graph
+            pred = self.pred
+            idx = graph.index(key)
+            path = []
+            while idx >= 0:
+                path.append(graph.key(idx))
+                idx = pred[idx]
+        else:
+            pred = self.pred
+            path = []
+            while key is not None:
+                path.append(key)
+                key = pred[key]
+        path.reverse()
+
+        # Return the path
+        return path
+
+    def reached(self):
+        '''
+        Return a list of the keys of every vertex reached
+        '''
+        if self._compact:
+            return [self.graph.key(idx) for idx, dist in enumerate(self.dist)
+                    if dist >= 0]
+        return self.dist.keys()
+
+    def __contains__(self, key):
+        '''
+        Enable in operator to check if a vertex was reached
+        '''
+        return self.distance(key) is not None
+
+
+def _compact_bfs(graph, start_keys, target_key, max_depth):
+    '''
+    BFS over a CompactGraph using preallocated arrays for the queue and
+    the per-call distance and predecessor state
+    '''
+
+    # Import packages
+    from array import array
+
     # Init variables
-    word_buckets = {}
-    word_graph = Graph()
-
-    # With the file open, create dictionary
-    with open(text_filepath, 'r') as wfile:
-        # For each word in the text file
-        for word in wfile:
-            word = word.rstrip('\n')
-            for let in range(len(word)):
-                bucket = word[:let] + '_' + word[let+1:]
-                if word_buckets.has_key(bucket):
-                    word_buckets[bucket].append(word)
-                else:
-                    word_buckets[bucket] = [word]
+    offsets = graph.offsets
+    neighbors = graph.neighbors
+    dist = array('l', [-1]) * graph.num_vertices
+    pred = array('i', [-1]) * graph.num_vertices
+    queue = array('i', [0]) * graph.num_vertices
+    target = -1 if target_key is None else graph.index(target_key)
+    tail = 0
+    for key in start_keys:
+        idx = graph.index(key)
+        if dist[idx] < 0:
+            dist[idx] = 0
+            queue[tail] = idx
+            tail += 1
+    found = target >= 0 and dist[target] == 0
+    head = 0
 
-    # Add vertices and edges for words in the same bucket
-    for bucket in word_buckets.keys():
-        for word1 in word_buckets[bucket]:
-            for word2 in word_buckets[bucket]:
-                if word1 != word2:
-                    word_graph.add_edge(word1, word2)
+    # Every vertex is enqueued at most once, so head/tail never wrap
+    while head < tail and not found:
+        idx = queue[head]
+        head += 1
+        nbr_dist = dist[idx] + 1
+        # Queue is in distance order, nothing past here is in range
+        if max_depth is not None and nbr_dist > max_depth:
+            break
+        for pos in xrange(offsets[idx], offsets[idx+1]):
+            nbr = neighbors[pos]
+            if dist[nbr] < 0:
+                dist[nbr] = nbr_dist
+                pred[nbr] = idx
+                if nbr == target:
+                    found = True
+                    break
+                queue[tail] = nbr
+                tail += 1
 
-    # Return the graph
-    return word_graph
+    # Return the search result
+    return BFSResult(graph, start_keys, dist, pred, target_key, found)
+
+
+def bfs(graph, start_keys, target_key=None, max_depth=None):
+    '''
+    Breadth-first search in O(V+E) time that keeps all of its state in
+    the returned result, so searches can run concurrently and no
+    clear_visited call is needed
+
+    Parameters
+    ----------
+    graph : Graph or CompactGraph object
+        the graph to search; any object with __contains__ and a
+        get_connections(key) method returning neighbor keys works
+    start_keys : list
+        keys of the vertices to start searching from; every start
+        vertex is at distance 0
+    target_key : object (optional); default=None
+        if specified, the search stops as soon as this vertex is reached
+    max_depth : integer (optional); default=None
+        if specified, vertices further than max_depth edges from the
+        start vertices are not searched
+
+    Returns
+    -------
+    result : BFSResult object
+        the distances and predecessors of every vertex reached
+    '''
+
+    # Import packages
+    import collections
+
+    # Check inputs
+    for key in start_keys:
+        if key not in graph:
+            raise KeyError('Vertex with key: %s not in graph!' % str(key))
+    if target_key is not None and target_key not in graph:
+        raise KeyError('Vertex with key: %s not in graph!' % str(target_key))
+
+    # Compact graphs run over flat arrays
+    if isinstance(graph, CompactGraph):
+        return _compact_bfs(graph, start_keys, target_key, max_depth)
+
+    # Init variables
+    get_connections = graph.get_connections
+    dist = {}
+    pred = {}
+    vert_queue = collections.deque()
+    for key in start_keys:
+        if key not in dist:
+            dist[key] = 0
+            pred[key] = None
+            vert_queue.append(key)
+    found = target_key in dist
+
+    # While the queue is not empty and the target is not found
+    while vert_queue and not found:
+        # Pop oldest item off queue
+        curr_key = vert_queue.popleft()
+        nbr_dist = dist[curr_key] + 1
+        # Queue is in distance order, nothing past here is in range
+        if max_depth is not None and nbr_dist > max_depth:
+            break
+        # Discover each of its unseen neighbors
+        for nbr_key in get_connections(curr_key):
+            if nbr_key not in dist:
+                dist[nbr_key] = nbr_dist
+                pred[nbr_key] = curr_key
+                if nbr_key == target_key:
+                    found = True
+                    break
+                vert_queue.append(nbr_key)
+
+    # Return the search result
+    return BFSResult(graph, start_keys, dist, pred, target_key, found)
 
 
 def breadth_first_search(graph, start_vert):
     '''
-    Function to perform a BFS search on a graph given a starting vertex
+    Function to perform a BFS search on a graph given a starting vertex;
+    the dist, pred and color of every vertex reached are also written
+    to the Vertex objects so traverse can be used on them. For a
+    CompactGraph, start_vert is the key of the starting vertex
+
+    Returns
+    -------
+    result : BFSResult object
+        the distances and predecessors of every vertex reached
+    '''
+
+    # Compact graphs have no Vertex objects to update
+    if isinstance(graph, CompactGraph):
+        return bfs(graph, [start_vert])
+
+    # Search from the start vertex
+    result = bfs(graph, [start_vert.key])
+
+    # Copy the search state onto the vertices
+    vert_dict = graph.vert_dict
+    for key, dist in result.dist.iteritems():
+        vertex = vert_dict[key]
+        pred_key = result.pred[key]
+        vertex.dist = dist
+        vertex.pred = vert_dict[pred_key] if pred_key is not None else None
+        vertex.color = 'black'
+
+    # Return the search result
+    return result
+
+
+# Graph and output buffer shared with bfs_distance_matrix workers; set
+# before the pool forks so the workers inherit them without pickling
+_SHARED_BFS_STATE = {}
+
+
+def _bfs_matrix_rows(row_range):
+    '''
+    Worker function filling rows [row_start, row_end) of the shared
+    distance matrix with the BFS distances from those rows' sources
     '''
 
     # Import packages
-    from pytools.stacks_queues import queues
+    import numpy as np
 
     # Init variables
-    start_vert.dist = 0
-    start_vert.pred = None
+    graph = _SHARED_BFS_STATE['graph']
+    start_keys = _SHARED_BFS_STATE['start_keys']
+    dist_matrix = np.frombuffer(_SHARED_BFS_STATE['buffer'], dtype=np.int32)
+    dist_matrix = dist_matrix.reshape(len(start_keys), graph.num_vertices)
 
-    # Add starting vertex to Queue
-    vert_queue = queues.ListQueue()
-    vert_queue.enqueue(start_vert)
+    # Search from each source and write its distances in place
+    row_start, row_end = row_range
+    for row in xrange(row_start, row_end):
+        result = _compact_bfs(graph, [start_keys[row]], None, None)
+        dist_matrix[row] = np.frombuffer(result.dist, dtype=np.int_)
 
-    # While the queue is not empty
-    while vert_queue.size() > 0:
-        # Pop oldest item off queue
-        curr_vert = vert_queue.dequeue()
-        # Iterate through each of its neighbors
-        for nbr_vert in curr_vert.get_connections():
-            # If it hasnt been searced (is white)...search
-            if nbr_vert.color == 'white':
-                nbr_vert.color = 'gray'
-                nbr_vert.dist = curr_vert.dist + 1
-                nbr_vert.pred = curr_vert
-                vert_queue.enqueue(nbr_vert)
-        # Once done searching through neighbors, curr_vert is searched
-        curr_vert.color = 'black'
+
+def bfs_distance_matrix(graph, start_keys, processes=None):
+    '''
+    Run a BFS from every start key in parallel and gather the distances
+    into a matrix; the graph is frozen into a CompactGraph snapshot that
+    worker processes inherit when they are forked, and they write their
+    rows straight into a shared-memory buffer
+
+    Parameters
+    ----------
+    graph : Graph or CompactGraph object
+        the graph to search; a Graph is converted with
+        CompactGraph.from_graph first
+    start_keys : list
+        keys of the vertices to search from, one matrix row each
+    processes : integer (optional); default=None
+        number of worker processes; if None, multiprocessing.cpu_count()
+        is used, and if 1 the searches run in this process. Workers
+        rely on fork, so platforms without it should use 1
+
+    Returns
+    -------
+    dist_matrix : numpy.ndarray
+        int32 array of shape (len(start_keys), num_vertices) where
+        dist_matrix[i, j] is the number of edges from start_keys[i] to
+        the vertex with key keys[j], or -1 if it is not reachable
+    keys : list
+        the vertex key of every column of dist_matrix
+    '''
+
+    # Import packages
+    import multiprocessing
+    import numpy as np
+    from multiprocessing import sharedctypes
+
+    # Freeze the graph into flat arrays
+    if not isinstance(graph, CompactGraph):
+        graph = CompactGraph.from_graph(graph, weighted=False)
+    for key in start_keys:
+        if key not in graph:
+            raise KeyError('Vertex with key: %s not in graph!' % str(key))
+    if processes is None:
+        processes = multiprocessing.cpu_count()
+    keys = [graph.key(idx) for idx in xrange(graph.num_vertices)]
+    if len(start_keys) == 0:
+        return np.zeros((0, graph.num_vertices), dtype=np.int32), keys
+
+    # Init shared state
+    num_rows = len(start_keys)
+    out_buffer = sharedctypes.RawArray('i', num_rows * graph.num_vertices)
+    _SHARED_BFS_STATE.update(graph=graph, start_keys=list(start_keys),
+                             buffer=out_buffer)
+
+    # Split the rows into a few chunks per worker to balance load
+    num_chunks = min(num_rows, max(1, processes*4))
+    bounds = [num_rows*idx//num_chunks for idx in xrange(num_chunks+1)]
+    row_ranges = zip(bounds[:-1], bounds[1:])
+
+    # Run the searches, forking workers after the state is set
+    try:
+        if processes == 1:
+            for row_range in row_ranges:
+                _bfs_matrix_rows(row_range)
+        else:
+            pool = multiprocessing.Pool(processes)
+            try:
+                pool.map(_bfs_matrix_rows, row_ranges)
+            finally:
+                pool.close()
+                pool.join()
+    finally:
+        _SHARED_BFS_STATE.clear()
+
+    # Wrap the shared buffer without copying
+    dist_matrix = np.frombuffer(out_buffer, dtype=np.int32)
+    dist_matrix = dist_matrix.reshape(num_rows, graph.num_vertices)
+
+    # Return the distances and column keys
+    return dist_matrix, keys
 
 
 def traverse(start_vert):
     '''
     Traverse through a graph that has been searched through by
-    specifying a start vertex
+    specifying a start vertex; BFSResult.path_to returns the same path
+    as a list instead of printing it
     '''
 
     # Init variables
@@ -272,6 +1059,536 @@ def traverse(start_vert):
     print curr_vert.key
 
 
+def _join_paths(meet_key, pred_fwd, pred_bwd):
+    '''
+    Join the forward predecessors up to meet_key with the backward
+    predecessors after it into a single start -> end path
+    '''
+
+    # Walk back to the start
+    path = []
+    key = meet_key
+    while key is not None:
+        path.append(key)
+        key = pred_fwd[key]
+    path.reverse()
+
+    # Walk forward to the end
+    key = pred_bwd[meet_key]
+    while key is not None:
+        path.append(key)
+        key = pred_bwd[key]
+
+    # Return the joined path
+    return path
+
+
+def bidirectional_bfs(graph, start_key, end_key, reverse_connections=None):
+    '''
+    Find a shortest (fewest edges) path between two vertices by growing
+    a BFS frontier from each end, always expanding the smaller one a
+    full level at a time, until they meet; on graphs with a branching
+    factor b this touches about 2*b^(d/2) vertices instead of b^d
+
+    Parameters
+    ----------
+    graph : Graph or CompactGraph object
+        the graph to search; any object with __contains__ and a
+        get_connections(key) method returning neighbor keys works
+    start_key : object
+        key of the vertex to start the path at
+    end_key : object
+        key of the vertex to end the path at
+    reverse_connections : function (optional); default=None
+        function mapping a key to the keys of the vertices with an edge
+        into it; if None, graph.get_connections is used, which is only
+        correct for undirected graphs such as word ladders
+
+    Returns
+    -------
+    path : list or None
+        list of vertex keys from start_key to end_key, or None if
+        end_key cannot be reached
+    '''
+
+    # Check inputs
+    for key in (start_key, end_key):
+        if key not in graph:
+            raise KeyError('Vertex with key: %s not in graph!' % str(key))
+    if start_key == end_key:
+        return [start_key]
+
+    # Init variables
+    if reverse_connections is None:
+        reverse_connections = graph.get_connections
+    pred_fwd = {start_key: None}
+    pred_bwd = {end_key: None}
+    dist_fwd = {start_key: 0}
+    dist_bwd = {end_key: 0}
+    frontier_fwd = [start_key]
+    frontier_bwd = [end_key]
+
+    # Expand the smaller frontier one level at a time
+    while frontier_fwd and frontier_bwd:
+        if len(frontier_fwd) <= len(frontier_bwd):
+            frontier, get_connections = frontier_fwd, graph.get_connections
+            pred, dist, other_dist = pred_fwd, dist_fwd, dist_bwd
+            forward = True
+        else:
+            frontier, get_connections = frontier_bwd, reverse_connections
+            pred, dist, other_dist = pred_bwd, dist_bwd, dist_fwd
+            forward = False
+
+        # Search the whole level, keeping the shortest meeting point
+        next_frontier = []
+        best_len = None
+        best_meet = None
+        for key in frontier:
+            nbr_dist = dist[key] + 1
+            for nbr_key in get_connections(key):
+                if nbr_key in dist:
+                    continue
+                dist[nbr_key] = nbr_dist
+                pred[nbr_key] = key
+                if nbr_key in other_dist:
+                    path_len = nbr_dist + other_dist[nbr_key]
+                    if best_len is None or path_len < best_len:
+                        best_len = path_len
+                        best_meet = nbr_key
+                else:
+                    next_frontier.append(nbr_key)
+
+        # Frontiers met, stitch the two halves together
+        if best_meet is not None:
+            return _join_paths(best_meet, pred_fwd, pred_bwd)
+
+        # Swap in the next level
+        if forward:
+            frontier_fwd = next_frontier
+        else:
+            frontier_bwd = next_frontier
+
+    # One side ran out of vertices, so there is no path
+    return None
+
+
+def astar_search(graph, start_key, end_key, heuristic):
+    '''
+    Find a shortest (fewest edges) path between two vertices with the
+    A* algorithm, expanding vertices in order of edges-so-far plus the
+    heuristic estimate of edges-remaining; a vertex reached again by a
+    shorter path is expanded again, which only happens when the
+    heuristic is not consistent (monotone)
+
+    Parameters
+    ----------
+    graph : Graph or CompactGraph object
+        the graph to search; any object with __contains__ and a
+        get_connections(key) method returning neighbor keys works
+    start_key : object
+        key of the vertex to start the path at
+    end_key : object
+        key of the vertex to end the path at
+    heuristic : function
+        function of (key, end_key) returning a lower bound on the number
+        of edges between them, e.g. hamming_distance for word ladders;
+        it must never overestimate or the path may not be shortest, and
+        is best consistent too, so that no vertex is expanded twice
+
+    Returns
+    -------
+    path : list or None
+        list of vertex keys from start_key to end_key, or None if
+        end_key cannot be reached
+    '''
+
+    # Import packages
+    import heapq
+
+    # Check inputs
+    for key in (start_key, end_key):
+        if key not in graph:
+            raise KeyError('Vertex with key: %s not in graph!' % str(key))
+
+    # Init variables; the counter breaks ties without comparing keys,
+    # and every heap entry carries the distance it was pushed with
+    get_connections = graph.get_connections
+    dist = {start_key: 0}
+    pred = {start_key: None}
+    counter = 0
+    open_heap = [(heuristic(start_key, end_key), counter, 0, start_key)]
+
+    # Pop the most promising vertex until the end is reached
+    while open_heap:
+        est, _, key_dist, key = heapq.heappop(open_heap)
+        # Stale heap entry for a vertex since reached by a shorter path
+        if key_dist > dist[key]:
+            continue
+        if key == end_key:
+            path = []
+            while key is not None:
+                path.append(key)
+                key = pred[key]
+            path.reverse()
+            return path
+        # Any neighbor reached by a shorter path is pushed again, even
+        # if it was expanded already
+        nbr_dist = key_dist + 1
+        for nbr_key in get_connections(key):
+            if nbr_key not in dist or nbr_dist < dist[nbr_key]:
+                dist[nbr_key] = nbr_dist
+                pred[nbr_key] = key
+                counter += 1
+                nbr_est = nbr_dist + heuristic(nbr_key, end_key)
+                heapq.heappush(open_heap,
+                               (nbr_est, counter, nbr_dist, nbr_key))
+
+    # Exhausted the reachable vertices, so there is no path
+    return None
+
+
+def hamming_distance(word1, word2):
+    '''
+    Count the positions at which two equal-length words differ; this is
+    the minimum number of steps between them in a word ladder
+    '''
+    return sum(1 for let1, let2 in zip(word1, word2) if let1 != let2)
+
+
+def find_word_ladder(graph, start_word, end_word, method='bidirectional'):
+    '''
+    Find a shortest word ladder between two words of a word-ladder graph
+
+    Parameters
+    ----------
+    graph : Graph or WordLadderGraph object
+        word-ladder graph, e.g. from build_wordladder_graph
+    start_word : string
+        word to start the ladder at
+    end_word : string
+        word to end the ladder at
+    method : string (optional); default='bidirectional'
+        search to use: 'bidirectional' for bidirectional_bfs, 'astar'
+        for astar_search with hamming_distance, or 'bfs' for a
+        single-ended bfs stopping at end_word
+
+    Returns
+    -------
+    ladder : list or None
+        list of words from start_word to end_word, or None if no ladder
+        exists
+    '''
+
+    # Run the chosen search
+    if method == 'bidirectional':
+        return bidirectional_bfs(graph, start_word, end_word)
+    elif method == 'astar':
+        return astar_search(graph, start_word, end_word, hamming_distance)
+    elif method == 'bfs':
+        result = bfs(graph, [start_word], target_key=end_word)
+        return result.path_to(end_word) if result.found else None
+    else:
+        err_msg = 'Method: %s must be one of bidirectional, astar or bfs!' \
+                  % str(method)
+        raise ValueError(err_msg)
+
+
+class DFSResult(object):
+    '''
+    Result of a depth-first search; holds the discovery/finish times
+    and predecessor tree of a single search
+    '''
+
+    def __init__(self, graph, disc, fin, pred):
+        '''
+        Init the DFSResult object
+
+        Parameters
+        ----------
+        graph : Graph or CompactGraph object
+            the graph that was searched
+        disc : dictionary or array.array
+            {key : discovery time} for keyed graphs; for a CompactGraph,
+            an array of discovery times by vertex id, 0 where unreached
+        fin : dictionary or array.array
+            {key : finish time}, laid out the same as disc
+        pred : dictionary or array.array
+            {key : predecessor key} for keyed graphs (None for tree
+            roots); for a CompactGraph, an array of predecessor ids by
+            vertex id, -1 for roots and unreached vertices
+        '''
+
+        # Init instance attributes
+        self.graph = graph
+        self.disc = disc
+        self.fin = fin
+        self.pred = pred
+        self._compact = isinstance(graph, CompactGraph)
+
+    def discovery(self, key):
+        '''
+        Get the time the vertex was discovered; None if never reached
+        '''
+        if self._compact:
+            disc = self.disc[self.graph.index(key)] if key in self.graph else 0
+            return disc if disc else None
+        return self.disc.get(key)
+
+    def finish(self, key):
+        '''
+        Get the time the vertex was finished; None if never reached
+        '''
+        if self._compact:
+            fin = self.fin[self.graph.index(key)] if key in self.graph else 0
+            return fin if fin else None
+        return self.fin.get(key)
+
+    def predecessor(self, key):
+        '''
+        Get the key of the vertex key was discovered from; None for
+        tree roots and unreached vertices
+        '''
+        if self._compact:
+            if key not in self.graph:
+                return None
+            pred = self.pred[self.graph.index(key)]
+            return self.graph.key(pred) if pred >= 0 else None
+        return self.pred.get(key)
+
+    def finish_order(self):
+        '''
+        Return a list of the keys of every vertex reached, in increasing
+        order of finish time; the times are unique and at most 2*V, so
+        they are bucketed in linear time instead of sorted
+        '''
+
+        # Init variables
+        if self._compact:
+            items = ((self.graph.key(idx), fin)
+                     for idx, fin in enumerate(self.fin) if fin)
+        else:
+            items = self.fin.iteritems()
+        buckets = [None] * (2*self.graph.num_vertices + 1)
+
+        # Place every key at its finish time
+        for key, fin in items:
+            buckets[fin] = key
+
+        # Return the keys in finish order
+        return [key for key in buckets if key is not None]
+
+    def __contains__(self, key):
+        '''
+        Enable in operator to check if a vertex was reached
+        '''
+        return self.discovery(key) is not None
+
+
+def _compact_dfs_events(graph, start_ids):
+    '''
+    Generator of (vertex id, event) pairs of a DFS over a CompactGraph
+    '''
+
+    # Import packages
+    from array import array
+
+    # Init variables
+    offsets = graph.offsets
+    neighbors = graph.neighbors
+    seen = bytearray(graph.num_vertices)
+    cursor = array('l', offsets[:-1])
+
+    # Start a new tree at every start vertex not yet discovered
+    for root in start_ids:
+        if seen[root]:
+            continue
+        seen[root] = 1
+        yield root, 'discover'
+        stack = [root]
+        while stack:
+            idx = stack[-1]
+            pos = cursor[idx]
+            end = offsets[idx+1]
+            # Advance to the next undiscovered neighbor
+            while pos < end and seen[neighbors[pos]]:
+                pos += 1
+            cursor[idx] = pos + 1
+            if pos < end:
+                nbr = neighbors[pos]
+                seen[nbr] = 1
+                yield nbr, 'discover'
+                stack.append(nbr)
+            # All neighbors visited, finish vertex
+            else:
+                stack.pop()
+                yield idx, 'finish'
+
+
+def _compact_dfs(graph, start_ids):
+    '''
+    DFS over a CompactGraph with an explicit stack and flat arrays for
+    the per-call timestamps and predecessors
+    '''
+
+    # Import packages
+    from array import array
+
+    # Init variables
+    num_vertices = graph.num_vertices
+    offsets = graph.offsets
+    neighbors = graph.neighbors
+    disc = array('l', [0]) * num_vertices
+    fin = array('l', [0]) * num_vertices
+    pred = array('i', [-1]) * num_vertices
+    cursor = array('l', offsets[:-1])
+    time = 0
+
+    # Start a new tree at every start vertex not yet discovered
+    for root in start_ids:
+        if disc[root]:
+            continue
+        time += 1
+        disc[root] = time
+        stack = [root]
+        while stack:
+            idx = stack[-1]
+            pos = cursor[idx]
+            end = offsets[idx+1]
+            # Advance to the next undiscovered neighbor
+            while pos < end and disc[neighbors[pos]]:
+                pos += 1
+            cursor[idx] = pos + 1
+            if pos < end:
+                nbr = neighbors[pos]
+                pred[nbr] = idx
+                time += 1
+                disc[nbr] = time
+                stack.append(nbr)
+            # All neighbors visited, finish vertex
+            else:
+                stack.pop()
+                time += 1
+                fin[idx] = time
+
+    # Return the search result
+    return DFSResult(graph, disc, fin, pred)
+
+
+def dfs_events(graph, start_keys=None):
+    '''
+    Generator performing an iterative depth-first search, yielding a
+    (key, 'discover') pair when a vertex is first reached and a
+    (key, 'finish') pair once all of its descendants are done; the
+    caller can stop the search early by breaking out of the loop
+
+    Parameters
+    ----------
+    graph : Graph or CompactGraph object
+        the graph to search; any object with __contains__,
+        get_vertices() and a get_connections(key) method returning
+        neighbor keys works
+    start_keys : list (optional); default=None
+        keys of the vertices to start new search trees from, in order;
+        if None, every vertex in graph.get_vertices() order
+
+    Yields
+    ------
+    key, event : tuple
+        the vertex key and either 'discover' or 'finish'
+    '''
+
+    # Init variables
+    if start_keys is None:
+        start_keys = graph.get_vertices()
+    else:
+        for key in start_keys:
+            if key not in graph:
+                raise KeyError('Vertex with key: %s not in graph!' % str(key))
+
+    # Compact graphs run over flat arrays
+    if isinstance(graph, CompactGraph):
+        start_ids = [graph.index(key) for key in start_keys]
+        for idx, event in _compact_dfs_events(graph, start_ids):
+            yield graph.key(idx), event
+        return
+
+    # Init variables
+    get_connections = graph.get_connections
+    seen = set()
+
+    # Start a new tree at every start vertex not yet discovered
+    for root in start_keys:
+        if root in seen:
+            continue
+        seen.add(root)
+        yield root, 'discover'
+        # Stack of (key, iterator over remaining neighbors)
+        stack = [(root, iter(get_connections(root)))]
+        while stack:
+            key, nbrs = stack[-1]
+            # Descend into the next undiscovered neighbor
+            for nbr in nbrs:
+                if nbr not in seen:
+                    seen.add(nbr)
+                    yield nbr, 'discover'
+                    stack.append((nbr, iter(get_connections(nbr))))
+                    break
+            # All neighbors visited, finish vertex
+            else:
+                stack.pop()
+                yield key, 'finish'
+
+
+def dfs(graph, start_keys=None):
+    '''
+    Iterative depth-first search recording the discovery and finish
+    times (a single clock ticking once per event, starting at 1) and
+    the predecessor tree of every vertex reached
+
+    Parameters
+    ----------
+    graph : Graph or CompactGraph object
+        the graph to search
+    start_keys : list (optional); default=None
+        keys of the vertices to start new search trees from, in order;
+        if None, every vertex in graph.get_vertices() order
+
+    Returns
+    -------
+    result : DFSResult object
+        the timestamps and predecessors of every vertex reached
+    '''
+
+    # Compact graphs run over flat arrays
+    if isinstance(graph, CompactGraph):
+        if start_keys is None:
+            start_ids = xrange(graph.num_vertices)
+        else:
+            start_ids = [graph.index(key) for key in start_keys]
+        return _compact_dfs(graph, start_ids)
+
+    # Init variables
+    disc = {}
+    fin = {}
+    pred = {}
+    open_keys = []
+    time = 0
+
+    # The open (discovered, unfinished) vertices form the current path
+    for key, event in dfs_events(graph, start_keys):
+        time += 1
+        if event == 'discover':
+            disc[key] = time
+            pred[key] = open_keys[-1] if open_keys else None
+            open_keys.append(key)
+        else:
+            fin[key] = time
+            open_keys.pop()
+
+    # Return the search result
+    return DFSResult(graph, disc, fin, pred)
+
+
 class DFSGraph(Graph):
     '''
     A depth-first search (DFS) graph
@@ -284,33 +1601,29 @@ class DFSGraph(Graph):
         super(DFSGraph, self).__init__()
         self.time = 0
 
-    def _dfs_visit(self, start_vertex):
+    def depth_first_search(self):
         '''
-        Recursive function for visiting a vertex
+        Perform a depth-first search with an explicit stack; the disc,
+        fin, pred and color of every vertex are updated in place
+
+        Returns
+        -------
+        result : DFSResult object
+            the discovery/finish times and predecessors of every vertex
         '''
 
-        # Mark vertex as pending, and incr time
-        start_vertex.color = 'gray'
-        self.time += 1
-        start_vertex.disc = self.time
-        for other_vertex in start_vertex.get_connections():
-            if other_vertex.color == 'white':
-                other_vertex.pred = start_vertex
-                # Recursively visit first other neighbor
-                self._dfs_visit(other_vertex)
-        start_vertex.color = 'black'
-        self.time += 1
-        start_vertex.fin = self.time
+        # Search every vertex
+        result = dfs(self)
 
-    def depth_first_search(self):
-        '''
-        Perform a depth-first search
-        '''
+        # Copy the search state onto the vertices
+        vert_dict = self.vert_dict
+        for key, vertex in vert_dict.iteritems():
+            pred_key = result.pred[key]
+            vertex.disc = result.disc[key]
+            vertex.fin = result.fin[key]
+            vertex.pred = vert_dict[pred_key] if pred_key is not None else None
+            vertex.color = 'black'
+        self.time = 2*len(vert_dict)
 
-        # Init all to white - unseen
-        for each_vertex in self:
-            each_vertex.color = 'white'
-            each_vertex.pred = None
-        for each_vertex in self:
-            if each_vertex.color == 'white':
-                self._dfs_visit(each_vertex)
+        # Return the search result
+        return result
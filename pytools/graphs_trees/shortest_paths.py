@@ -0,0 +1,178 @@
+# pytools/graphs_trees/shortest_paths.py
+#
+# Author: Daniel Clark, 2016
+
+'''
+This module contains functions to find weighted shortest paths through
+graphs data structures
+'''
+
+# Import packages
+from pytools.graphs_trees import graphs
+
+
+class ShortestPathResult(graphs.BFSResult):
+    '''
+    Result of a weighted shortest-path search; distance() returns the
+    total edge weight of the shortest path instead of an edge count
+    '''
+    pass
+
+
+def _compact_dijkstra(graph, start_key, target_key):
+    '''
+    Dijkstra over a CompactGraph with flat arrays for the per-call
+    distance and predecessor state
+    '''
+
+    # Import packages
+    from array import array
+    from pytools.graphs_trees import trees
+
+    # Init variables
+    offsets = graph.offsets
+    neighbors = graph.neighbors
+    weights = graph.weights
+    dist = array('d', [-1.0]) * graph.num_vertices
+    pred = array('i', [-1]) * graph.num_vertices
+    done = bytearray(graph.num_vertices)
+    target = -1 if target_key is None else graph.index(target_key)
+    start_idx = graph.index(start_key)
+    dist[start_idx] = 0.0
+    vert_heap = trees.IndexedBinaryHeap()
+    vert_heap.insert(start_idx, 0.0)
+    found = False
+
+    # Settle the closest unsettled vertex each iteration
+    while vert_heap.current_size > 0:
+        idx, idx_dist = vert_heap.dequeue_min()
+        done[idx] = 1
+        if idx == target:
+            found = True
+            break
+        for pos in xrange(offsets[idx], offsets[idx+1]):
+            nbr = neighbors[pos]
+            wght = 0.0 if weights is None else weights[pos]
+            if wght < 0:
+                raise ValueError('Dijkstra requires non-negative weights!')
+            if done[nbr]:
+                continue
+            nbr_dist = idx_dist + wght
+            if dist[nbr] < 0:
+                dist[nbr] = nbr_dist
+                pred[nbr] = idx
+                vert_heap.insert(nbr, nbr_dist)
+            elif nbr_dist < dist[nbr]:
+                dist[nbr] = nbr_dist
+                pred[nbr] = idx
+                vert_heap.decrease_key(nbr, nbr_dist)
+
+    # Return the search result
+    return ShortestPathResult(graph, [start_key], dist, pred, target_key,
+                              found)
+
+
+def dijkstra(graph, start_key, target_key=None):
+    '''
+    Find the minimum total weight paths from a start vertex with
+    Dijkstra's algorithm, using an indexed heap with decrease-key so
+    every vertex is in the heap at most once; O((V+E)logV) time
+
+    Parameters
+    ----------
+    graph : Graph or CompactGraph object
+        the graph to search; any object with __contains__ and a
+        get_weighted_connections(key) method returning (key, weight)
+        pairs works. Edge weights must be non-negative
+    start_key : object
+        key of the vertex to start the search from
+    target_key : object (optional); default=None
+        if specified, the search stops as soon as the shortest path to
+        this vertex is known; otherwise paths to every reachable vertex
+        are found
+
+    Returns
+    -------
+    result : ShortestPathResult object
+        the distances and predecessors of every vertex reached; only
+        the target's distance is final when stopping early
+    '''
+
+    # Import packages
+    from pytools.graphs_trees import trees
+
+    # Check inputs
+    for key in (start_key, target_key):
+        if key is not None and key not in graph:
+            raise KeyError('Vertex with key: %s not in graph!' % str(key))
+
+    # Compact graphs run over flat arrays
+    if isinstance(graph, graphs.CompactGraph):
+        return _compact_dijkstra(graph, start_key, target_key)
+
+    # Init variables
+    get_weighted_connections = graph.get_weighted_connections
+    dist = {start_key: 0}
+    pred = {start_key: None}
+    done = set()
+    vert_heap = trees.IndexedBinaryHeap()
+    vert_heap.insert(start_key, 0)
+    found = False
+
+    # Settle the closest unsettled vertex each iteration
+    while vert_heap.current_size > 0:
+        key, key_dist = vert_heap.dequeue_min()
+        done.add(key)
+        if key == target_key:
+            found = True
+            break
+        for nbr_key, wght in get_weighted_connections(key):
+            if wght < 0:
+                raise ValueError('Dijkstra requires non-negative weights!')
+            if nbr_key in done:
+                continue
+            nbr_dist = key_dist + wght
+            if nbr_key not in dist:
+                dist[nbr_key] = nbr_dist
+                pred[nbr_key] = key
+                vert_heap.insert(nbr_key, nbr_dist)
+            elif nbr_dist < dist[nbr_key]:
+                dist[nbr_key] = nbr_dist
+                pred[nbr_key] = key
+                vert_heap.decrease_key(nbr_key, nbr_dist)
+
+    # Return the search result
+    return ShortestPathResult(graph, [start_key], dist, pred, target_key,
+                              found)
+
+
+def shortest_path(graph, start_key, end_key):
+    '''
+    Find the minimum total weight path between two vertices, stopping
+    the search as soon as end_key is settled
+
+    Parameters
+    ----------
+    graph : Graph or CompactGraph object
+        the graph to search; edge weights must be non-negative
+    start_key : object
+        key of the vertex to start the path at
+    end_key : object
+        key of the vertex to end the path at
+
+    Returns
+    -------
+    path : list or None
+        list of vertex keys from start_key to end_key, or None if
+        end_key cannot be reached
+    weight : float or None
+        total weight of the path, or None if end_key cannot be reached
+    '''
+
+    # Search until the end vertex is settled
+    result = dijkstra(graph, start_key, target_key=end_key)
+
+    # Return path and total weight
+    if not result.found:
+        return None, None
+    return result.path_to(end_key), result.distance(end_key)
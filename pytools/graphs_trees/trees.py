@@ -204,11 +204,862 @@ class Trie(object):
             child.print_contents()
 
 
-class BinarySearchTree(object):
+class CompactTrie(object):
+    '''
+    Trie tree data structure stored as a flat node table instead of one
+    object per character: node ids index parallel arrays of the node
+    char, parent, first child, next sibling and leaf flag, and a single
+    dict maps (node id, char) to the child id. Insert and lookup are
+    iterative and O(len(string)) regardless of the number of children
+    '''
+
+    # Bits to shift a node id by to pack it with a char code as a key
+    _CHAR_BITS = 21
+
+    def __init__(self):
+        '''
+        Init CompactTrie structure with only the root node (id 0)
+        '''
+
+        # Import packages
+        from array import array
+
+        # Populate contents
+        self.edges = {}
+        self.chars = ['']
+        self.parent = array('i', [-1])
+        self.first_child = array('i', [-1])
+        self.next_sibling = array('i', [-1])
+        self.is_leaf = bytearray(1)
+        self.num_words = 0
+
+    @classmethod
+    def from_iterable(cls, strings):
+        '''
+        Build a CompactTrie from an iterable of strings in one pass; the
+        strings are sorted first so each one only has to add the nodes
+        past the prefix it shares with the previous string, and those
+        nodes are always new, so no child lookups are needed
+
+        Parameters
+        ----------
+        strings : iterable
+            the strings to insert; repeats are ignored
+
+        Returns
+        -------
+        trie : CompactTrie object
+            the trie containing every string
+        '''
+
+        # Init variables; the node table columns are bound locally since
+        # this loop appends every node of the trie
+        trie = cls()
+        edges = trie.edges
+        chars = trie.chars
+        parents = trie.parent
+        first_child = trie.first_child
+        next_sibling = trie.next_sibling
+        is_leaf = trie.is_leaf
+        char_bits = cls._CHAR_BITS
+        prev = None
+        path = [0]
+
+        # Add each sorted string, reusing the path of the previous one
+        for string in sorted(strings):
+            if string == prev:
+                continue
+            # Length of the prefix shared with the previous string
+            common = 0
+            if prev:
+                max_common = min(len(prev), len(string))
+                while common < max_common and \
+                        prev[common] == string[common]:
+                    common += 1
+                del path[common+1:]
+            parent = path[-1]
+            node = len(chars)
+            for char in string[common:]:
+                edges[(parent << char_bits) | ord(char)] = node
+                chars.append(char)
+                parents.append(parent)
+                first_child.append(-1)
+                next_sibling.append(first_child[parent])
+                first_child[parent] = node
+                is_leaf.append(0)
+                path.append(node)
+                parent = node
+                node += 1
+            is_leaf[parent] = 1
+            trie.num_words += 1
+            prev = string
+
+        # Return the trie
+        return trie
+
+    @classmethod
+    def from_file(cls, text_filepath):
+        '''
+        Build a CompactTrie from a text file with a word on each line
+        '''
+
+        # Read and bulk load the words
+        with open(text_filepath, 'r') as wfile:
+            return cls.from_iterable(line.rstrip('\n') for line in wfile
+                                     if line.rstrip('\n'))
+
+    def _add_node(self, parent, char):
+        '''
+        Append a new node for char as the first child of parent and
+        return its id
+        '''
+
+        # New node id is the next row of the table
+        node = len(self.chars)
+        self.edges[(parent << self._CHAR_BITS) | ord(char)] = node
+        self.chars.append(char)
+        self.parent.append(parent)
+        self.first_child.append(-1)
+        self.next_sibling.append(self.first_child[parent])
+        self.first_child[parent] = node
+        self.is_leaf.append(0)
+
+        # Return the new node
+        return node
+
+    def _find_node(self, string):
+        '''
+        Return the id of the node at the end of string, or -1 if string
+        is not a path in the trie
+        '''
+
+        # Init variables
+        edges = self.edges
+        char_bits = self._CHAR_BITS
+        node = 0
+
+        # Follow one edge per char
+        for char in string:
+            node = edges.get((node << char_bits) | ord(char), -1)
+            if node < 0:
+                break
+
+        # Return the end node
+        return node
+
+    def _node_string(self, node):
+        '''
+        Rebuild the string spelled by the path from the root to node
+        '''
+
+        # Walk the parents back to the root
+        chars = []
+        while node > 0:
+            chars.append(self.chars[node])
+            node = self.parent[node]
+        chars.reverse()
+
+        # Return the string
+        return ''.join(chars)
+
+    def insert(self, string):
+        '''
+        Insert string into CompactTrie
+        '''
+
+        # Init variables
+        edges = self.edges
+        char_bits = self._CHAR_BITS
+        node = 0
+
+        # Follow existing edges, adding nodes once they run out
+        for char in string:
+            child = edges.get((node << char_bits) | ord(char), -1)
+            if child < 0:
+                child = self._add_node(node, char)
+            node = child
+
+        # Mark the final char as a leaf node
+        if not self.is_leaf[node]:
+            self.is_leaf[node] = 1
+            self.num_words += 1
+
+    def retrieve(self, prefix):
+        '''
+        Retrieve shortest matching word entry based on a prefix;
+        prefix can be partial word or full word
+        '''
+
+        # Import packages
+        import collections
+
+        # Find the node at the end of the prefix
+        node = self._find_node(prefix)
+
+        # Breadth-first below it, so the first leaf is the shortest word
+        if node >= 0:
+            first_child = self.first_child
+            next_sibling = self.next_sibling
+            node_queue = collections.deque([node])
+            while node_queue:
+                node = node_queue.popleft()
+                if self.is_leaf[node]:
+                    return self._node_string(node)
+                child = first_child[node]
+                while child >= 0:
+                    node_queue.append(child)
+                    child = next_sibling[child]
+
+        # No word starts with prefix
+        raise KeyError('Prefix: "%s" not in Trie!' % prefix)
+
+    def num_nodes(self):
+        '''
+        Return the number of nodes in the trie, including the root
+        '''
+        return len(self.chars)
+
+    def __contains__(self, string):
+        '''
+        Enable the "in" operator to check for a whole word
+        '''
+        node = self._find_node(string)
+        return node >= 0 and bool(self.is_leaf[node])
+
+    def __len__(self):
+        '''
+        Return the number of words in the trie
+        '''
+        return self.num_words
+
+
+class AutocompleteTrie(CompactTrie):
+    '''
+    CompactTrie that stores a frequency for every word and caches, at
+    every node, the max_k most frequent words below it, so the best
+    completions of a prefix are read off the prefix node in
+    O(len(prefix) + k) time
+    '''
+
+    def __init__(self, max_k=10):
+        '''
+        Init AutocompleteTrie structure
+
+        Parameters
+        ----------
+        max_k : integer (optional); default=10
+            the most completions cached per node, and so the largest k
+            that complete() can answer
+        '''
+
+        # Test for valid input
+        if max_k < 1:
+            err_msg = 'Input max_k: %s must be at least 1!' % str(max_k)
+            raise ValueError(err_msg)
+
+        # Populate contents
+        super(AutocompleteTrie, self).__init__()
+        self.max_k = max_k
+        self.frequencies = {}
+        # Per node, (-frequency, word) entries, most frequent first
+        self.top = [[]]
+
+    @classmethod
+    def from_counts(cls, counts, max_k=10):
+        '''
+        Build an AutocompleteTrie from word frequencies in one pass; the
+        words are bulk loaded into the node table, then the cached
+        completions are merged from the leaves up to the root
+
+        Parameters
+        ----------
+        counts : dict or iterable
+            mapping of word to frequency, or (word, frequency) pairs;
+            frequencies of repeated words are added together
+        max_k : integer (optional); default=10
+            the most completions cached per node
+
+        Returns
+        -------
+        trie : AutocompleteTrie object
+            the trie containing every word
+        '''
+
+        # Import packages
+        import heapq
+
+        # Init variables
+        frequencies = {}
+        if isinstance(counts, dict):
+            counts = counts.iteritems()
+        for word, freq in counts:
+            frequencies[word] = frequencies.get(word, 0) + freq
+        trie = super(AutocompleteTrie, cls).from_iterable(frequencies)
+        trie.max_k = max_k
+        trie.frequencies = frequencies
+        top = [[] for _ in xrange(trie.num_nodes())]
+        for word, freq in frequencies.iteritems():
+            top[trie._find_node(word)].append((-freq, word))
+
+        # Children always have larger ids than their parents, so walking
+        # the ids backwards finishes every child before its parent
+        first_child = trie.first_child
+        next_sibling = trie.next_sibling
+        for node in xrange(len(top) - 1, -1, -1):
+            child = first_child[node]
+            if child < 0:
+                continue
+            entries = top[node]
+            while child >= 0:
+                entries.extend(top[child])
+                child = next_sibling[child]
+            top[node] = heapq.nsmallest(max_k, entries)
+        trie.top = top
+
+        # Return the trie
+        return trie
+
+    @classmethod
+    def from_iterable(cls, strings, max_k=10):
+        '''
+        Build an AutocompleteTrie from an iterable of strings, using the
+        number of times each string appears as its frequency
+        '''
+
+        # Import packages
+        import collections
+
+        # Count and bulk load
+        return cls.from_counts(collections.Counter(strings), max_k=max_k)
+
+    def _add_node(self, parent, char):
+        '''
+        Append a new node for char, with no cached completions yet
+        '''
+        self.top.append([])
+        return super(AutocompleteTrie, self)._add_node(parent, char)
+
+    def insert(self, string, frequency=1):
+        '''
+        Insert string into AutocompleteTrie, adding frequency to its
+        stored frequency and updating the cached completions of every
+        node on its path
+
+        Parameters
+        ----------
+        string : string
+            the word to insert
+        frequency : integer or float (optional); default=1
+            the amount to add to the frequency of string; it must be
+            positive, since the caches only track rising frequencies
+        '''
+
+        # Import packages
+        import bisect
+
+        # Test for valid input
+        if frequency <= 0:
+            err_msg = 'Input frequency: %s must be positive!' % str(frequency)
+            raise ValueError(err_msg)
+
+        # Init variables
+        edges = self.edges
+        char_bits = self._CHAR_BITS
+        node = 0
+        path = [0]
+
+        # Follow existing edges, adding nodes once they run out
+        for char in string:
+            child = edges.get((node << char_bits) | ord(char), -1)
+            if child < 0:
+                child = self._add_node(node, char)
+            node = child
+            path.append(node)
+
+        # Mark the final char as a leaf node
+        if not self.is_leaf[node]:
+            self.is_leaf[node] = 1
+            self.num_words += 1
+        freq = self.frequencies.get(string, 0) + frequency
+        self.frequencies[string] = freq
+
+        # Re-rank string in the cache of every node on its path; one
+        # entry is shared by all of them
+        entry = (-freq, string)
+        max_k = self.max_k
+        for node in path:
+            entries = self.top[node]
+            for idx, (_, word) in enumerate(entries):
+                if word == string:
+                    del entries[idx]
+                    break
+            if len(entries) < max_k or entry < entries[-1]:
+                bisect.insort(entries, entry)
+                del entries[max_k:]
+
+    def complete(self, prefix, k=None):
+        '''
+        Return the k most frequent words starting with prefix
+
+        Parameters
+        ----------
+        prefix : string
+            the prefix to complete; it can be a whole word
+        k : integer (optional); default=None
+            the number of completions to return, at most max_k; None
+            returns max_k
+
+        Returns
+        -------
+        completions : list
+            up to k words, most frequent first and ties in string order;
+            empty if no word starts with prefix
+        '''
+
+        # Test for valid input
+        if k is None:
+            k = self.max_k
+        elif k > self.max_k:
+            err_msg = 'Input k: %d is more than the %d completions cached!' \
+                      % (k, self.max_k)
+            raise ValueError(err_msg)
+
+        # Read the completions off the prefix node
+        node = self._find_node(prefix)
+        if node < 0:
+            return []
+        return [word for _, word in self.top[node][:k]]
+
+    def frequency(self, string):
+        '''
+        Return the stored frequency of string, or 0 if not in the trie
+        '''
+        return self.frequencies.get(string, 0)
+
+
+class _RadixNode(object):
+    '''
+    Node of a RadixTrie; label is the whole run of chars on the edge
+    into the node and children are keyed by the first char of their
+    label
+    '''
+
+    __slots__ = ('label', 'children', 'is_leaf')
+
+    def __init__(self, label='', is_leaf=False):
+        '''
+        Init _RadixNode structure
+        '''
+
+        # Populate contents
+        self.label = label
+        self.children = {}
+        self.is_leaf = is_leaf
+
+
+class RadixTrie(object):
+    '''
+    Path-compressed (Patricia) trie data structure; a run of chars with
+    no branching is stored as one node, so keys with long shared
+    prefixes, like URL and file paths, need about one node per key
+    instead of one node per char
+    '''
+
+    def __init__(self):
+        '''
+        Init RadixTrie structure with an empty root node
+        '''
+
+        # Populate contents
+        self.root = _RadixNode()
+        self.num_words = 0
+
+    def insert(self, string):
+        '''
+        Insert string into RadixTrie, splitting the edge where it leaves
+        an existing label
+        '''
+
+        # Init variables
+        node = self.root
+        pos = 0
+
+        # Walk down the matching labels
+        while pos < len(string):
+            child = node.children.get(string[pos])
+            # No edge starts with the next char, hang the rest off node
+            if child is None:
+                node.children[string[pos]] = _RadixNode(string[pos:], True)
+                self.num_words += 1
+                return
+            label = child.label
+            if not string.startswith(label, pos):
+                # Split the label where string leaves it
+                common = 1
+                while common < len(label) and pos + common < len(string) \
+                        and label[common] == string[pos+common]:
+                    common += 1
+                split = _RadixNode(label[:common])
+                child.label = label[common:]
+                split.children[child.label[0]] = child
+                node.children[string[pos]] = split
+                child = split
+            node = child
+            pos += len(child.label)
+
+        # Mark the final node as a leaf node
+        if not node.is_leaf:
+            node.is_leaf = True
+            self.num_words += 1
+
+    def _find_path(self, string):
+        '''
+        Return the list of nodes from the root to the node ending
+        exactly at string, or None if there is no such node
+        '''
+
+        # Init variables
+        node = self.root
+        path = [node]
+        pos = 0
+
+        # Follow whole labels
+        while pos < len(string):
+            node = node.children.get(string[pos])
+            if node is None or not string.startswith(node.label, pos):
+                return None
+            path.append(node)
+            pos += len(node.label)
+
+        # Return the path
+        return path
+
+    def retrieve(self, prefix):
+        '''
+        Retrieve shortest matching word entry based on a prefix;
+        prefix can be partial word or full word
+        '''
+
+        # Import packages
+        import heapq
+
+        # Init variables
+        node = self.root
+        pos = 0
+        found = []
+
+        # Follow the prefix, which may end part way into a label
+        while pos < len(prefix):
+            node = node.children.get(prefix[pos])
+            if node is None or not (prefix.startswith(node.label, pos) or
+                                    node.label.startswith(prefix[pos:])):
+                raise KeyError('Prefix: "%s" not in Trie!' % prefix)
+            found.append(node.label)
+            pos += len(node.label)
+
+        # Expand the subtree by word length, so the first leaf popped is
+        # the shortest word
+        node_heap = [(pos, ''.join(found), node)]
+        while node_heap:
+            length, string, node = heapq.heappop(node_heap)
+            if node.is_leaf:
+                return string
+            for child in node.children.itervalues():
+                heapq.heappush(node_heap, (length + len(child.label),
+                                           string + child.label, child))
+
+        # No word starts with prefix
+        raise KeyError('Prefix: "%s" not in Trie!' % prefix)
+
+    def delete(self, string):
+        '''
+        Remove string from RadixTrie, merging nodes left with a single
+        child and no word back into that child
+        '''
+
+        # Find the node for the word
+        path = self._find_path(string)
+        if path is None or not path[-1].is_leaf:
+            raise KeyError('String: "%s" not in Trie!' % string)
+        node = path[-1]
+        node.is_leaf = False
+        self.num_words -= 1
+
+        # A childless node is dropped, which may leave its parent with
+        # a single child to merge
+        if len(path) > 1 and not node.children:
+            parent = path[-2]
+            del parent.children[node.label[0]]
+            node = parent
+        if node is not self.root and not node.is_leaf and \
+                len(node.children) == 1:
+            child = node.children.values()[0]
+            node.label += child.label
+            node.children = child.children
+            node.is_leaf = child.is_leaf
+
+    def num_nodes(self):
+        '''
+        Return the number of nodes in the trie, including the root
+        '''
+
+        # Init variables
+        num_nodes = 0
+        node_stack = [self.root]
+
+        # Count every node
+        while node_stack:
+            node = node_stack.pop()
+            num_nodes += 1
+            node_stack.extend(node.children.itervalues())
+
+        # Return the count
+        return num_nodes
+
+    def __contains__(self, string):
+        '''
+        Enable the "in" operator to check for a whole word
+        '''
+        path = self._find_path(string)
+        return path is not None and path[-1].is_leaf
+
+    def __iter__(self):
+        '''
+        Iterate over the words in sorted order
+        '''
+
+        # Init variables
+        node_stack = [('', self.root)]
+
+        # Pre-order walk with children pushed in reverse sorted order
+        while node_stack:
+            string, node = node_stack.pop()
+            if node.is_leaf:
+                yield string
+            for char in sorted(node.children, reverse=True):
+                child = node.children[char]
+                node_stack.append((string + child.label, child))
+
+    def __len__(self):
+        '''
+        Return the number of words in the trie
+        '''
+        return self.num_words
+
+
+def _sorted_items(keys, values):
+    '''
+    Convert the input of a from_sorted bulk loader to key and value
+    lists, checking the keys are strictly increasing
+    '''
+
+    # Import packages
+    import itertools
+
+    # NumPy arrays convert to lists of Python numbers in one call
+    keys = keys.tolist() if hasattr(keys, 'tolist') else list(keys)
+    if values is None:
+        values = [None]*len(keys)
+    else:
+        values = values.tolist() if hasattr(values, 'tolist') \
+                 else list(values)
+        if len(values) != len(keys):
+            err_msg = 'Got %d values for %d keys!' % (len(values), len(keys))
+            raise ValueError(err_msg)
+
+    # Check the keys are sorted and unique
+    for idx, (key, next_key) in \
+            enumerate(itertools.izip(keys, itertools.islice(keys, 1, None))):
+        if not key < next_key:
+            err_msg = 'Keys must be strictly increasing; key %d: %s is ' \
+                      'followed by %s!' % (idx, str(key), str(next_key))
+            raise ValueError(err_msg)
+
+    # Return the lists
+    return keys, values
+
+
+class _OrderedTreeMixin(object):
+    '''
+    Ordered map queries shared by the binary search tree classes; each
+    node has key, left_child and right_child attributes and a size
+    attribute counting the nodes in its subtree, and subclasses must
+    define _root_node() to return the root node or None if the tree is
+    empty. Point queries return nodes, like retrieve, and iteration
+    yields keys, like __iter__
+    '''
+
+    def min(self):
+        '''
+        Return the node with the smallest key, or None if empty
+        '''
+        node = self._root_node()
+        while node is not None and node.left_child is not None:
+            node = node.left_child
+        return node
+
+    def max(self):
+        '''
+        Return the node with the largest key, or None if empty
+        '''
+        node = self._root_node()
+        while node is not None and node.right_child is not None:
+            node = node.right_child
+        return node
+
+    def floor(self, key):
+        '''
+        Return the node with the largest key <= key, or None if every
+        key is larger
+        '''
+
+        # Init variables
+        node = self._root_node()
+        found = None
+
+        # Every node left of a right turn is a candidate
+        while node is not None:
+            if key < node.key:
+                node = node.left_child
+            elif key > node.key:
+                found = node
+                node = node.right_child
+            else:
+                return node
+
+        # Return the closest candidate
+        return found
+
+    def ceiling(self, key):
+        '''
+        Return the node with the smallest key >= key, or None if every
+        key is smaller
+        '''
+
+        # Init variables
+        node = self._root_node()
+        found = None
+
+        # Every node right of a left turn is a candidate
+        while node is not None:
+            if key < node.key:
+                found = node
+                node = node.left_child
+            elif key > node.key:
+                node = node.right_child
+            else:
+                return node
+
+        # Return the closest candidate
+        return found
+
+    def rank(self, key):
+        '''
+        Return the number of keys in the tree smaller than key; key does
+        not have to be in the tree
+        '''
+
+        # Init variables
+        node = self._root_node()
+        rank = 0
+
+        # Count the left subtrees and nodes passed on right turns
+        while node is not None:
+            left = node.left_child
+            if key < node.key:
+                node = left
+            elif key > node.key:
+                rank += 1 + (left.size if left else 0)
+                node = node.right_child
+            else:
+                rank += left.size if left else 0
+                break
+
+        # Return the rank
+        return rank
+
+    def select(self, idx):
+        '''
+        Return the node with the idx-th smallest key, counting from 0
+        '''
+
+        # Init variables
+        node = self._root_node()
+        num_nodes = node.size if node else 0
+        if idx < 0:
+            idx += num_nodes
+        if not 0 <= idx < num_nodes:
+            err_msg = 'Index: %s out of range for %d keys!' \
+                      % (str(idx), num_nodes)
+            raise IndexError(err_msg)
+
+        # Steer by the left subtree sizes
+        while True:
+            left_size = node.left_child.size if node.left_child else 0
+            if idx < left_size:
+                node = node.left_child
+            elif idx > left_size:
+                idx -= left_size + 1
+                node = node.right_child
+            else:
+                return node
+
+    def range(self, low, high):
+        '''
+        Iterate in order over the keys k with low <= k <= high, in
+        O(log n) time plus O(1) amortized per key
+        '''
+
+        # Init variables
+        node_stack = []
+        node = self._root_node()
+
+        # Stack the path down to low, keeping nodes that are >= low
+        while node is not None:
+            if node.key < low:
+                node = node.right_child
+            else:
+                node_stack.append(node)
+                node = node.left_child
+
+        # In-order walk until a key passes high
+        while node_stack:
+            node = node_stack.pop()
+            if node.key > high:
+                return
+            yield node.key
+            node = node.right_child
+            while node is not None:
+                node_stack.append(node)
+                node = node.left_child
+
+    def __iter__(self):
+        '''
+        Allow in-order iteration over the keys, in O(1) amortized time
+        per key
+        '''
+
+        # Init variables
+        node_stack = []
+        node = self._root_node()
+
+        # Push the left spine, then visit and move to the right subtree
+        while node_stack or node is not None:
+            while node is not None:
+                node_stack.append(node)
+                node = node.left_child
+            node = node_stack.pop()
+            yield node.key
+            node = node.right_child
+
+
+class BinarySearchTree(_OrderedTreeMixin):
     '''
     Binary Search Tree class implementation where each node in the
     tree contains a key-value pair and an optional left child and
-    right child. left_child.key < parent; right_child.key > parent
+    right child. left_child.key < parent; right_child.key > parent.
+    Every node also stores the size of its subtree for the ordered
+    queries
     '''
 
     def __init__(self, key, value):
@@ -225,6 +1076,66 @@ class BinarySearchTree(object):
         # Status flags
         self.is_left_child = False
         self.is_right_child = False
+        # Number of nodes in subtree
+        self.size = 1
+
+    @classmethod
+    def from_sorted(cls, keys, values=None):
+        '''
+        Build a minimum height tree from strictly increasing keys in
+        O(n) time, without recursion, so it works for millions of keys;
+        parent pointers, child flags and subtree sizes are all set
+
+        Parameters
+        ----------
+        keys : iterable or numpy.ndarray
+            the strictly increasing, numeric keys
+        values : iterable or numpy.ndarray (optional); default=None
+            the value for each key; None gives every key a None value
+
+        Returns
+        -------
+        tree : BinarySearchTree
+            the root node of the tree; an empty tree if there are no
+            keys
+        '''
+
+        # Init variables
+        keys, values = _sorted_items(keys, values)
+        for key in keys[:1] + keys[-1:]:
+            if not isinstance(key, (int, long, float)):
+                err_msg = 'Key: "%s" must be an integer or float!' % str(key)
+                raise KeyError(err_msg)
+        if not keys:
+            root = cls(None, None)
+            root.size = 0
+            return root
+        root = None
+        # (low, high, parent, is_left) ranges of keys left to build
+        range_stack = [(0, len(keys) - 1, None, False)]
+
+        # Each range is rooted at its middle key
+        while range_stack:
+            low, high, parent, is_left = range_stack.pop()
+            mid = (low + high)//2
+            node = cls(keys[mid], values[mid])
+            node.size = high - low + 1
+            node.parent = parent
+            if parent is None:
+                root = node
+            elif is_left:
+                parent.left_child = node
+                node.is_left_child = True
+            else:
+                parent.right_child = node
+                node.is_right_child = True
+            if low < mid:
+                range_stack.append((low, mid - 1, node, True))
+            if mid < high:
+                range_stack.append((mid + 1, high, node, False))
+
+        # Return the root
+        return root
 
     def insert(self, key, value):
         '''
@@ -236,25 +1147,42 @@ class BinarySearchTree(object):
             err_msg = 'Key: "%s" must be an integer or float!' % (str(key))
             raise KeyError(err_msg)
 
-        # If key < current key, insert right
-        if key < self.key:
-            if self.left_child:
-                self.left_child.insert(key, value)
-            else:
-                self.left_child = BinarySearchTree(key, value)
-                self.left_child._set_as_left_child()
-                self.left_child.parent = self
-        # If key > current key, insert right
-        elif key > self.key:
-            if self.right_child:
-                self.right_child.insert(key, value)
-            else:
-                self.right_child = BinarySearchTree(key, value)
-                self.right_child._set_as_right_child()
-                self.right_child.parent = self
-        # Key == current key, replace
-        else:
+        # Tree emptied by deleting its last node takes key directly
+        if not self.size:
+            self.key = key
             self.value = value
+            self.size = 1
+            return
+
+        # Walk down to the empty spot for key
+        node = self
+        while True:
+            # If key < current key, insert left
+            if key < node.key:
+                if node.left_child is not None:
+                    node = node.left_child
+                    continue
+                node.left_child = BinarySearchTree(key, value)
+                node.left_child._set_as_left_child()
+                node.left_child.parent = node
+            # If key > current key, insert right
+            elif key > node.key:
+                if node.right_child is not None:
+                    node = node.right_child
+                    continue
+                node.right_child = BinarySearchTree(key, value)
+                node.right_child._set_as_right_child()
+                node.right_child.parent = node
+            # Key == current key, replace
+            else:
+                node.value = value
+                return
+            break
+
+        # Count the new node in every subtree above it
+        while node is not None:
+            node.size += 1
+            node = node.parent
 
     def __setitem__(self, key, value):
         '''
@@ -272,21 +1200,21 @@ class BinarySearchTree(object):
             err_msg = 'Key: "%s" must be an integer or float!' % (str(key))
             raise KeyError(err_msg)
 
-        # If key < current key, check left child
-        if key < self.key:
-            if not self.left_child:
-                return None
-            else:
-                return self.left_child.retrieve(key)
-        # If key > current key, check right child
-        elif key > self.key:
-            if not self.right_child:
-                return None
+        # Walk down from this node
+        node = self if self.size else None
+        while node is not None:
+            # If key < current key, check left child
+            if key < node.key:
+                node = node.left_child
+            # If key > current key, check right child
+            elif key > node.key:
+                node = node.right_child
+            # Key == current key, return node
             else:
-                return self.right_child.retrieve(key)
-        # Key == current key, return value
-        else:
-            return self
+                return node
+
+        # Key not found
+        return None
 
     def __getitem__(self, key):
         '''
@@ -303,13 +1231,15 @@ class BinarySearchTree(object):
         else:
             return False
 
-    def _replace_node_data(self, key, value, left_child, right_child):
+    def _replace_node_data(self, key, value, left_child, right_child,
+                           size):
         '''
         Replace the node data and connections
         '''
-        # Populate key and value
+        # Populate key, value and subtree size
         self.key = key
         self.value = value
+        self.size = size
 
         # Populate children
         self.left_child = left_child
@@ -357,39 +1287,48 @@ class BinarySearchTree(object):
             # Else it is the root node, set to None
             else:
                 curr_node._replace_node_data(key=None, value=None,
-                                             left_child=None, right_child=None)
+                                             left_child=None, right_child=None,
+                                             size=0)
         # Has a left child only
         elif curr_node.left_child and not curr_node.right_child:
             # If it is a left child, put its left child as parent's left
             if curr_node.is_left_child:
                 curr_node.parent.left_child = curr_node.left_child
                 curr_node.left_child.parent = curr_node.parent
+                curr_node.left_child._set_as_left_child()
             # Else it is a right child, put its left child as parent's right
             elif curr_node.is_right_child:
                 curr_node.parent.right_child = curr_node.left_child
                 curr_node.left_child.parent = curr_node.parent
+                curr_node.left_child._set_as_right_child()
             # Else it is the root node, replace key, value, and children
             else:
-                curr_node._replace_node_data(key=curr_node.left_child.key,
-                                             value=curr_node.left_child.value,
-                                             left_child=curr_node.left_child,
-                                             right_child=None)
+                child = curr_node.left_child
+                curr_node._replace_node_data(key=child.key,
+                                             value=child.value,
+                                             left_child=child.left_child,
+                                             right_child=child.right_child,
+                                             size=child.size)
         # Has right child only
         elif curr_node.right_child and not curr_node.left_child:
             # If it is a left child, put its right child as parent's left
             if curr_node.is_left_child:
                 curr_node.parent.left_child = curr_node.right_child
                 curr_node.right_child.parent = curr_node.parent
+                curr_node.right_child._set_as_left_child()
             # Else it is a right, put its right child as parent's right
             elif curr_node.is_right_child:
                 curr_node.parent.right_child = curr_node.right_child
                 curr_node.right_child.parent = curr_node.parent
+                curr_node.right_child._set_as_right_child()
             # Else it is the root node, replace key, value, and children
             else:
-                curr_node._replace_node_data(key=curr_node.right_child.key,
-                                             value=curr_node.right_child.value,
-                                             left_child=None,
-                                             right_child=curr_node.right_child)
+                child = curr_node.right_child
+                curr_node._replace_node_data(key=child.key,
+                                             value=child.value,
+                                             left_child=child.left_child,
+                                             right_child=child.right_child,
+                                             size=child.size)
         # Else, has both left and right child, find successor
         else:
             # Get the next largest node (left leaf node in right subtree)
@@ -403,6 +1342,7 @@ class BinarySearchTree(object):
                 # If it's a left child, set parent's left to its right
                 if successor.is_left_child:
                     successor.parent.left_child = successor.right_child
+                    successor.right_child._set_as_left_child()
                 # Else it must be a right child, set parents right to its right
                 else:
                     successor.parent.right_child = successor.right_child
@@ -415,100 +1355,480 @@ class BinarySearchTree(object):
             # Replace node data of curr_node with successor data
             curr_node.key = successor.key
             curr_node.value = successor.value
+            curr_node = successor
 
-    def __iter__(self):
+        # One node fewer in every subtree above the removed node
+        node = curr_node.parent
+        while node is not None:
+            node.size -= 1
+            node = node.parent
+
+    def _root_node(self):
         '''
-        Allow iteration over BST, is ran recursively via for loop
+        Return this node as the root, or None if the tree was emptied
         '''
+        return self if self.size else None
 
-        # If child exists
-        if self:
-            # Do left all-way down
-            if self.left_child:
-                # Recursion here (__iter__ overrides for)
-                for elem in self.left_child:
-                    yield elem
-            # Yield key value
-            yield self.key
-            # Then do right all-way down
-            if self.right_child:
-                # Recursion here (__iter__ overrides for)
-                for elem in self.right_child:
-                    yield elem
+    def __len__(self):
+        '''
+        Return the number of nodes in the tree
+        '''
+        return self.size
 
 
-class BinaryHeap(object):
+class _AVLNode(object):
     '''
-    Binary Heap class - priority queue implementation (min heap);
-    enqueue and dequeue items in O(logn) time 
+    Node of an AVLTree holding a key-value pair, its children and the
+    height and size of the subtree rooted at it
     '''
 
-    def __init__(self):
+    __slots__ = ('key', 'value', 'left_child', 'right_child', 'height',
+                 'size')
+
+    def __init__(self, key, value):
         '''
-        Init the binary heap
+        Init _AVLNode structure as a leaf
         '''
-        self.heap_list = [0]
-        self.current_size = 0
 
-    def _get_min_child(self, idx):
+        # Populate contents
+        self.key = key
+        self.value = value
+        self.left_child = None
+        self.right_child = None
+        self.height = 1
+        self.size = 1
+
+
+class AVLTree(_OrderedTreeMixin):
+    '''
+    Self-balancing binary search tree with the same mapping interface as
+    BinarySearchTree; the heights of the two subtrees of every node
+    differ by at most one, so the tree is O(log n) deep whatever order
+    the keys are inserted in. All operations are iterative, keeping the
+    path walked down on a list instead of the call stack, and subtree
+    sizes are kept for the ordered queries
+    '''
+
+    def __init__(self):
         '''
-        Method used to find index of minimum child of a node
+        Init empty tree
         '''
 
-        # If the right child node does not exist, return left
-        if idx*2 + 1 > self.current_size:
-            return idx*2
-        # Get left and right children indexs
-        left = idx*2
-        right = idx*2+1
-        # If left key is smaller, return left
-        if self.heap_list[left] < self.heap_list[right]:
-            return left
-        # Else return right
-        else:
-            return right
+        # Populate contents
+        self.root = None
+
+    @classmethod
+    def from_sorted(cls, keys, values=None):
+        '''
+        Build a minimum height tree from strictly increasing keys in
+        O(n) time, without recursion; the middle key of every range is
+        its root, so the tree is balanced and the heights and sizes
+        follow from the range lengths
+
+        Parameters
+        ----------
+        keys : iterable or numpy.ndarray
+            the strictly increasing, numeric keys
+        values : iterable or numpy.ndarray (optional); default=None
+            the value for each key; None gives every key a None value
+
+        Returns
+        -------
+        tree : AVLTree
+            the tree holding every key
+        '''
+
+        # Init variables
+        keys, values = _sorted_items(keys, values)
+        for key in keys[:1] + keys[-1:]:
+            cls._check_key(key)
+        tree = cls()
+        if not keys:
+            return tree
+        # (low, high, parent, is_left) ranges of keys left to build
+        range_stack = [(0, len(keys) - 1, None, False)]
+
+        # Each range is rooted at its middle key
+        while range_stack:
+            low, high, parent, is_left = range_stack.pop()
+            mid = (low + high)//2
+            node = _AVLNode(keys[mid], values[mid])
+            node.size = high - low + 1
+            # A range of n keys split at the middle is n.bit_length() deep
+            node.height = node.size.bit_length()
+            if parent is None:
+                tree.root = node
+            elif is_left:
+                parent.left_child = node
+            else:
+                parent.right_child = node
+            if low < mid:
+                range_stack.append((low, mid - 1, node, True))
+            if mid < high:
+                range_stack.append((mid + 1, high, node, False))
+
+        # Return the tree
+        return tree
+
+    @staticmethod
+    def _check_key(key):
+        '''
+        Check key is numeric, like BinarySearchTree keys
+        '''
+        if not isinstance(key, (int, long, float)):
+            err_msg = 'Key: "%s" must be an integer or float!' % (str(key))
+            raise KeyError(err_msg)
+
+    @staticmethod
+    def _update_node(node):
+        '''
+        Recompute the height and size of node from its children
+        '''
+        left, right = node.left_child, node.right_child
+        node.height = 1 + max(left.height if left else 0,
+                              right.height if right else 0)
+        node.size = 1 + (left.size if left else 0) + \
+                    (right.size if right else 0)
+
+    def _rotate_left(self, node):
+        '''
+        Rotate node down to the left of its right child and return the
+        new subtree root
+        '''
+        pivot = node.right_child
+        node.right_child = pivot.left_child
+        pivot.left_child = node
+        self._update_node(node)
+        self._update_node(pivot)
+        return pivot
+
+    def _rotate_right(self, node):
+        '''
+        Rotate node down to the right of its left child and return the
+        new subtree root
+        '''
+        pivot = node.left_child
+        node.left_child = pivot.right_child
+        pivot.right_child = node
+        self._update_node(node)
+        self._update_node(pivot)
+        return pivot
+
+    def _balance(self, node):
+        '''
+        Update the height and size of node and rotate it if its subtrees
+        differ in height by two; return the root of the balanced subtree
+        '''
+
+        # Init variables
+        left, right = node.left_child, node.right_child
+        left_height = left.height if left else 0
+        right_height = right.height if right else 0
+
+        # Left heavy; rotate a right leaning left child first
+        if left_height - right_height > 1:
+            if (left.left_child.height if left.left_child else 0) < \
+                    (left.right_child.height if left.right_child else 0):
+                node.left_child = self._rotate_left(left)
+            return self._rotate_right(node)
+        # Right heavy; rotate a left leaning right child first
+        elif right_height - left_height > 1:
+            if (right.right_child.height if right.right_child else 0) < \
+                    (right.left_child.height if right.left_child else 0):
+                node.right_child = self._rotate_right(right)
+            return self._rotate_left(node)
+
+        # Already balanced
+        node.height = 1 + max(left_height, right_height)
+        node.size = 1 + (left.size if left else 0) + \
+                    (right.size if right else 0)
+        return node
+
+    def _rebalance_path(self, path, subtree):
+        '''
+        Hang subtree back under the last node of path and rebalance the
+        nodes on path from the bottom up; once a subtree keeps both its
+        root and its height, the nodes above only need their sizes
+        updated
+
+        Parameters
+        ----------
+        path : list
+            (node, is_left) pairs from the root down, where is_left says
+            which child of node the walk went to
+        subtree : _AVLNode or None
+            the new child of the last node on path
+        '''
+
+        # Init variables
+        is_stable = False
+
+        # Walk back up the path
+        for node, is_left in reversed(path):
+            if is_stable:
+                left, right = node.left_child, node.right_child
+                node.size = 1 + (left.size if left else 0) + \
+                            (right.size if right else 0)
+                continue
+            if is_left:
+                node.left_child = subtree
+            else:
+                node.right_child = subtree
+            height = node.height
+            subtree = self._balance(node)
+            is_stable = subtree is node and node.height == height
+
+        # The whole path changed, so subtree is the new root
+        if not is_stable:
+            self.root = subtree
+
+    def insert(self, key, value):
+        '''
+        Insert new key-value node into tree, or replace the value if key
+        is already in it
+        '''
+
+        # Check key is numeric
+        self._check_key(key)
+
+        # Init variables
+        node = self.root
+        path = []
+
+        # Walk down to the empty spot for key
+        while node is not None:
+            if key < node.key:
+                path.append((node, True))
+                node = node.left_child
+            elif key > node.key:
+                path.append((node, False))
+                node = node.right_child
+            # Key == current key, replace
+            else:
+                node.value = value
+                return
+
+        # Add the leaf and rebalance above it
+        self._rebalance_path(path, _AVLNode(key, value))
+
+    def __setitem__(self, key, value):
+        '''
+        Allow assignment via [] operator
+        '''
+        self.insert(key, value)
+
+    def retrieve(self, key):
+        '''
+        Find tree node using specified key; returns None if not found
+        '''
+
+        # Check key is numeric
+        self._check_key(key)
+
+        # Walk down from the root
+        node = self.root
+        while node is not None:
+            if key < node.key:
+                node = node.left_child
+            elif key > node.key:
+                node = node.right_child
+            else:
+                break
+
+        # Return the node
+        return node
+
+    def __getitem__(self, key):
+        '''
+        Allow access via [] operator
+        '''
+        return self.retrieve(key)
+
+    def __contains__(self, key):
+        '''
+        Enable the "in" operator
+        '''
+        return self.retrieve(key) is not None
+
+    def delete(self, key):
+        '''
+        Delete node with specified key
+        '''
+
+        # Check key is numeric
+        self._check_key(key)
+
+        # Init variables
+        node = self.root
+        path = []
+
+        # First find the node
+        while node is not None and key != node.key:
+            if key < node.key:
+                path.append((node, True))
+                node = node.left_child
+            else:
+                path.append((node, False))
+                node = node.right_child
+        if node is None:
+            err_msg = 'Node with key: %s not found; cannot delete!' % str(key)
+            raise KeyError(err_msg)
+
+        # With two children, take the data of the successor (left most
+        # node of the right subtree) and remove the successor instead
+        if node.left_child and node.right_child:
+            path.append((node, False))
+            successor = node.right_child
+            while successor.left_child:
+                path.append((successor, True))
+                successor = successor.left_child
+            node.key = successor.key
+            node.value = successor.value
+            node = successor
+
+        # The node now has at most one child, which takes its place
+        self._rebalance_path(path, node.left_child or node.right_child)
+
+    def height(self):
+        '''
+        Return the height of the tree, 0 if it is empty
+        '''
+        return self.root.height if self.root else 0
+
+    def _root_node(self):
+        '''
+        Return the root node, or None if the tree is empty
+        '''
+        return self.root
+
+    def __len__(self):
+        '''
+        Return the number of nodes in the tree
+        '''
+        return self.root.size if self.root else 0
+
+
+class BinaryHeap(object):
+    '''
+    Binary Heap class - priority queue implementation (min heap);
+    enqueue and dequeue items in O(logn) time. The heap can also be
+    d-ary (every node has arity children), which makes it shallower,
+    so inserts move items fewer levels at the cost of more children to
+    compare per level on dequeues. A heap with a max_size is bounded:
+    once full it keeps only the max_size largest keys seen, with the
+    smallest of them at the root to test new keys against
+    '''
+
+    def __init__(self, arity=2, max_size=None):
+        '''
+        Init the binary heap
+
+        Parameters
+        ----------
+        arity : integer (optional); default=2
+            the number of children of every node
+        max_size : integer (optional); default=None
+            the most keys to keep; smaller keys are dropped once the
+            heap is full. None for an unbounded heap
+        '''
+
+        # Test for valid input
+        if arity < 2:
+            err_msg = 'Arity: %s must be at least 2!' % str(arity)
+            raise ValueError(err_msg)
+        if max_size is not None and max_size < 1:
+            err_msg = 'Max size: %s must be at least 1!' % str(max_size)
+            raise ValueError(err_msg)
+
+        # Populate contents
+        self.heap_list = [0]
+        self.current_size = 0
+        self.arity = arity
+        self.max_size = max_size
 
     def _percolate_up(self, idx):
         '''
         Method to send new input key to as far to top of tree heap
-        while maintaining parent-child property
+        while maintaining parent-child property; larger parents are
+        shifted down into the hole rather than swapped
         '''
 
-        # While parent is not root
-        while idx//2 > 0:
-            # If the last added node is smaller than parent
-            if self.heap_list[idx] < self.heap_list[idx//2]:
-                # Swap parent and child
-                tmp = self.heap_list[idx//2]
-                self.heap_list[idx//2] = self.heap_list[idx]
-                self.heap_list[idx] = tmp
-            # Check next parent/child combo if a swap is needed
-            idx = idx//2
+        # Init variables
+        heap_list = self.heap_list
+        arity = self.arity
+        key = heap_list[idx]
+
+        # While parent is not root and is larger, shift it down
+        while idx > 1:
+            parent_idx = (idx - 2)//arity + 1
+            parent = heap_list[parent_idx]
+            if not key < parent:
+                break
+            heap_list[idx] = parent
+            idx = parent_idx
+
+        # Drop key into place
+        heap_list[idx] = key
 
     def _percolate_down(self, idx):
         '''
         Method to send shifted root key as far down tree heap while
-        maintaining parent-child property
+        maintaining parent-child property; smaller children are
+        shifted up into the hole rather than swapped
         '''
 
+        # Init variables
+        heap_list = self.heap_list
+        arity = self.arity
+        size = self.current_size
+        key = heap_list[idx]
+
         # While index is not a leaf
-        while idx*2 <= self.current_size:
-            # Get the minimum child idx
-            min_child_idx = self._get_min_child(idx)
-            # If the parent is greater than minimum child
-            if self.heap_list[idx] > self.heap_list[min_child_idx]:
-                # Swap parent and min child
-                tmp = self.heap_list[min_child_idx]
-                self.heap_list[min_child_idx] = self.heap_list[idx]
-                self.heap_list[idx] = tmp
-            # Check next parent/child combo if a swap is needed
+        while True:
+            min_child_idx = arity*(idx - 1) + 2
+            if min_child_idx > size:
+                break
+            # Get the minimum child; two children are compared directly
+            min_child = heap_list[min_child_idx]
+            if arity == 2:
+                if min_child_idx < size and \
+                        heap_list[min_child_idx + 1] < min_child:
+                    min_child_idx += 1
+                    min_child = heap_list[min_child_idx]
+            else:
+                for child_idx in xrange(min_child_idx + 1,
+                                        min(min_child_idx + arity, size + 1)):
+                    if heap_list[child_idx] < min_child:
+                        min_child_idx = child_idx
+                        min_child = heap_list[child_idx]
+            # Stop once the key is no greater than the minimum child
+            if not min_child < key:
+                break
+            heap_list[idx] = min_child
             idx = min_child_idx
 
+        # Drop key into place
+        heap_list[idx] = key
+
+    def _heapify(self):
+        '''
+        Restore the heap property over the whole list in O(n) time by
+        percolating down from the last parent back to the root
+        '''
+        for idx in xrange((self.current_size - 2)//self.arity + 1, 0, -1):
+            self._percolate_down(idx)
+
     def insert(self, key):
         '''
-        Insert a new node into the BinaryHeap tree
+        Insert a new node into the BinaryHeap tree; a full bounded heap
+        keeps key only if it is larger than the root
         '''
 
+        # Full bounded heap, so replace the root or drop key
+        if self.current_size == self.max_size:
+            self.push_pop(key)
+            return
+
         # Append key to end of list
         self.heap_list.append(key)
         # Increase size of heap
@@ -516,40 +1836,663 @@ class BinaryHeap(object):
         # Percolate it up until heap order property is satisfied
         self._percolate_up(self.current_size)
 
+    def push_pop(self, key):
+        '''
+        Insert key and dequeue the smallest key in one step, which is
+        key itself when it is no larger than the root; the heap size
+        does not change
+
+        Parameters
+        ----------
+        key : object
+            the key to insert
+
+        Returns
+        -------
+        min_key : object
+            the smallest of key and the keys in the heap
+        '''
+
+        # Key would come straight back out
+        heap_list = self.heap_list
+        if self.current_size < 1 or not heap_list[1] < key:
+            return key
+
+        # Key takes the root's place and percolates down
+        min_key = heap_list[1]
+        heap_list[1] = key
+        self._percolate_down(1)
+
+        # Return the old root
+        return min_key
+
+    def _extend(self, keys):
+        '''
+        Insert a list of keys; when the batch is at least as big as the
+        heap, the keys are appended and the whole heap rebuilt in O(n)
+        time instead of percolating each one up
+        '''
+
+        # Rebuild for big batches, insert one at a time otherwise
+        if len(keys) >= self.current_size:
+            self.heap_list.extend(keys)
+            self.current_size += len(keys)
+            self._heapify()
+        else:
+            for key in keys:
+                self.insert(key)
+
+    def push_many(self, keys):
+        '''
+        Insert many keys at once; a bounded heap is filled up to its
+        max_size and then streams the remaining keys past the root, so
+        it takes O(n log(max_size)) time and never holds more than
+        max_size keys, whatever the size of keys
+        '''
+
+        # Import packages
+        from itertools import islice
+
+        # Unbounded heap takes the whole batch
+        if self.max_size is None:
+            self._extend(list(keys))
+            return
+
+        # Fill the free slots, then keep only keys larger than the root
+        keys = iter(keys)
+        self._extend(list(islice(keys, self.max_size - self.current_size)))
+        heap_list = self.heap_list
+        percolate_down = self._percolate_down
+        for key in keys:
+            if heap_list[1] < key:
+                heap_list[1] = key
+                percolate_down(1)
+
+    def peek_min(self):
+        '''
+        Method to return the smallest key item in the heap without
+        removing it
+        '''
+
+        # Check for empty heap
+        if self.current_size < 1:
+            raise IndexError('Cannot peek into an empty heap!')
+
+        # Smallest key node is always heap[1]
+        return self.heap_list[1]
+
     def dequeue_min(self):
         '''
         Method to return the smallest key item in the heap
         '''
 
+        # Check for empty heap
+        if self.current_size < 1:
+            raise IndexError('Cannot dequeue from an empty heap!')
+
         # Smallest key node is always heap[1]
         min_key = self.heap_list[1]
 
         # Pop latest value off end and enter as root
         # This keeps heap structure property
-        self.heap_list[1] = self.heap_list[self.current_size]
-        # Decrement size and pop off value
+        last_key = self.heap_list.pop()
         self.current_size -= 1
-        self.heap_list.pop()
-        # Percolate the new root back down
-        self._percolate_down(1)
+        if self.current_size > 0:
+            self.heap_list[1] = last_key
+            # Percolate the new root back down
+            self._percolate_down(1)
 
         # Return the minimum key
         return min_key
 
+    def pop_many(self, num_keys):
+        '''
+        Method to return the num_keys smallest keys in the heap, in
+        order; fewer if the heap runs out
+        '''
+        num_keys = min(num_keys, self.current_size)
+        return [self.dequeue_min() for _ in xrange(num_keys)]
+
     def build_heap(self, in_list):
         '''
         Build a heap tree from an unsorted input list
         '''
 
+        # Bounded heap keeps only the largest keys of in_list
+        if self.max_size is not None:
+            self.heap_list = [0]
+            self.current_size = 0
+            self.push_many(in_list)
+            return
+
         # Set heap to [0, ...(in_list)] and set size
-        self.heap_list = [0] + in_list
+        self.heap_list = [0] + list(in_list)
+        self.current_size = len(self.heap_list) - 1
+        # Start percolating down from parents of leaves, right-to-left,
+        # bottom-to-top
+        self._heapify()
+
+    def __len__(self):
+        '''
+        Return the number of keys in the heap
+        '''
+        return self.current_size
+
+
+class IndexedBinaryHeap(BinaryHeap):
+    '''
+    Binary Heap class - priority queue implementation (min heap) of
+    items ordered by a separate priority; the position of every item
+    in the heap is indexed so its priority can be decreased, or it can
+    be removed, in O(logn) time. Items must be hashable and unique
+    within the heap. Priorities are kept in a list alongside the items,
+    so comparisons do not need to look items up
+    '''
+
+    def __init__(self, arity=2):
+        '''
+        Init the indexed binary heap
+
+        Parameters
+        ----------
+        arity : integer (optional); default=2
+            the number of children of every node
+        '''
+        super(IndexedBinaryHeap, self).__init__(arity)
+        self.heap_priorities = [None]
+        self.positions = {}
+
+    def _percolate_up(self, idx):
+        '''
+        Method to move the item at idx up the heap until its parent has
+        a smaller priority; parents are shifted down into the hole
+        instead of swapped, and every moved item's position is updated
+        '''
+
+        # Init variables
+        heap_list = self.heap_list
+        priorities = self.heap_priorities
+        positions = self.positions
+        arity = self.arity
+        item = heap_list[idx]
+        priority = priorities[idx]
+
+        # Shift larger parents down until the item's slot is found
+        while idx > 1:
+            parent_idx = (idx - 2)//arity + 1
+            parent_priority = priorities[parent_idx]
+            if not priority < parent_priority:
+                break
+            parent = heap_list[parent_idx]
+            heap_list[idx] = parent
+            priorities[idx] = parent_priority
+            positions[parent] = idx
+            idx = parent_idx
+
+        # Drop item into place
+        heap_list[idx] = item
+        priorities[idx] = priority
+        positions[item] = idx
+
+    def _percolate_down(self, idx):
+        '''
+        Method to move the item at idx down the heap until all of its
+        children have larger priorities, updating positions as it goes
+        '''
+
+        # Init variables
+        heap_list = self.heap_list
+        priorities = self.heap_priorities
+        positions = self.positions
+        arity = self.arity
+        size = self.current_size
+        item = heap_list[idx]
+        priority = priorities[idx]
+
+        # Shift smaller children up until the item's slot is found
+        while True:
+            min_child_idx = arity*(idx - 1) + 2
+            if min_child_idx > size:
+                break
+            # Get the minimum child; two children are compared directly
+            min_priority = priorities[min_child_idx]
+            if arity == 2:
+                if min_child_idx < size and \
+                        priorities[min_child_idx + 1] < min_priority:
+                    min_child_idx += 1
+                    min_priority = priorities[min_child_idx]
+            else:
+                for child_idx in xrange(min_child_idx + 1,
+                                        min(min_child_idx + arity, size + 1)):
+                    if priorities[child_idx] < min_priority:
+                        min_child_idx = child_idx
+                        min_priority = priorities[child_idx]
+            if not min_priority < priority:
+                break
+            child = heap_list[min_child_idx]
+            heap_list[idx] = child
+            priorities[idx] = min_priority
+            positions[child] = idx
+            idx = min_child_idx
+
+        # Drop item into place
+        heap_list[idx] = item
+        priorities[idx] = priority
+        positions[item] = idx
+
+    def _pop_last(self):
+        '''
+        Remove the last slot of the heap and return its item and
+        priority
+        '''
+        self.current_size -= 1
+        return self.heap_list.pop(), self.heap_priorities.pop()
+
+    def _remove_at(self, idx):
+        '''
+        Remove the item at idx, moving the last item into its slot, and
+        return the removed (item, priority) pair
+        '''
+
+        # Init variables
+        item = self.heap_list[idx]
+        priority = self.heap_priorities[idx]
+        del self.positions[item]
+
+        # Fill the hole with the last item and move it up or down
+        last_item, last_priority = self._pop_last()
+        if idx <= self.current_size:
+            self.heap_list[idx] = last_item
+            self.heap_priorities[idx] = last_priority
+            if last_priority < priority:
+                self._percolate_up(idx)
+            else:
+                self._percolate_down(idx)
+
+        # Return the removed pair
+        return item, priority
+
+    def _position(self, item):
+        '''
+        Return the position of an item, raising KeyError if it is not
+        in the heap
+        '''
+        try:
+            return self.positions[item]
+        except KeyError:
+            err_msg = 'Item: %s not in heap!' % str(item)
+            raise KeyError(err_msg)
+
+    def insert(self, item, priority):
+        '''
+        Insert a new item with a priority into the heap
+        '''
+
+        # Items are indexed, so they must be unique
+        if item in self.positions:
+            err_msg = 'Item: %s already in heap; use decrease_key!' \
+                      % str(item)
+            raise KeyError(err_msg)
+
+        # Append item to end of list and percolate it up
+        self.heap_list.append(item)
+        self.heap_priorities.append(priority)
+        self.current_size += 1
+        self._percolate_up(self.current_size)
+
+    def push_pop(self, item, priority):
+        '''
+        Insert an item and dequeue the smallest priority item in one
+        step, which is the new item itself when its priority is no
+        smaller than the root's; returns the (item, priority) pair
+        '''
+
+        # Items are indexed, so they must be unique
+        if item in self.positions:
+            err_msg = 'Item: %s already in heap; use decrease_key!' \
+                      % str(item)
+            raise KeyError(err_msg)
+
+        # Item would come straight back out
+        if self.current_size < 1 or \
+                not self.heap_priorities[1] < priority:
+            return item, priority
+
+        # Item takes the root's place and percolates down
+        min_item = self.heap_list[1]
+        min_priority = self.heap_priorities[1]
+        del self.positions[min_item]
+        self.heap_list[1] = item
+        self.heap_priorities[1] = priority
+        self._percolate_down(1)
+
+        # Return the old root and its priority
+        return min_item, min_priority
+
+    def push_many(self, in_list):
+        '''
+        Insert many (item, priority) pairs at once; when the batch is at
+        least as big as the heap, the pairs are appended and the whole
+        heap rebuilt in O(n) time instead of percolating each one up
+        '''
+
+        # Init variables
+        in_list = list(in_list)
+        positions = self.positions
+
+        # Check every item is new before changing anything
+        items = set(item for item, priority in in_list)
+        if len(items) != len(in_list) or \
+                any(item in positions for item in items):
+            raise KeyError('Items in the heap must be unique!')
+
+        # Insert one at a time for small batches
+        if len(in_list) < self.current_size:
+            for item, priority in in_list:
+                self.insert(item, priority)
+            return
+
+        # Append and index everything, then rebuild
+        for item, priority in in_list:
+            self.heap_list.append(item)
+            self.heap_priorities.append(priority)
+            self.current_size += 1
+            positions[item] = self.current_size
+        self._heapify()
+
+    def peek_min(self):
+        '''
+        Method to return the (item, priority) pair with the smallest
+        priority in the heap without removing it
+        '''
+
+        # Check for empty heap
+        if self.current_size < 1:
+            raise IndexError('Cannot peek into an empty heap!')
+
+        # Smallest priority item is always heap[1]
+        return self.heap_list[1], self.heap_priorities[1]
+
+    def dequeue_min(self):
+        '''
+        Method to remove and return the (item, priority) pair with the
+        smallest priority in the heap
+        '''
+
+        # Check for empty heap
+        if self.current_size < 1:
+            raise IndexError('Cannot dequeue from an empty heap!')
+
+        # Smallest priority item is always heap[1]
+        min_item = self.heap_list[1]
+        min_priority = self.heap_priorities[1]
+        del self.positions[min_item]
+
+        # Move the last item to the root and percolate it down
+        last_item, last_priority = self._pop_last()
+        if self.current_size > 0:
+            self.heap_list[1] = last_item
+            self.heap_priorities[1] = last_priority
+            self._percolate_down(1)
+
+        # Return the minimum item and its priority
+        return min_item, min_priority
+
+    def remove(self, item):
+        '''
+        Remove an item from anywhere in the heap and return its priority
+        '''
+        return self._remove_at(self._position(item))[1]
+
+    def decrease_key(self, item, priority):
+        '''
+        Lower the priority of an item already in the heap
+        '''
+
+        # Check the new priority is not larger
+        idx = self._position(item)
+        if self.heap_priorities[idx] < priority:
+            err_msg = 'New priority: %s is larger than current: %s!' \
+                      % (str(priority), str(self.heap_priorities[idx]))
+            raise ValueError(err_msg)
+
+        # Update priority and percolate it up from its position
+        self.heap_priorities[idx] = priority
+        self._percolate_up(idx)
+
+    def priority(self, item):
+        '''
+        Return the current priority of an item in the heap
+        '''
+        return self.heap_priorities[self._position(item)]
+
+    def build_heap(self, in_list):
+        '''
+        Build a heap from an unsorted input list of (item, priority)
+        pairs in O(n) time
+        '''
+
+        # Build the lists and positions, checking items are unique
+        # before the heap is changed
+        in_list = list(in_list)
+        heap_list = [0] + [item for item, priority in in_list]
+        heap_priorities = [None] + [priority for item, priority in in_list]
+        positions = dict((item, idx) for idx, item in
+                         enumerate(heap_list[1:], 1))
+        if len(positions) != len(in_list):
+            raise KeyError('Items in the heap must be unique!')
+
+        # Set heap to [0, ...(items)] and set size
+        self.heap_list = heap_list
+        self.heap_priorities = heap_priorities
+        self.positions = positions
         self.current_size = len(in_list)
-        # Start percolating down from parents of leaves
-        # Since it is a complete tree, len//2 as a start guarantees
-        # Percolating from right-to-left, bottom-to-top via idx-=1
-        idx = self.current_size//2
-        while idx > 0:
-            # Percolate parent level down
-            self._percolate_down(idx)
-            # Move idx base up and repeat downward percolation of rest
-            idx -= 1
+
+        # Percolate down from the last parent back to the root
+        self._heapify()
+
+    def __contains__(self, item):
+        '''
+        Enable in operator to check if an item is in the heap
+        '''
+        return item in self.positions
+
+
+class _ReversedKey(object):
+    '''
+    Wrapper that orders keys in reverse, so a min heap of wrapped keys
+    acts as a max heap of the keys; the heap only compares with <
+    '''
+
+    __slots__ = ('key',)
+
+    def __init__(self, key):
+        '''
+        Init the wrapper around key
+        '''
+        self.key = key
+
+    def __lt__(self, other):
+        '''
+        Order wrapped keys from largest to smallest
+        '''
+        return other.key < self.key
+
+
+def k_largest(keys, num_keys, arity=2):
+    '''
+    Find the num_keys largest of keys in one pass using a bounded
+    BinaryHeap, in O(n log(num_keys)) time and O(num_keys) memory, so
+    keys can be a stream of any length
+
+    Parameters
+    ----------
+    keys : iterable
+        the keys to search
+    num_keys : integer
+        the number of keys to return
+    arity : integer (optional); default=2
+        the number of children of every node in the heap
+
+    Returns
+    -------
+    largest : list
+        the num_keys largest keys, from largest to smallest; fewer if
+        keys runs out
+    '''
+
+    # No keys wanted
+    if num_keys < 1:
+        return []
+
+    # Stream keys through a heap of the largest seen so far
+    heap = BinaryHeap(arity, max_size=num_keys)
+    heap.push_many(keys)
+    largest = heap.pop_many(num_keys)
+    largest.reverse()
+
+    # Return the keys from largest to smallest
+    return largest
+
+
+def k_smallest(keys, num_keys, arity=2):
+    '''
+    Find the num_keys smallest of keys in one pass using a bounded
+    BinaryHeap, in O(n log(num_keys)) time and O(num_keys) memory, so
+    keys can be a stream of any length
+
+    Parameters
+    ----------
+    keys : iterable
+        the keys to search
+    num_keys : integer
+        the number of keys to return
+    arity : integer (optional); default=2
+        the number of children of every node in the heap
+
+    Returns
+    -------
+    smallest : list
+        the num_keys smallest keys, from smallest to largest; fewer if
+        keys runs out
+    '''
+
+    # Import packages
+    from itertools import islice
+
+    # No keys wanted
+    if num_keys < 1:
+        return []
+
+    # Init variables; the heap holds reversed keys, so its root is the
+    # largest of the smallest keys seen so far
+    keys = iter(keys)
+    heap = BinaryHeap(arity, max_size=num_keys)
+    heap.push_many(_ReversedKey(key) for key in islice(keys, num_keys))
+    heap_list = heap.heap_list
+    percolate_down = heap._percolate_down
+
+    # Most keys are rejected by one compare against the root before
+    # they are wrapped; kept keys reuse the root's wrapper
+    if heap.current_size == num_keys:
+        for key in keys:
+            if key < heap_list[1].key:
+                heap_list[1].key = key
+                percolate_down(1)
+
+    # Dequeue from largest to smallest, then reverse
+    smallest = [wrapped.key for wrapped in heap.pop_many(num_keys)]
+    smallest.reverse()
+
+    # Return the keys from smallest to largest
+    return smallest
+
+
+def merge_sorted(iterables, arity=2):
+    '''
+    Lazily merge sorted iterables into one sorted stream using a
+    BinaryHeap that holds the next key of each iterable, so memory is
+    O(k) for k iterables however long they are. Equal keys come out in
+    the order of the iterables they came from
+
+    Parameters
+    ----------
+    iterables : list
+        sorted iterables (lists, generators, files, ...) to merge
+    arity : integer (optional); default=2
+        the number of children of every node in the heap
+
+    Yields
+    ------
+    key : object
+        the next smallest key across all of the iterables
+    '''
+
+    # Init variables; entries are (key, source, next), with the source
+    # index breaking ties so the next methods are never compared
+    entries = []
+    for source, iterable in enumerate(iterables):
+        next_key = iter(iterable).next
+        try:
+            entries.append((next_key(), source, next_key))
+        except StopIteration:
+            pass
+    heap = BinaryHeap(arity)
+    heap.build_heap(entries)
+    heap_list = heap.heap_list
+    percolate_down = heap._percolate_down
+
+    # Yield the root, then replace it with the next key of its source
+    while heap.current_size > 1:
+        key, source, next_key = heap_list[1]
+        yield key
+        try:
+            heap_list[1] = (next_key(), source, next_key)
+        except StopIteration:
+            heap.dequeue_min()
+        else:
+            percolate_down(1)
+
+    # Last source left, so stream it directly
+    if heap.current_size:
+        key, source, next_key = heap_list[1]
+        yield key
+        while True:
+            try:
+                key = next_key()
+            except StopIteration:
+                return
+            yield key
+
+
+def merge_sorted_files(file_paths, arity=2):
+    '''
+    Lazily merge text files with sorted lines into one sorted stream of
+    lines, reading a line at a time from each file, so memory is O(k)
+    for k files however big they are
+
+    Parameters
+    ----------
+    file_paths : list
+        paths to the text files, each sorted line by line
+    arity : integer (optional); default=2
+        the number of children of every node in the heap
+
+    Yields
+    ------
+    line : string
+        the next smallest line across all of the files, without its
+        trailing newline
+    '''
+
+    # Open every file, making sure they are all closed when done
+    files = []
+    try:
+        for file_path in file_paths:
+            files.append(open(file_path, 'r'))
+        lines = [(line.rstrip('\n') for line in sfile) for sfile in files]
+        for line in merge_sorted(lines, arity):
+            yield line
+    finally:
+        for sfile in files:
+            sfile.close()
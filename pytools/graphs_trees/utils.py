@@ -68,10 +68,60 @@ def _get_min_height(tree):
     return min_height
 
 
+class TreeCheckReport(object):
+    '''
+    Result of a tree check; it is truthy when the tree passed, and
+    otherwise holds the path of nodes from the root to the node where
+    the check failed and a message saying why
+    '''
+
+    def __init__(self, is_valid, path=None, message=''):
+        '''
+        Init TreeCheckReport
+
+        Parameters
+        ----------
+        is_valid : boolean
+            flag indicating if the tree passed the check
+        path : list (optional); default=None
+            the nodes from the root to the offending node
+        message : string (optional); default=''
+            why the check failed
+        '''
+
+        # Populate contents
+        self.is_valid = is_valid
+        self.path = path or []
+        self.message = message
+
+    def path_values(self, attr='value'):
+        '''
+        Return the attr of every node on the offending path
+        '''
+        return [getattr(node, attr) for node in self.path]
+
+    def __nonzero__(self):
+        '''
+        Evaluate as the is_valid flag
+        '''
+        return self.is_valid
+
+    def __repr__(self):
+        '''
+        Show the result and message
+        '''
+        if self.is_valid:
+            return 'TreeCheckReport(valid)'
+        return 'TreeCheckReport(invalid: %s)' % self.message
+
+
 def check_tree_balanced(tree):
     '''
     This function checks to see if a binary tree is balanced, such that
-    no two leaf nodes differ in distance from the root by more than one
+    no two leaf nodes differ in distance from the root by more than one;
+    as with _get_max_height and _get_min_height, a node with one child
+    also ends a path one level below it. The tree is walked once,
+    iteratively, stopping as soon as two path ends are too far apart
 
     Parameters
     ----------
@@ -84,42 +134,145 @@ def check_tree_balanced(tree):
         flag indiciating if input tree is balanced or not
     '''
 
-    # Get max and min heights in tree
-    max_height = _get_max_height(tree)
-    min_height = _get_min_height(tree)
-
-    # It is balanced if the difference is <= 1
-    balanced = (max_height - min_height) <= 1
+    # Init variables
+    if not tree:
+        return True
+    max_height = 0
+    min_height = None
+    node_stack = [(tree, 0)]
+
+    # Depth-first, so deep paths are reached early
+    while node_stack:
+        node, depth = node_stack.pop()
+        left, right = node.left_child, node.right_child
+        if left and right:
+            node_stack.append((right, depth + 1))
+            node_stack.append((left, depth + 1))
+            continue
+        # A leaf ends a path here, a single child one level down
+        if left or right:
+            node_stack.append((left or right, depth + 1))
+            end = depth + 1
+        else:
+            end = depth
+        max_height = max(max_height, depth)
+        if min_height is None or end < min_height:
+            min_height = end
+        # It is balanced only while the difference is <= 1
+        if max_height - min_height > 1:
+            return False
 
     # Return balance flag
-    return balanced
+    return True
 
 
-def verify_tree_property(tree):
+def check_height_balanced(tree):
     '''
-    Traverse through the tree and assert that the parent is greater
-    than left child and less than right child
+    Check that the heights of the two subtrees of every node differ by
+    at most one, as in an AVL tree, in one iterative post-order walk
+    that stops at the first node that is out of balance
+
+    Parameters
+    ----------
+    tree : pytools.graph_trees.BinaryTree obj
+        tree to check; any nodes with left_child and right_child work
+
+    Returns
+    -------
+    report : TreeCheckReport
+        truthy if balanced; otherwise the path to the lowest node found
+        out of balance
     '''
 
     # Init variables
-    valid_l = True
-    valid_r = True
+    if not tree:
+        return TreeCheckReport(True)
+    # [node, children visited, left height, right height] from the root
+    # down to the node being visited
+    path = [[tree, 0, 0, 0]]
+
+    # Post-order walk keeping the path on the stack
+    while path:
+        frame = path[-1]
+        node, visited = frame[0], frame[1]
+        if visited < 2:
+            frame[1] += 1
+            child = node.left_child if visited == 0 else node.right_child
+            if child:
+                path.append([child, 0, 0, 0])
+            continue
+        # Both subtrees done
+        left_height, right_height = frame[2], frame[3]
+        if abs(left_height - right_height) > 1:
+            err_msg = 'Subtree heights %d (left) and %d (right) differ ' \
+                      'by more than 1' % (left_height, right_height)
+            return TreeCheckReport(False, [entry[0] for entry in path],
+                                   err_msg)
+        path.pop()
+        if path:
+            # Store the height in the parent slot for this side
+            path[-1][1 + path[-1][1]] = 1 + max(left_height, right_height)
+
+    # Every node was balanced
+    return TreeCheckReport(True)
+
+
+def validate_bst(tree, attr='value'):
+    '''
+    Check the tree is a binary search tree: every node is >= all nodes
+    in its left subtree and <= all nodes in its right subtree. Each node
+    is checked against the bounds set by all of its ancestors, not just
+    its parent, in one iterative walk that stops at the first violation
 
-    # Check left child recursively
-    if tree.left_child:
-        if tree.value < tree.left_child.value:
-            return False
-        valid_l = verify_tree_property(tree.left_child)
+    Parameters
+    ----------
+    tree : pytools.graph_trees.BinaryTree obj
+        tree to check; any nodes with left_child and right_child work
+    attr : string (optional); default='value'
+        the node attribute to compare; use 'key' for BinarySearchTree
+        and AVLTree nodes
 
-    # Check right child recursively
-    if tree.right_child:
-        if tree.value > tree.right_child.value:
-            return False
-        valid_r = verify_tree_property(tree.right_child)
+    Returns
+    -------
+    report : TreeCheckReport
+        truthy if a valid BST; otherwise the path to the first node
+        found outside its bounds
+    '''
 
-    # Return True only if both right and left are True
-    valid = (valid_l and valid_r)
-    return valid
+    # Init variables
+    if not tree:
+        return TreeCheckReport(True)
+    path = []
+    # (node, depth, low bound, high bound); None is unbounded
+    node_stack = [(tree, 0, None, None)]
+
+    # Pre-order walk narrowing the bounds on the way down
+    while node_stack:
+        node, depth, low, high = node_stack.pop()
+        del path[depth:]
+        path.append(node)
+        value = getattr(node, attr)
+        if (low is not None and value < low) or \
+                (high is not None and value > high):
+            err_msg = 'Value: %s is outside the bounds [%s, %s] set by ' \
+                      'its ancestors' % (str(value), str(low), str(high))
+            return TreeCheckReport(False, path, err_msg)
+        if node.right_child:
+            node_stack.append((node.right_child, depth + 1, value, high))
+        if node.left_child:
+            node_stack.append((node.left_child, depth + 1, low, value))
+
+    # Every node was within its bounds
+    return TreeCheckReport(True)
+
+
+def verify_tree_property(tree):
+    '''
+    Traverse through the tree and assert that the parent is greater
+    than everything in its left subtree and less than everything in its
+    right subtree
+    '''
+    return validate_bst(tree).is_valid
 
 
 def binary_tree_from_arr(arr, start, end):
@@ -166,6 +319,65 @@ def binary_tree_from_arr(arr, start, end):
     return tree_node
 
 
+def iter_levels(root, container='list', values=True):
+    '''
+    Lazily traverse a binary tree one level at a time, in a single
+    pass; each level is built once, left to right, in the container
+    asked for
+
+    Parameters
+    ----------
+    root : pytools.graphs_trees.trees.BinaryTree obj or None
+        root of the tree to traverse; BinarySearchTree nodes work too
+    container : string (optional); default='list'
+        'list' for a list per level, 'array' for a NumPy array per
+        level, or 'llist' for a pytools LinkedList per level with the
+        left-most node at its head
+    values : boolean (optional); default=True
+        collect node values if True, otherwise the nodes themselves
+
+    Yields
+    ------
+    level : list, numpy.ndarray or LinkedList
+        the nodes, or their values, at each depth from the root down
+    '''
+
+    # Test for valid input
+    if container not in ('list', 'array', 'llist'):
+        err_msg = 'Container: %s must be one of list, array or llist!' \
+                  % str(container)
+        raise ValueError(err_msg)
+
+    # Import packages
+    if container == 'array':
+        import numpy as np
+    elif container == 'llist':
+        from pytools.linked_lists import linked_lists
+
+    # Init variables
+    level = [root] if root is not None else []
+
+    # Build each level from the one above
+    while level:
+        next_level = []
+        for node in level:
+            if node.left_child is not None:
+                next_level.append(node.left_child)
+            if node.right_child is not None:
+                next_level.append(node.right_child)
+        items = [item.value for item in level] if values else level
+        if container == 'array':
+            yield np.array(items)
+        elif container == 'llist':
+            llist = linked_lists.LinkedList()
+            for item in reversed(items):
+                llist.insert(item)
+            yield llist
+        else:
+            yield items
+        level = next_level
+
+
 def llists_from_bst(bst):
     '''
     Create a linked list for all of the nodes at each depth in the
@@ -182,36 +394,239 @@ def llists_from_bst(bst):
 
     # Init variables
     llists = []
-    llist = linked_lists.LinkedList()
-
-    # Populate first linked list from root
-    llist.insert(bst)
-    llists.append(llist)
-
-    # Iterate through llists
-    for llist in llists:
-        node = llist.head
-        llist2 = linked_lists.LinkedList()
-        while node:
-            if node.data.left_child:
-                llist2.insert(node.data.left_child)
-            if node.data.right_child:
-                llist2.insert(node.data.right_child)
-            node = node.next_node
-        if not llist2.head:
-            break
-        llists.append(llist2)
-
-    # Convert linked lists of bst's to values
-    for llist in llists:
-        node = llist.head
-        while node:
-            node.data = node.data.value
-            node = node.next_node
+    # Nodes at the current depth in the order of their linked list
+    level = [bst]
+
+    # Each list holds the children of the list above pushed onto its
+    # head in order, so a level's order is the reverse of that
+    while level:
+        llist = linked_lists.LinkedList()
+        next_level = []
+        for node in level:
+            if node.left_child:
+                next_level.append(node.left_child)
+            if node.right_child:
+                next_level.append(node.right_child)
+        for node in reversed(level):
+            llist.insert(node.value)
+        llists.append(llist)
+        next_level.reverse()
+        level = next_level
 
     return llists
 
 
+def iter_pre_order(root, values=True):
+    '''
+    Lazily traverse a binary tree in pre-order, that is:
+    root, left, right - using a stack
+
+    Parameters
+    ----------
+    root : pytools.graphs_trees.trees.BinaryTree obj or None
+        root of the tree to traverse
+    values : boolean (optional); default=True
+        yield node values if True, otherwise the nodes themselves
+
+    Yields
+    ------
+    node or value : object
+        each node, or its value, in pre-order
+    '''
+
+    # Init variables
+    node_stack = [root] if root is not None else []
+
+    # Visit each node before pushing its children, right under left
+    while node_stack:
+        node = node_stack.pop()
+        yield node.value if values else node
+        if node.right_child is not None:
+            node_stack.append(node.right_child)
+        if node.left_child is not None:
+            node_stack.append(node.left_child)
+
+
+def iter_in_order(root, values=True):
+    '''
+    Lazily traverse a binary tree in in-order, that is:
+    left, root, right - using a stack of the current left spine
+
+    Parameters
+    ----------
+    root : pytools.graphs_trees.trees.BinaryTree obj or None
+        root of the tree to traverse
+    values : boolean (optional); default=True
+        yield node values if True, otherwise the nodes themselves
+
+    Yields
+    ------
+    node or value : object
+        each node, or its value, in in-order
+    '''
+
+    # Init variables
+    node_stack = []
+    node = root
+
+    # Push the left spine, then visit and move to the right subtree
+    while node_stack or node is not None:
+        while node is not None:
+            node_stack.append(node)
+            node = node.left_child
+        node = node_stack.pop()
+        yield node.value if values else node
+        node = node.right_child
+
+
+def iter_post_order(root, values=True):
+    '''
+    Lazily traverse a binary tree in post-order, that is:
+    left, right, root - using a stack of the current path
+
+    Parameters
+    ----------
+    root : pytools.graphs_trees.trees.BinaryTree obj or None
+        root of the tree to traverse
+    values : boolean (optional); default=True
+        yield node values if True, otherwise the nodes themselves
+
+    Yields
+    ------
+    node or value : object
+        each node, or its value, in post-order
+    '''
+
+    # Init variables
+    node_stack = []
+    node = root
+    last_visited = None
+
+    # A node is visited once its right subtree is done
+    while node_stack or node is not None:
+        if node is not None:
+            node_stack.append(node)
+            node = node.left_child
+            continue
+        right = node_stack[-1].right_child
+        if right is not None and right is not last_visited:
+            node = right
+        else:
+            last_visited = node_stack.pop()
+            yield last_visited.value if values else last_visited
+
+
+def iter_level_order(root, values=True):
+    '''
+    Lazily traverse a binary tree in level-order (breadth-first), left
+    to right within each level
+
+    Parameters
+    ----------
+    root : pytools.graphs_trees.trees.BinaryTree obj or None
+        root of the tree to traverse
+    values : boolean (optional); default=True
+        yield node values if True, otherwise the nodes themselves
+
+    Yields
+    ------
+    node or value : object
+        each node, or its value, in level-order
+    '''
+
+    # Import packages
+    import collections
+
+    # Init variables
+    node_queue = collections.deque([root] if root is not None else [])
+
+    # Visit in the order nodes were queued
+    while node_queue:
+        node = node_queue.popleft()
+        yield node.value if values else node
+        if node.left_child is not None:
+            node_queue.append(node.left_child)
+        if node.right_child is not None:
+            node_queue.append(node.right_child)
+
+
+def _morris_visits(root):
+    '''
+    Yield the nodes of a binary tree in in-order by Morris traversal;
+    the tree is only back to its original links once this is exhausted
+    '''
+
+    # Init variables
+    node = root
+
+    # Walk down left subtrees and back up the threads
+    while node is not None:
+        # No left subtree, visit and go right (maybe up a thread)
+        if node.left_child is None:
+            yield node
+            node = node.right_child
+            continue
+        # Find the in-order predecessor in the left subtree
+        pred = node.left_child
+        while pred.right_child is not None and pred.right_child is not node:
+            pred = pred.right_child
+        # Thread it back to node and walk the left subtree
+        if pred.right_child is None:
+            pred.right_child = node
+            node = node.left_child
+        # Back from the left subtree, remove the thread and visit
+        else:
+            pred.right_child = None
+            yield node
+            node = node.right_child
+
+
+def iter_morris_in_order(root, values=True):
+    '''
+    Lazily traverse a binary tree in in-order with O(1) extra space
+    (Morris traversal): instead of a stack, the right child of each
+    node's in-order predecessor is pointed back at the node while its
+    left subtree is walked, and reset once the walk returns. The tree
+    is temporarily modified, so it must not be changed or traversed
+    otherwise until the generator is done; if it is closed early, the
+    rest of the walk runs without yielding to undo the threads
+
+    Parameters
+    ----------
+    root : pytools.graphs_trees.trees.BinaryTree obj or None
+        root of the tree to traverse
+    values : boolean (optional); default=True
+        yield node values if True, otherwise the nodes themselves
+
+    Yields
+    ------
+    node or value : object
+        each node, or its value, in in-order
+    '''
+
+    # Init variables
+    visits = _morris_visits(root)
+
+    try:
+        for node in visits:
+            yield node.value if values else node
+    finally:
+        # Finish the walk so every thread is removed
+        for node in visits:
+            pass
+
+
+def _join_values(values):
+    '''
+    Join values into the space separated (and terminated) string the
+    traversal functions return
+    '''
+
+    # Each value is followed by a space
+    out_str = ' '.join([str(value) for value in values])
+    return out_str + ' ' if out_str else out_str
+
+
 def pre_order_traverse(root):
     '''
     Traverse a binary tree in pre-order, that is:
@@ -220,19 +635,21 @@ def pre_order_traverse(root):
     :param root:
     :return:
     '''
+    return _join_values(iter_pre_order(root))
 
-    stack = [root]
-    out_str = ''
 
-    while len(stack) > 0:
-        node = stack.pop()
-        if node.right_child:
-            stack.append(node.right_child)
-        if node.left_child:
-            stack.append(node.left_child)
-        out_str += str(node.value) + ' '
+def _pre_order_recursive(root, out_list):
+    '''
+    Append the values of a binary tree to out_list in pre-order,
+    recursively
+    '''
 
-    return out_str
+    if not root:
+        return
+
+    out_list.append(root.value)
+    _pre_order_recursive(root.left_child, out_list)
+    _pre_order_recursive(root.right_child, out_list)
 
 
 def pre_order_recursive(root):
@@ -244,37 +661,21 @@ def pre_order_recursive(root):
     :return:
     '''
 
-    if not root:
-        return ''
-
-    out_str = str(root.value) + ' '
-
-    out_str += pre_order_recursive(root.left_child)
-    out_str += pre_order_recursive(root.right_child)
+    out_list = []
+    _pre_order_recursive(root, out_list)
 
-    return out_str
+    return _join_values(out_list)
 
 
 def post_order_traverse(root):
     '''
     Traverse the binary tree in post-order, that is:
-    left, right, root - recursively
+    left, right, root
 
     :param root:
     :return:
     '''
-
-    if not root:
-        return ''
-
-    out_str = ''
-
-    out_str += post_order_traverse(root.left_child)
-    out_str += post_order_traverse(root.right_child)
-
-    out_str += str(root.value) + ' '
-
-    return out_str
+    return _join_values(iter_post_order(root))
 
 
 def in_order_traverse(root):
@@ -285,17 +686,7 @@ def in_order_traverse(root):
     :param root:
     :return:
     '''
-
-    if not root:
-        return ''
-
-    out_str = ''
-
-    out_str += in_order_traverse(root.left_child)
-    out_str += str(root.value) + ' '
-    out_str += in_order_traverse(root.right_child)
-
-    return out_str
+    return _join_values(iter_in_order(root))
 
 
 def _max_depth(node, cnt, paths):
@@ -355,4 +746,337 @@ def max_depth2(node):
             stack.append(node.right_child)
             dstack.append(depth+1)
 
-    return max
\ No newline at end of file
+    return max
+
+class ArrayTree(object):
+    '''
+    Binary tree stored as parallel NumPy arrays instead of one
+    BinaryTree object per node: values[i] is the value of node i and
+    left[i] and right[i] are the indices of its children, or -1 if it
+    has none. The utilities on it are vectorized or iterative, so they
+    work on trees of tens of millions of nodes at any depth
+    '''
+
+    def __init__(self, values, left, right, root=0):
+        '''
+        Init ArrayTree from its arrays
+
+        Parameters
+        ----------
+        values : array_like
+            the value of each node
+        left : array_like
+            the index of the left child of each node, -1 for none
+        right : array_like
+            the index of the right child of each node, -1 for none
+        root : integer (optional); default=0
+            the index of the root node; -1 for an empty tree
+        '''
+
+        # Import packages
+        import numpy as np
+
+        # Test for valid input
+        self.values = np.asarray(values)
+        self.left = np.asarray(left, dtype=np.int64)
+        self.right = np.asarray(right, dtype=np.int64)
+        if not len(self.values) == len(self.left) == len(self.right):
+            err_msg = 'Got %d values with %d left and %d right children!' \
+                      % (len(self.values), len(self.left), len(self.right))
+            raise ValueError(err_msg)
+
+        # Populate contents
+        self.root = root if len(self.values) else -1
+
+    @classmethod
+    def from_binary_tree(cls, tree):
+        '''
+        Convert a pointer-based BinaryTree to an ArrayTree, numbering
+        the nodes in level order from the root at 0
+
+        Parameters
+        ----------
+        tree : pytools.graphs_trees.trees.BinaryTree obj or None
+            the root of the tree to convert
+
+        Returns
+        -------
+        array_tree : ArrayTree
+            the tree as arrays; empty if tree is None
+        '''
+
+        # Init variables
+        nodes = [tree] if tree is not None else []
+        values = []
+        left = []
+        right = []
+
+        # Number each child as it is first seen
+        for node in nodes:
+            values.append(node.value)
+            for child, links in ((node.left_child, left),
+                                 (node.right_child, right)):
+                if child is None:
+                    links.append(-1)
+                else:
+                    links.append(len(nodes))
+                    nodes.append(child)
+
+        # Return the array tree
+        return cls(values, left, right)
+
+    @classmethod
+    def from_sorted(cls, arr):
+        '''
+        Build the minimum height tree of a sorted array, the same shape
+        binary_tree_from_arr builds, one whole level at a time
+
+        Parameters
+        ----------
+        arr : array_like
+            a sorted array of numbers
+
+        Returns
+        -------
+        array_tree : ArrayTree
+            the tree with nodes numbered in level order
+        '''
+
+        # Import packages
+        import numpy as np
+
+        # Init variables
+        arr = np.asarray(arr)
+        num_nodes = len(arr)
+        values = np.empty_like(arr)
+        left = np.full(num_nodes, -1, dtype=np.int64)
+        right = np.full(num_nodes, -1, dtype=np.int64)
+        # Index ranges of arr still to build and their node ids
+        low = np.zeros(min(num_nodes, 1), dtype=np.int64)
+        high = low + num_nodes - 1
+        ids = low.copy()
+
+        # Each range is rooted at its middle value
+        while ids.size:
+            mid = (low + high)//2
+            values[ids] = arr[mid]
+            has_left = low < mid
+            has_right = mid < high
+            # Number the next level, left child before right per node
+            next_ids = ids[-1] + 1 + np.cumsum(np.column_stack(
+                (has_left, has_right)).ravel()) - 1
+            next_ids = next_ids.reshape(-1, 2)
+            left[ids[has_left]] = next_ids[has_left, 0]
+            right[ids[has_right]] = next_ids[has_right, 1]
+            # Child ranges, interleaved in the same order as their ids
+            child_low = np.column_stack((low, mid + 1)).ravel()
+            child_high = np.column_stack((mid - 1, high)).ravel()
+            keep = np.column_stack((has_left, has_right)).ravel()
+            low = child_low[keep]
+            high = child_high[keep]
+            ids = next_ids.ravel()[keep]
+
+        # Return the array tree
+        return cls(values, left, right)
+
+    def to_binary_tree(self):
+        '''
+        Convert to a pointer-based BinaryTree
+
+        Returns
+        -------
+        tree : pytools.graphs_trees.trees.BinaryTree obj or None
+            the root of the tree; None if it is empty
+        '''
+
+        # Import packages
+        from pytools.graphs_trees import trees
+
+        # One node per value, then link them up
+        nodes = [trees.BinaryTree(value) for value in self.values.tolist()]
+        for node, left, right in zip(nodes, self.left.tolist(),
+                                     self.right.tolist()):
+            if left >= 0:
+                node.left_child = nodes[left]
+            if right >= 0:
+                node.right_child = nodes[right]
+
+        # Return the root
+        return nodes[self.root] if self.root >= 0 else None
+
+    def parents(self):
+        '''
+        Return the index of the parent of each node, -1 for the root
+        '''
+
+        # Import packages
+        import numpy as np
+
+        # Invert the child links
+        parent = np.full(len(self.values), -1, dtype=np.int64)
+        for links in (self.left, self.right):
+            has_child = links >= 0
+            parent[links[has_child]] = np.flatnonzero(has_child)
+
+        # Return the parents
+        return parent
+
+    def depths(self):
+        '''
+        Return the depth of each node, 0 for the root, by pointer
+        jumping: every node adds the depth gap to the ancestor it points
+        at and then points at that ancestor's ancestor, so a depth of d
+        takes log2(d) vectorized steps, even on a degenerate tree
+        '''
+
+        # Import packages
+        import numpy as np
+
+        # Init variables
+        jump = self.parents()
+        depth = (jump >= 0).astype(np.int64)
+        active = np.flatnonzero(jump >= 0)
+
+        # Double the jumps until every node points past the root
+        while active.size:
+            ancestor = jump[active]
+            depth[active] += depth[ancestor]
+            jump[active] = jump[ancestor]
+            active = active[jump[active] >= 0]
+
+        # Return the depths
+        return depth
+
+    def _height_bounds(self):
+        '''
+        Return the max and min heights from the root, matching
+        _get_max_height and _get_min_height: a missing child of a node
+        with one child counts as an empty subtree one level below it
+        '''
+
+        # Empty tree
+        if self.root < 0:
+            return 0, 0
+
+        # Leaves end paths at their depth; nodes with one child end a
+        # path one level down
+        depth = self.depths()
+        has_left = self.left >= 0
+        has_right = self.right >= 0
+        is_leaf = ~(has_left | has_right)
+        one_child = has_left ^ has_right
+        max_height = depth.max()
+        min_height = depth[is_leaf].min()
+        if one_child.any():
+            min_height = min(min_height, depth[one_child].min() + 1)
+
+        # Return both heights
+        return int(max_height), int(min_height)
+
+    def max_height(self):
+        '''
+        Return the maximum height between the root and a leaf, which is
+        also what max_depth and max_depth2 return
+        '''
+        return self._height_bounds()[0]
+
+    def min_height(self):
+        '''
+        Return the minimum height between the root and a leaf
+        '''
+        return self._height_bounds()[1]
+
+    def is_balanced(self):
+        '''
+        Check the tree is balanced, as check_tree_balanced does
+        '''
+
+        # It is balanced if the difference is <= 1
+        max_height, min_height = self._height_bounds()
+        return (max_height - min_height) <= 1
+
+    def traverse(self, order='in'):
+        '''
+        Return the node indices in a traversal order, iteratively
+
+        Parameters
+        ----------
+        order : string (optional); default='in'
+            'pre' (root, left, right), 'in' (left, root, right), 'post'
+            (left, right, root) or 'level' (breadth-first)
+
+        Returns
+        -------
+        indices : numpy.ndarray
+            the node indices in order; self.values[indices] gives the
+            values
+        '''
+
+        # Import packages
+        import collections
+        import numpy as np
+
+        # Init variables; plain lists index faster than arrays here
+        left = self.left.tolist()
+        right = self.right.tolist()
+        root = self.root
+        indices = []
+
+        # Root, left, right (reversed, left, right, root)
+        if order in ('pre', 'post'):
+            first, second = (right, left) if order == 'pre' else (left, right)
+            node_stack = [root] if root >= 0 else []
+            while node_stack:
+                node = node_stack.pop()
+                indices.append(node)
+                if first[node] >= 0:
+                    node_stack.append(first[node])
+                if second[node] >= 0:
+                    node_stack.append(second[node])
+            if order == 'post':
+                indices.reverse()
+        # Left, root, right
+        elif order == 'in':
+            node_stack = []
+            node = root
+            while node_stack or node >= 0:
+                while node >= 0:
+                    node_stack.append(node)
+                    node = left[node]
+                node = node_stack.pop()
+                indices.append(node)
+                node = right[node]
+        # Breadth-first
+        elif order == 'level':
+            node_queue = collections.deque([root] if root >= 0 else [])
+            while node_queue:
+                node = node_queue.popleft()
+                indices.append(node)
+                if left[node] >= 0:
+                    node_queue.append(left[node])
+                if right[node] >= 0:
+                    node_queue.append(right[node])
+        else:
+            err_msg = 'Order: %s must be one of pre, in, post or level!' \
+                      % str(order)
+            raise ValueError(err_msg)
+
+        # Return the indices
+        return np.array(indices, dtype=np.int64)
+
+    def is_bst(self):
+        '''
+        Check every value is >= all values in its left subtree and <=
+        all values in its right subtree, that is, the in-order values
+        never decrease
+        '''
+
+        # Compare neighbors in the in-order sequence
+        in_order = self.values[self.traverse('in')]
+        return bool((in_order[1:] >= in_order[:-1]).all())
+
+    def __len__(self):
+        '''
+        Return the number of nodes in the tree
+        '''
+        return len(self.values)
@@ -1,55 +1,300 @@
-def findCoordDict(maze, rows, columns):
-    coord_dict = {}
-    for i in xrange(rows):
-        for j in xrange(columns):
-            paths = []
-            if maze[i][j] == 1:
+# pytools/puzzles/maze.py
+#
+# Author: Daniel Clark, 2016
+
+'''
+This module contains functions to find shortest paths through mazes
+stored as grids, where 0 is an open cell and anything else is a wall;
+moves are up, down, left or right. The grids are searched as NumPy
+occupancy arrays with flat, per-cell distance and parent arrays
+'''
+
+# Frontiers narrower than this are expanded a cell at a time; below it
+# the fixed cost of a NumPy level outweighs the per-cell Python loop
+_SCALAR_FRONTIER = 256
+
+
+def _occupancy(grid):
+    '''
+    Convert a grid (NumPy array or list of lists) to a flat boolean
+    array of open cells and the grid shape
+    '''
+
+    # Import packages
+    import numpy as np
+
+    # Open cells are 0
+    grid = np.asarray(grid)
+    if grid.ndim != 2:
+        raise ValueError('Grid must be 2-dimensional, not %d!' % grid.ndim)
+    is_open = (grid == 0).ravel()
+
+    # Return open cells and shape
+    return is_open, grid.shape
+
+
+def _cell_index(cell, shape):
+    '''
+    Convert a (row, col) cell to its flat index, checking it is in the
+    grid
+    '''
+
+    # Check bounds
+    row, col = cell
+    if not (0 <= row < shape[0] and 0 <= col < shape[1]):
+        raise IndexError('Cell: %s is outside the grid!' % str(cell))
+
+    # Return flat index
+    return row*shape[1] + col
+
+
+def grid_bfs(grid, start, end=None):
+    '''
+    Breadth-first search of a grid in O(rows*cols) time; wide levels of
+    the search are expanded at once with NumPy, so the Python overhead
+    is per level instead of per cell, while narrow ones, such as in
+    corridors, are expanded a cell at a time from a deque, so long
+    paths do not pay the NumPy cost at every level
+
+    Parameters
+    ----------
+    grid : numpy.ndarray or list
+        2D grid where 0 is an open cell and anything else is a wall
+    start : tuple
+        (row, col) of the cell to start from
+    end : tuple (optional); default=None
+        (row, col) of a cell to stop the search at once it is reached
+
+    Returns
+    -------
+    dist : numpy.ndarray
+        int32 array the shape of grid with the number of moves from
+        start to every cell, or -1 where it was not reached
+    parent : numpy.ndarray
+        int32 array the shape of grid with the flat index of the cell
+        each cell was reached from, or -1 for start and unreached cells
+    '''
+
+    # Import packages
+    import numpy as np
+    from array import array
+    from collections import deque
+
+    # Init variables; the scalar and NumPy searches share the dist and
+    # parent buffers, which are fastest per cell as arrays
+    is_open, shape = _occupancy(grid)
+    num_rows, num_cols = shape
+    num_cells = is_open.size
+    open_cells = bytearray(is_open.view(np.uint8))
+    dist_buf = array('i', [-1]) * num_cells
+    parent_buf = array('i', [-1]) * num_cells
+    dist = np.frombuffer(dist_buf, dtype=np.int32)
+    parent = np.frombuffer(parent_buf, dtype=np.int32)
+    start_idx = _cell_index(start, shape)
+    end_idx = -1 if end is None else _cell_index(end, shape)
+    if is_open[start_idx]:
+        dist_buf[start_idx] = 0
+        frontier = np.array([start_idx], dtype=np.int64)
+    else:
+        frontier = np.array([], dtype=np.int64)
+    level = 0
+
+    # Expand one whole level of the search at a time
+    while frontier.size:
+        if end_idx >= 0 and dist_buf[end_idx] >= 0:
+            break
+
+        # Narrow frontier, so search a cell at a time until it widens
+        if frontier.size < _SCALAR_FRONTIER:
+            queue = deque(frontier.tolist())
+            while queue and len(queue) < _SCALAR_FRONTIER:
+                if end_idx >= 0 and dist_buf[end_idx] >= 0:
+                    break
+                level += 1
+                for _ in xrange(len(queue)):
+                    idx = queue.popleft()
+                    col = idx % num_cols
+                    # Up and down fall outside the grid at its edges
+                    for nbr in (idx - num_cols, idx + num_cols,
+                                idx - 1 if col > 0 else -1,
+                                idx + 1 if col < num_cols - 1 else -1):
+                        if 0 <= nbr < num_cells and open_cells[nbr] and \
+                                dist_buf[nbr] < 0:
+                            dist_buf[nbr] = level
+                            parent_buf[nbr] = idx
+                            queue.append(nbr)
+            frontier = np.array(queue, dtype=np.int64)
+            continue
+
+        level += 1
+        frontier_cols = frontier % num_cols
+        # Up, down, left and right neighbors that are in the grid
+        steps = [(frontier >= num_cols, -num_cols),
+                 (frontier < num_cells - num_cols, num_cols),
+                 (frontier_cols > 0, -1),
+                 (frontier_cols < num_cols - 1, 1)]
+        srcs = np.concatenate([frontier[valid] for valid, step in steps])
+        nbrs = np.concatenate([frontier[valid] + step
+                               for valid, step in steps])
+        # Keep open, unvisited neighbors, each found from one source
+        keep = is_open[nbrs] & (dist[nbrs] < 0)
+        nbrs, first = np.unique(nbrs[keep], return_index=True)
+        dist[nbrs] = level
+        parent[nbrs] = srcs[keep][first]
+        frontier = nbrs
+
+    # Return distances and parents in the grid shape
+    return dist.reshape(shape), parent.reshape(shape)
+
+
+def grid_astar(grid, start, end):
+    '''
+    A* search of a grid using the Manhattan distance to end as the
+    heuristic, which is exact on open grids, so far fewer cells are
+    expanded than a BFS when the path is direct
+
+    Parameters
+    ----------
+    grid : numpy.ndarray or list
+        2D grid where 0 is an open cell and anything else is a wall
+    start : tuple
+        (row, col) of the cell to start from
+    end : tuple
+        (row, col) of the cell to find the path to
+
+    Returns
+    -------
+    path : list or None
+        list of (row, col) cells from start to end, or None if end
+        cannot be reached
+    '''
+
+    # Import packages
+    import heapq
+    import numpy as np
+    from array import array
+
+    # Init variables; the per-cell loop runs faster on array/bytearray
+    # buffers than on NumPy scalars
+    is_open, shape = _occupancy(grid)
+    num_rows, num_cols = shape
+    num_cells = is_open.size
+    start_idx = _cell_index(start, shape)
+    end_idx = _cell_index(end, shape)
+    end_row, end_col = end
+    if not (is_open[start_idx] and is_open[end_idx]):
+        return None
+    is_open = bytearray(is_open.view(np.uint8))
+    closed = bytearray(num_cells)
+    moves = array('i', [-1]) * num_cells
+    parent = array('i', [-1]) * num_cells
+    moves[start_idx] = 0
+    # Ties on the estimate go to the cell with the most moves, so the
+    # search runs straight down one of the equally short paths
+    open_heap = [(abs(start[0] - end_row) + abs(start[1] - end_col), 0,
+                  start_idx)]
+
+    # Pop the most promising cell until end is reached
+    while open_heap:
+        est, neg_moves, idx = heapq.heappop(open_heap)
+        if idx == end_idx:
+            parent = np.frombuffer(parent, dtype=np.int32)
+            return grid_path(parent.reshape(shape), end)
+        if closed[idx]:
+            continue
+        closed[idx] = 1
+        row, col = divmod(idx, num_cols)
+        nbr_moves = moves[idx] + 1
+        for nbr_row, nbr_col in ((row-1, col), (row+1, col),
+                                 (row, col-1), (row, col+1)):
+            if not (0 <= nbr_row < num_rows and 0 <= nbr_col < num_cols):
                 continue
-            if i < rows - 1:
-                up = (i + 1, j)
-                if maze[i+1][j] == 0:
-                    paths.append(up)
-            # Down
-            if i > 0:
-                down = (i - 1, j)
-                if maze[i-1][j] == 0:
-                    paths.append(down)
-            # Left
-            if j > 0:
-                left = (i, j - 1)
-                if maze[i][j-1] == 0:
-                    paths.append(left)
-            # Right
-            if j < columns - 1:
-                right = (i, j + 1)
-                if maze[i][j+1] == 0:
-                    paths.append(right)
-            coord_dict[(i, j)] = paths
-
-    # return
-    return coord_dict
-
-
-def bfsCoords(maze, rows, columns, exitRow, exitCol):
-    # Start at entrance
-    import collections
-    coord_dict = findCoordDict(maze, rows, columns)
-    queue = collections.deque()
-    queue.append(((0, 0), []))
-    exit = (exitRow, exitCol)
-
-    # Breadth-first search
-    while len(queue) > 0:
-        # Get current position
-        coord, path = queue.popleft()
-
-        for nbr in coord_dict[coord]:
-            if nbr in path:
+            nbr = nbr_row*num_cols + nbr_col
+            if not is_open[nbr] or closed[nbr]:
                 continue
-            if nbr == exit:
-                yield path + [nbr]
-            else:
-                queue.append((nbr, path + [nbr]))
+            if moves[nbr] < 0 or nbr_moves < moves[nbr]:
+                moves[nbr] = nbr_moves
+                parent[nbr] = idx
+                nbr_est = nbr_moves + abs(nbr_row - end_row) + \
+                          abs(nbr_col - end_col)
+                heapq.heappush(open_heap, (nbr_est, -nbr_moves, nbr))
+
+    # Exhausted the reachable cells, so there is no path
+    return None
+
+
+def grid_path(parent, end):
+    '''
+    Reconstruct the path to end by following the parent indices from
+    grid_bfs or grid_astar back to the start
+
+    Parameters
+    ----------
+    parent : numpy.ndarray
+        2D array of parent flat indices, -1 for the start cell
+    end : tuple
+        (row, col) of the cell to build the path to
+
+    Returns
+    -------
+    path : list
+        list of (row, col) cells from the start to end
+    '''
+
+    # Import packages
+    import numpy as np
+    from array import array
+
+    # Init variables; the walk is per cell, which is faster on an array
+    # than on NumPy scalars
+    num_cols = parent.shape[1]
+    flat_parent = array('i', parent.astype(np.int32).tobytes())
+    idx = int(_cell_index(end, parent.shape))
+    path = []
+
+    # Walk the parents back to the start
+    while idx >= 0:
+        path.append(divmod(idx, num_cols))
+        idx = flat_parent[idx]
+    path.reverse()
+
+    # Return the path
+    return path
+
+
+def shortest_path(grid, start, end, method='bfs'):
+    '''
+    Find a shortest path between two cells of a grid
+
+    Parameters
+    ----------
+    grid : numpy.ndarray or list
+        2D grid where 0 is an open cell and anything else is a wall
+    start : tuple
+        (row, col) of the cell to start from
+    end : tuple
+        (row, col) of the cell to find the path to
+    method : string (optional); default='bfs'
+        'bfs' for grid_bfs or 'astar' for grid_astar
+
+    Returns
+    -------
+    path : list or None
+        list of (row, col) cells from start to end, or None if end
+        cannot be reached
+    '''
+
+    # Run the chosen search
+    if method == 'astar':
+        return grid_astar(grid, start, end)
+    elif method == 'bfs':
+        dist, parent = grid_bfs(grid, start, end)
+        if dist[end] < 0:
+            return None
+        return grid_path(parent, end)
+    else:
+        err_msg = 'Method: %s must be one of bfs or astar!' % str(method)
+        raise ValueError(err_msg)
 
 
 def findMinNumSteps(maze, rows, columns, exitRow, exitCol):
@@ -57,19 +302,19 @@ def findMinNumSteps(maze, rows, columns, exitRow, exitCol):
     Function to find the minimum steps from entrance of maze to exit
     '''
 
-    import sys
+    # Import packages
+    import numpy as np
 
-    shortest = sys.maxint
-    for path in bfsCoords(maze, rows, columns, exitRow, exitCol):
-        if len(path) < shortest:
-            shortest = len(path)
-    if shortest == sys.maxint:
-        return -1
+    # Search from the entrance, stopping at the exit
+    maze = np.asarray(maze)[:rows, :columns]
+    dist, parent = grid_bfs(maze, (0, 0), (exitRow, exitCol))
 
-    return shortest
+    # Return -1 if the exit was not reached
+    return int(dist[exitRow, exitCol])
 
 
-print(findMinNumSteps([[0, 0, 0, 0],
-                       [1, 0, 1, 0],
-                       [1, 0, 0, 0]],
-                      3, 4, 1, 1))
\ No newline at end of file
+if __name__ == '__main__':
+    print(findMinNumSteps([[0, 0, 0, 0],
+                           [1, 0, 1, 0],
+                           [1, 0, 0, 0]],
+                          3, 4, 1, 1))
@@ -7,92 +7,980 @@ This module contains functions to solve problems related to hash table
 manipulation and testing
 '''
 
+# Marks the hash slot of a deleted key, so probes carry on past it
+_DELETED = object()
+
+# IntHashTable slots hold 64-bit ints; the two smallest values mark
+# empty and deleted slots, so they cannot be keys
+_INT64_MAX = int(2**63 - 1)
+_EMPTY_KEY = int(-2**63)
+_DELETED_KEY = _EMPTY_KEY + 1
+
+# Fibonacci hashing: hashes are multiplied by 2**63 over the golden
+# ratio, rounded to odd, mod 2**63, and the top bits of the product
+# pick the home slot, so keys that differ only in their high bits are
+# spread out too; 63 bits keep the products plain ints on Python 2.
+# Keys a power of two apart only see the low bits of the multiplier,
+# so the product's high bits are folded down and multiplied once more
+_FIB_MULT = 0x4F1BBCDCBFA53E0B
+_HASH_BITS = 63
+_HASH_MASK = 2**_HASH_BITS - 1
+_FOLD_BITS = 31
+
+
+def _int64_array(size, fill):
+    '''
+    Return an array.array of size 64-bit ints, all set to fill
+    '''
+
+    # Import packages
+    from array import array
+
+    # 'q' is missing from older Pythons, where a C long is 64 bits on
+    # LP64 platforms
+    try:
+        typecode = 'q'
+        array(typecode)
+    except ValueError:
+        typecode = 'l'
+
+    return array(typecode, [fill]) * size
+
+
+def _mix_hash(key_hash):
+    '''
+    Return the Fibonacci hash of key_hash, as a 63-bit product whose
+    top bits are the home slot
+    '''
+    product = (key_hash*_FIB_MULT) & _HASH_MASK
+    product ^= product >> _FOLD_BITS
+    return int((product*_FIB_MULT) & _HASH_MASK)
+
+
+def _home_slots(keys, shift):
+    '''
+    Return the home slot of every int in the int64 NumPy array keys,
+    the top bits of its Fibonacci hash above shift, as an int64 array;
+    the uint64 multiplies wrap around mod 2**64, then are cut to 63 bits
+    '''
+
+    # Import packages
+    import numpy as np
+
+    # Init variables
+    fib_mult = np.uint64(_FIB_MULT)
+    hash_mask = np.uint64(_HASH_MASK)
+
+    # Multiply, fold and multiply again, as _mix_hash does
+    products = keys.astype(np.uint64)*fib_mult & hash_mask
+    products ^= products >> np.uint64(_FOLD_BITS)
+    products = products*fib_mult & hash_mask
+
+    return (products >> np.uint64(shift)).astype(np.int64)
+
+
 class HashTable(object):
     '''
     Implement a hash table that stores key/value pairs and provides
-    O(1) time access
+    O(1) time access; any hashable key can be used. Keys are kept with
+    open addressing in a power-of-two number of slots, which doubles
+    once the slots in use pass the max_load fraction. Hashes are
+    scrambled by Fibonacci hashing before they pick a home slot, so
+    int keys, whose hash is the int itself, do not pile up in one slot
+    when they differ only above the slot bits. Collisions are
+    resolved by one of these probing strategies:
+
+    linear - try the next slot; deletes leave a tombstone behind
+    quadratic - try slots 1, 2, 3, ... further on than the last, which
+    breaks up clusters; deletes leave a tombstone behind
+    robin_hood - linear probing where a key that is further from its
+    home slot takes the slot of one that is closer, which evens out
+    probe lengths; deletes shift the keys after them back instead of
+    leaving tombstones
+
+    stats() exports the load, the probe lengths of the keys, the
+    longest cluster of used slots and the resizes as a dict; with
+    track_stats, the probes taken by every lookup are counted as well
     '''
 
-    def __init__(self, size=11):
+    _PROBINGS = ('linear', 'quadratic', 'robin_hood')
+
+    def __init__(self, size=11, probing='linear', max_load=0.7,
+                 track_stats=False):
         '''
         Init HashTable object
+
+        Parameters
+        ----------
+        size : integer (optional); default=11
+            the initial number of slots, rounded up to a power of two
+        probing : string (optional); default='linear'
+            the probing strategy; 'linear', 'quadratic' or 'robin_hood'
+        max_load : float (optional); default=0.7
+            the fraction of slots in use (keys and tombstones) above
+            which the table is resized
+        track_stats : boolean (optional); default=False
+            count the slots probed by every put, get, delete and in
+            check; this costs a few operations a lookup
         '''
 
-        self.size = size
-        self.key_slots = [None] * size
-        self.val_slots = [None] * size
+        # Test for valid input
+        if probing not in self._PROBINGS:
+            err_msg = 'Probing: %s must be one of %s!' \
+                      % (str(probing), ', '.join(self._PROBINGS))
+            raise ValueError(err_msg)
+        if not 0 < max_load < 1:
+            err_msg = 'Max load: %s must be between 0 and 1!' % str(max_load)
+            raise ValueError(err_msg)
 
-    def _hash_function(self, key):
+        # Init variables
+        capacity = 8
+        while capacity < size:
+            capacity *= 2
+
+        # Populate contents
+        self.probing = probing
+        self.max_load = max_load
+        self._min_size = capacity
+        self._probe_counts = {} if track_stats else None
+        self.num_resizes = 0
+        self.resize_secs = 0.0
+        self._reset(capacity)
+
+    def _reset(self, capacity):
         '''
-        Hashing function to convert key into slot index
+        Empty the table and set it to capacity slots; the mixed hash
+        of the key in every slot is kept too, so probes compare keys
+        only on a hash match and resizes do not hash keys again
         '''
 
-        # Check key type
-        if isinstance(key, str) and len(key) == 1:
-            key = ord(key)
-        elif not isinstance(key, int):
-            err_msg = 'Key: %s must be a char or int type!' % str(key)
-            raise KeyError(err_msg)
+        self.size = capacity
+        self._shift = _HASH_BITS - capacity.bit_length() + 1
+        self.key_slots = [None] * capacity
+        self.val_slots = [None] * capacity
+        self.hash_slots = [None] * capacity
+        self.num_keys = 0
+        self.num_deleted = 0
+        self._max_used = int(capacity*self.max_load)
 
-        hash_index = key % self.size
-        return hash_index
+    def _resize(self, num_new=0):
+        '''
+        Rebuild the table, timing the rebuild
+        '''
+
+        # Import packages
+        import time
 
-    def _rehash_function(self, hash_index):
+        # Rebuild and add to the resize stats
+        start = time.time()
+        self._rebuild(num_new)
+        self.num_resizes += 1
+        self.resize_secs += time.time() - start
+
+    def _rebuild(self, num_new=0):
         '''
-        Re-hash function to incrementally move initial index if
-        slot at original index is full
+        Rebuild the table with the fewest slots, but no fewer than it
+        started with, that keeps the keys under half of max_load with
+        room for num_new more, dropping any tombstones; this doubles
+        the slots of a table full of keys
         '''
 
-        new_index = (hash_index+1)%self.size
-        return new_index
+        # Init variables
+        hash_slots = self.hash_slots
+        key_slots = self.key_slots
+        val_slots = self.val_slots
+        num_keys = self.num_keys
+        capacity = self._min_size
+        while capacity*self.max_load < 2*num_keys + num_new:
+            capacity *= 2
 
-    def put(self, key, value):
+        # Place every key again in the new slots; there are no
+        # tombstones or equal keys there, so no keys are compared
+        self._reset(capacity)
+        new_hashes = self.hash_slots
+        new_keys = self.key_slots
+        new_vals = self.val_slots
+        mask = capacity - 1
+        shift = self._shift
+        step_inc = 1 if self.probing == 'quadratic' else 0
+        robin_hood = self.probing == 'robin_hood'
+        for idx, key_hash in enumerate(hash_slots):
+            if key_hash is None or key_hash is _DELETED:
+                continue
+            key = key_slots[idx]
+            value = val_slots[idx]
+            new_idx = key_hash >> shift
+            step = 1
+            dist = 0
+            while new_hashes[new_idx] is not None:
+                # Robin Hood carries on with any key closer to home
+                if robin_hood:
+                    slot_hash = new_hashes[new_idx]
+                    slot_dist = (new_idx - (slot_hash >> shift)) & mask
+                    if slot_dist < dist:
+                        new_hashes[new_idx] = key_hash
+                        key, new_keys[new_idx] = new_keys[new_idx], key
+                        value, new_vals[new_idx] = new_vals[new_idx], value
+                        key_hash = slot_hash
+                        dist = slot_dist
+                    dist += 1
+                new_idx = (new_idx + step) & mask
+                step += step_inc
+            new_hashes[new_idx] = key_hash
+            new_keys[new_idx] = key
+            new_vals[new_idx] = value
+        self.num_keys = num_keys
+
+    def _find(self, key, key_hash):
         '''
-        Put key/value pair into hash table
+        Return the slot index of key, or -1 if it is not in the table
         '''
 
-        # Get the hash index
-        orig_hash_index = self._hash_function(key)
-        hash_index = orig_hash_index
+        # Init variables
+        hash_slots = self.hash_slots
+        key_slots = self.key_slots
+        mask = self.size - 1
+        shift = self._shift
+        home = idx = key_hash >> shift
+        step = 1
+        step_inc = 1 if self.probing == 'quadratic' else 0
+        found = False
+
+        # Robin Hood probes stop early at a key closer to its home
+        if self.probing == 'robin_hood':
+            dist = 0
+            while True:
+                slot_hash = hash_slots[idx]
+                if slot_hash is None:
+                    break
+                if slot_hash == key_hash:
+                    slot_key = key_slots[idx]
+                    if slot_key is key or slot_key == key:
+                        found = True
+                        break
+                if ((idx - (slot_hash >> shift)) & mask) < dist:
+                    break
+                idx = (idx + 1) & mask
+                dist += 1
+
+        # Probe until the key or an empty slot is found
+        else:
+            while True:
+                slot_hash = hash_slots[idx]
+                if slot_hash is None:
+                    break
+                if slot_hash == key_hash:
+                    slot_key = key_slots[idx]
+                    if slot_key is key or slot_key == key:
+                        found = True
+                        break
+                idx = (idx + step) & mask
+                step += step_inc
+
+        # Count the probes taken; quadratic steps grow by one a probe,
+        # other probes are one slot on from the last
+        probe_counts = self._probe_counts
+        if probe_counts is not None:
+            num_probes = step if step_inc else ((idx - home) & mask) + 1
+            probe_counts[num_probes] = probe_counts.get(num_probes, 0) + 1
+
+        return idx if found else -1
+
+    def _place(self, key_hash, key, value):
+        '''
+        Place a key that is not in the table into a free slot
+        '''
 
-        # While the slot is filled and containing another key
-        while self.key_slots[hash_index] is not None and \
-                self.key_slots[hash_index] != key:
+        # Init variables
+        hash_slots = self.hash_slots
+        key_slots = self.key_slots
+        val_slots = self.val_slots
+        mask = self.size - 1
+        shift = self._shift
+        idx = key_hash >> shift
 
-            # Get rehashed index
-            hash_index = self._rehash_function(hash_index)
+        # Robin Hood: take the slot of any key closer to its home and
+        # carry that key on instead
+        if self.probing == 'robin_hood':
+            dist = 0
+            while hash_slots[idx] is not None:
+                slot_dist = (idx - (hash_slots[idx] >> shift)) & mask
+                if slot_dist < dist:
+                    key_hash, hash_slots[idx] = hash_slots[idx], key_hash
+                    key, key_slots[idx] = key_slots[idx], key
+                    value, val_slots[idx] = val_slots[idx], value
+                    dist = slot_dist
+                idx = (idx + 1) & mask
+                dist += 1
 
-            # If we've gone all the way around
-            if hash_index == orig_hash_index:
-                err_msg = 'Key: %s cannot find unique slot, try increasing '\
-                          'hash table size or using a different key'
-                raise KeyError(err_msg)
+        # Otherwise the first empty slot or tombstone on the probe path
+        else:
+            step = 1
+            step_inc = 1 if self.probing == 'quadratic' else 0
+            while hash_slots[idx] is not None:
+                if hash_slots[idx] is _DELETED:
+                    self.num_deleted -= 1
+                    break
+                idx = (idx + step) & mask
+                step += step_inc
 
-        # Update key and val slots with key/val pair
-        self.key_slots[hash_index] = key
-        self.val_slots[hash_index] = value
+        # Fill the slot
+        hash_slots[idx] = key_hash
+        key_slots[idx] = key
+        val_slots[idx] = value
+
+    def put(self, key, value):
+        '''
+        Put key/value pair into hash table
+        '''
+
+        # Update the value of a key already in the table
+        key_hash = _mix_hash(hash(key))
+        if self.probing == 'robin_hood':
+            idx = self._find(key, key_hash)
+            if idx >= 0:
+                self.val_slots[idx] = value
+                return
+
+        # Otherwise one probe finds the key or the first free slot
+        else:
+            hash_slots = self.hash_slots
+            key_slots = self.key_slots
+            mask = self.size - 1
+            home = idx = key_hash >> self._shift
+            step = 1
+            step_inc = 1 if self.probing == 'quadratic' else 0
+            free_idx = -1
+            found = False
+            while True:
+                slot_hash = hash_slots[idx]
+                if slot_hash is None:
+                    break
+                if slot_hash is _DELETED:
+                    if free_idx < 0:
+                        free_idx = idx
+                elif slot_hash == key_hash:
+                    slot_key = key_slots[idx]
+                    if slot_key is key or slot_key == key:
+                        found = True
+                        break
+                idx = (idx + step) & mask
+                step += step_inc
+            probe_counts = self._probe_counts
+            if probe_counts is not None:
+                num_probes = step if step_inc else ((idx - home) & mask) + 1
+                probe_counts[num_probes] = probe_counts.get(num_probes, 0) + 1
+            if found:
+                self.val_slots[idx] = value
+                return
+            # A tombstone is reused without any more slots in use
+            if free_idx >= 0:
+                hash_slots[free_idx] = key_hash
+                key_slots[free_idx] = key
+                self.val_slots[free_idx] = value
+                self.num_deleted -= 1
+                self.num_keys += 1
+                return
+            if self.num_keys + self.num_deleted < self._max_used:
+                hash_slots[idx] = key_hash
+                key_slots[idx] = key
+                self.val_slots[idx] = value
+                self.num_keys += 1
+                return
+
+        # Make room, then place the new key
+        if self.num_keys + self.num_deleted >= self._max_used:
+            self._resize()
+        self._place(key_hash, key, value)
+        self.num_keys += 1
 
     def get(self, key):
         '''
         Get value from key
         '''
 
-        # Get first hash_index
-        orig_hash_index = self._hash_function(key)
-        hash_index = orig_hash_index
+        # Find the key's slot
+        idx = self._find(key, _mix_hash(hash(key)))
+        if idx < 0:
+            err_msg = 'Key: %s not located in hash table!' % str(key)
+            raise KeyError(err_msg)
+
+        return self.val_slots[idx]
+
+    def delete(self, key):
+        '''
+        Delete key and its value from the hash table
+        '''
+
+        # Find the key's slot
+        idx = self._find(key, _mix_hash(hash(key)))
+        if idx < 0:
+            err_msg = 'Key: %s not located in hash table!' % str(key)
+            raise KeyError(err_msg)
+        self.num_keys -= 1
+
+        # Leave a tombstone so probes carry on past the slot
+        if self.probing != 'robin_hood':
+            self.hash_slots[idx] = _DELETED
+            self.key_slots[idx] = None
+            self.val_slots[idx] = None
+            self.num_deleted += 1
+            return
+
+        # Robin Hood: shift the following keys back until one is empty
+        # or already in its home slot
+        hash_slots = self.hash_slots
+        key_slots = self.key_slots
+        val_slots = self.val_slots
+        mask = self.size - 1
+        shift = self._shift
+        next_idx = (idx + 1) & mask
+        while hash_slots[next_idx] is not None and \
+                (next_idx - (hash_slots[next_idx] >> shift)) & mask:
+            hash_slots[idx] = hash_slots[next_idx]
+            key_slots[idx] = key_slots[next_idx]
+            val_slots[idx] = val_slots[next_idx]
+            idx = next_idx
+            next_idx = (next_idx + 1) & mask
+        hash_slots[idx] = None
+        key_slots[idx] = None
+        val_slots[idx] = None
+
+    def probe_lengths(self):
+        '''
+        Return the number of slots probed to find each key, in slot
+        order; 1 means the key is in its home slot
+
+        Returns
+        -------
+        probe_lengths : list
+            list of the probe length of every key in the table
+        '''
+
+        # Init variables
+        mask = self.size - 1
+        shift = self._shift
+        probe_lengths = []
 
-        # While key is not found, rehash
-        while self.key_slots[hash_index] != key:
-            hash_index = self._rehash_function(hash_index)
+        # Linear probes are one per slot from home
+        for idx, key_hash in enumerate(self.hash_slots):
+            if key_hash is None or key_hash is _DELETED:
+                continue
+            if self.probing != 'quadratic':
+                probe_lengths.append(((idx - (key_hash >> shift)) & mask) + 1)
+                continue
+            # Quadratic probes are walked back from home
+            probe_idx = key_hash >> shift
+            num_probes = 1
+            while probe_idx != idx:
+                probe_idx = (probe_idx + num_probes) & mask
+                num_probes += 1
+            probe_lengths.append(num_probes)
 
-            if hash_index == orig_hash_index:
-                err_msg = 'Key: %s not located in hash table!' % key
-                raise KeyError(err_msg)
+        # Return the probe lengths
+        return probe_lengths
 
-        return self.val_slots[hash_index]
+    def _used_slots(self):
+        '''
+        Return a boolean NumPy array of the slots holding a key or a
+        tombstone
+        '''
+
+        # Import packages
+        import numpy as np
+
+        return np.array([key_hash is not None
+                         for key_hash in self.hash_slots], dtype=bool)
+
+    def stats(self):
+        '''
+        Export statistics of the table, to tune its size and probing
+        for a key distribution; the probe lengths and clusters are
+        found by scanning the slots, so this takes O(size) time
+
+        Returns
+        -------
+        stats : dict
+            dictionary with the keys:
+            size, num_keys, num_deleted - slots, keys and tombstones
+            load_factor - fraction of the slots holding keys
+            probe_histogram - {probes: number of keys} to find the keys
+            mean_probes, max_probes - of the probe_histogram
+            longest_cluster - most consecutive slots holding a key or a
+            tombstone, which a probe may have to walk through
+            num_resizes, resize_secs - rebuilds so far and their time
+            and with track_stats:
+            lookup_histogram - {probes: number of lookups} taken by
+            every put, get, delete and in check so far
+            num_lookups, mean_lookup_probes - of the lookup_histogram
+        '''
+
+        # Import packages
+        import numpy as np
+
+        # Probe lengths of the keys
+        probe_lengths = np.array(self.probe_lengths(), dtype=np.int64)
+        counts = np.bincount(probe_lengths)
+        probe_histogram = dict((int(num_probes), int(counts[num_probes]))
+                               for num_probes in np.flatnonzero(counts))
+
+        # Longest run of used slots, wrapping around the end
+        used = self._used_slots()
+        if used.all():
+            longest_cluster = len(used)
+        else:
+            used = np.roll(used, -int(np.argmin(used)))
+            edges = np.diff(np.concatenate(([0], used.view(np.int8), [0])))
+            runs = np.flatnonzero(edges == -1) - np.flatnonzero(edges == 1)
+            longest_cluster = int(runs.max()) if len(runs) else 0
+
+        # Table stats
+        stats = {'size': self.size,
+                 'num_keys': self.num_keys,
+                 'num_deleted': self.num_deleted,
+                 'load_factor': float(self.num_keys)/self.size,
+                 'probe_histogram': probe_histogram,
+                 'mean_probes': float(probe_lengths.mean())
+                                if len(probe_lengths) else 0.0,
+                 'max_probes': int(probe_lengths.max())
+                               if len(probe_lengths) else 0,
+                 'longest_cluster': longest_cluster,
+                 'num_resizes': self.num_resizes,
+                 'resize_secs': self.resize_secs}
+
+        # Lookup stats, when tracked
+        if self._probe_counts is not None:
+            num_lookups = sum(self._probe_counts.itervalues())
+            total_probes = sum(num_probes*count for num_probes, count
+                               in self._probe_counts.iteritems())
+            stats['lookup_histogram'] = dict(self._probe_counts)
+            stats['num_lookups'] = num_lookups
+            stats['mean_lookup_probes'] = \
+                float(total_probes)/num_lookups if num_lookups else 0.0
+
+        return stats
 
     def __setitem__(self, key, value):
         self.put(key, value)
 
     def __getitem__(self, key):
         return self.get(key)
+
+    def __delitem__(self, key):
+        self.delete(key)
+
+    def __contains__(self, key):
+        return self._find(key, _mix_hash(hash(key))) >= 0
+
+    def __iter__(self):
+        '''
+        Iterate over the keys in the table, in slot order
+        '''
+        for idx, key_hash in enumerate(self.hash_slots):
+            if key_hash is not None and key_hash is not _DELETED:
+                yield self.key_slots[idx]
+
+    def __len__(self):
+        return self.num_keys
+
+
+class IntHashTable(HashTable):
+    '''
+    Hash table of int keys and int values kept in typed 64-bit
+    array.array buffers instead of lists of boxed objects, so every
+    slot takes 16 bytes. The buffers are also viewed as NumPy arrays,
+    which lets put_many and get_many probe whole batches of keys at
+    once, a round of vectorized probes at a time. Keys are Fibonacci
+    hashed to their home slots, as in HashTable, and the two smallest
+    int64 values are reserved to mark empty and deleted slots. Only
+    linear and quadratic probing are supported
+    '''
+
+    _PROBINGS = ('linear', 'quadratic')
+
+    def _reset(self, capacity):
+        '''
+        Empty the table and set it to capacity slots
+        '''
+
+        # Import packages
+        import numpy as np
+
+        self.size = capacity
+        self._shift = _HASH_BITS - capacity.bit_length() + 1
+        self.key_slots = _int64_array(capacity, _EMPTY_KEY)
+        self.val_slots = _int64_array(capacity, 0)
+        self._keys_view = np.frombuffer(self.key_slots, dtype=np.int64)
+        self._vals_view = np.frombuffer(self.val_slots, dtype=np.int64)
+        self.num_keys = 0
+        self.num_deleted = 0
+        self._max_used = int(capacity*self.max_load)
+
+    @staticmethod
+    def _check_key(key):
+        '''
+        Return key as an int, raising a KeyError if it cannot be stored
+        '''
+
+        # Import packages
+        import numbers
+
+        # Plain ints in range are the common case
+        if type(key) is int and _DELETED_KEY < key <= _INT64_MAX:
+            return key
+
+        # Sentinels and other types are rejected
+        if not isinstance(key, numbers.Integral) or \
+                not _DELETED_KEY < key <= _INT64_MAX:
+            err_msg = 'Key: %s must be an int64 above %d!' \
+                      % (str(key), _DELETED_KEY)
+            raise KeyError(err_msg)
+
+        return int(key)
+
+    def _rebuild(self, num_new=0):
+        '''
+        Rebuild the table with the fewest slots, but no fewer than it
+        started with, that keeps the keys under half of max_load with
+        room for num_new more, dropping any tombstones; a big batch
+        is not given room to double as well
+        '''
+
+        # Init variables; the live keys are copied out of the buffers
+        live = self._keys_view > _DELETED_KEY
+        keys = self._keys_view[live]
+        values = self._vals_view[live]
+        capacity = self._min_size
+        while capacity*self.max_load < 2*len(keys) + num_new:
+            capacity *= 2
+
+        # Place every key again in the new slots
+        self._reset(capacity)
+        self._place_many(keys, values)
+
+    def _place_many(self, keys, values):
+        '''
+        Place a batch of distinct keys that are not in the table into
+        free slots; every round, each key probes one slot and the
+        first key to probe each free slot takes it
+        '''
+
+        # Import packages
+        import numpy as np
+
+        # Init variables
+        keys_view = self._keys_view
+        vals_view = self._vals_view
+        mask = self.size - 1
+        step_inc = 1 if self.probing == 'quadratic' else 0
+        idx = _home_slots(keys, self._shift)
+        steps = np.ones(len(keys), dtype=np.int64)
+        self.num_keys += len(keys)
+
+        # Probe until every key has a slot
+        while len(keys):
+            slot_keys = keys_view[idx]
+            free = np.flatnonzero(slot_keys <= _DELETED_KEY)
+            slots, first = np.unique(idx[free], return_index=True)
+            placed = free[first]
+            self.num_deleted -= \
+                int(np.count_nonzero(slot_keys[placed] == _DELETED_KEY))
+            keys_view[slots] = keys[placed]
+            vals_view[slots] = values[placed]
+            # The rest move on to their next slot
+            left = np.ones(len(keys), dtype=bool)
+            left[placed] = False
+            keys = keys[left]
+            values = values[left]
+            idx = (idx[left] + steps[left]) & mask
+            steps = steps[left] + step_inc
+
+    def _find(self, key):
+        '''
+        Return the slot index of key, or -1 if it is not in the table
+        '''
+
+        # Init variables
+        key_slots = self.key_slots
+        mask = self.size - 1
+        home = idx = _mix_hash(key) >> self._shift
+        step = 1
+        step_inc = 1 if self.probing == 'quadratic' else 0
+
+        # Probe until the key or an empty slot is found
+        while True:
+            slot_key = key_slots[idx]
+            if slot_key == key or slot_key == _EMPTY_KEY:
+                break
+            idx = (idx + step) & mask
+            step += step_inc
+
+        # Count the probes taken
+        probe_counts = self._probe_counts
+        if probe_counts is not None:
+            num_probes = step if step_inc else ((idx - home) & mask) + 1
+            probe_counts[num_probes] = probe_counts.get(num_probes, 0) + 1
+
+        return idx if slot_key == key else -1
+
+    def _find_many(self, keys):
+        '''
+        Return the slot index of every key, or -1 for keys not in the
+        table, probing all of the keys one slot a round
+        '''
+
+        # Import packages
+        import numpy as np
+
+        # Init variables
+        keys_view = self._keys_view
+        mask = self.size - 1
+        step_inc = 1 if self.probing == 'quadratic' else 0
+        positions = np.full(len(keys), -1, dtype=np.int64)
+        pending = np.flatnonzero(keys > _DELETED_KEY)
+        idx = _home_slots(keys[pending], self._shift)
+        steps = np.ones(len(pending), dtype=np.int64)
+
+        # Probe until every key or an empty slot is found; the keys
+        # that stop in a round all took that many probes
+        num_probes = 0
+        while len(pending):
+            num_probes += 1
+            slot_keys = keys_view[idx]
+            found = slot_keys == keys[pending]
+            positions[pending[found]] = idx[found]
+            left = ~found & (slot_keys != _EMPTY_KEY)
+            if self._probe_counts is not None:
+                self._probe_counts[num_probes] = \
+                    self._probe_counts.get(num_probes, 0) + \
+                    len(pending) - int(np.count_nonzero(left))
+            pending = pending[left]
+            idx = (idx[left] + steps[left]) & mask
+            steps = steps[left] + step_inc
+
+        return positions
+
+    def put(self, key, value):
+        '''
+        Put key/value pair into hash table
+        '''
+
+        # Init variables
+        key = self._check_key(key)
+        key_hash = _mix_hash(key)
+        key_slots = self.key_slots
+        mask = self.size - 1
+        home = idx = key_hash >> self._shift
+        step = 1
+        step_inc = 1 if self.probing == 'quadratic' else 0
+        free_idx = -1
+
+        # One probe finds the key or the first free slot
+        while True:
+            slot_key = key_slots[idx]
+            if slot_key == key or slot_key == _EMPTY_KEY:
+                break
+            if slot_key == _DELETED_KEY and free_idx < 0:
+                free_idx = idx
+            idx = (idx + step) & mask
+            step += step_inc
+        probe_counts = self._probe_counts
+        if probe_counts is not None:
+            num_probes = step if step_inc else ((idx - home) & mask) + 1
+            probe_counts[num_probes] = probe_counts.get(num_probes, 0) + 1
+        if slot_key == key:
+            self.val_slots[idx] = value
+            return
+
+        # A tombstone is reused without any more slots in use
+        if free_idx >= 0:
+            idx = free_idx
+            self.num_deleted -= 1
+        # Otherwise make room and probe the new slots for an empty one
+        elif self.num_keys + self.num_deleted >= self._max_used:
+            self._resize(1)
+            key_slots = self.key_slots
+            mask = self.size - 1
+            idx = key_hash >> self._shift
+            step = 1
+            while key_slots[idx] != _EMPTY_KEY:
+                idx = (idx + step) & mask
+                step += step_inc
+        key_slots[idx] = key
+        self.val_slots[idx] = value
+        self.num_keys += 1
+
+    def put_many(self, keys, values):
+        '''
+        Put a batch of key/value pairs into the hash table with
+        vectorized probes; when a key is repeated, its last value wins
+
+        Parameters
+        ----------
+        keys : numpy.ndarray or list
+            1D array of int keys
+        values : numpy.ndarray or list
+            1D array of int values, the same length as keys
+        '''
+
+        # Import packages
+        import numpy as np
+
+        # Init variables
+        keys = np.asarray(keys, dtype=np.int64)
+        values = np.asarray(values, dtype=np.int64)
+        if keys.ndim != 1 or keys.shape != values.shape:
+            err_msg = 'Keys: %s and values: %s must be 1D and the same ' \
+                      'shape!' % (str(keys.shape), str(values.shape))
+            raise ValueError(err_msg)
+        if len(keys) and keys.min() <= _DELETED_KEY:
+            err_msg = 'Key: %d must be an int64 above %d!' \
+                      % (keys.min(), _DELETED_KEY)
+            raise KeyError(err_msg)
+
+        # Keep the last value of repeated keys
+        keys, last = np.unique(keys[::-1], return_index=True)
+        values = values[::-1][last]
+
+        # Update keys already in the table
+        positions = self._find_many(keys)
+        found = positions >= 0
+        self._vals_view[positions[found]] = values[found]
+
+        # Make room, then place the new keys
+        new = ~found
+        num_new = int(np.count_nonzero(new))
+        if self.num_keys + self.num_deleted + num_new > self._max_used:
+            self._resize(num_new)
+        self._place_many(keys[new], values[new])
+
+    def get(self, key):
+        '''
+        Get value from key
+        '''
+
+        # Find the key's slot
+        idx = self._find(self._check_key(key))
+        if idx < 0:
+            err_msg = 'Key: %s not located in hash table!' % str(key)
+            raise KeyError(err_msg)
+
+        return self.val_slots[idx]
+
+    def get_many(self, keys, default=None):
+        '''
+        Get the values of a batch of keys with vectorized probes
+
+        Parameters
+        ----------
+        keys : numpy.ndarray or list
+            1D array of int keys
+        default : integer (optional); default=None
+            the value for keys not in the table; None raises a KeyError
+            for them instead
+
+        Returns
+        -------
+        values : numpy.ndarray
+            int64 array of the value of every key
+        '''
+
+        # Import packages
+        import numpy as np
+
+        # Find every key's slot
+        keys = np.asarray(keys, dtype=np.int64)
+        positions = self._find_many(keys)
+        missing = positions < 0
+        any_missing = missing.any()
+        if any_missing and default is None:
+            err_msg = 'Key: %d not located in hash table!' \
+                      % keys[missing][0]
+            raise KeyError(err_msg)
+
+        # Gather the values
+        values = np.empty(len(keys), dtype=np.int64)
+        if any_missing:
+            values[missing] = default
+        values[~missing] = self._vals_view[positions[~missing]]
+
+        return values
+
+    def delete(self, key):
+        '''
+        Delete key and its value from the hash table
+        '''
+
+        # Find the key's slot
+        idx = self._find(self._check_key(key))
+        if idx < 0:
+            err_msg = 'Key: %s not located in hash table!' % str(key)
+            raise KeyError(err_msg)
+
+        # Leave a tombstone so probes carry on past the slot
+        self.key_slots[idx] = _DELETED_KEY
+        self.val_slots[idx] = 0
+        self.num_keys -= 1
+        self.num_deleted += 1
+
+    def probe_lengths(self):
+        '''
+        Return the number of slots probed to find each key, in slot
+        order; 1 means the key is in its home slot
+
+        Returns
+        -------
+        probe_lengths : list
+            list of the probe length of every key in the table
+        '''
+
+        # Import packages
+        import numpy as np
+
+        # Init variables
+        mask = self.size - 1
+        slots = np.flatnonzero(self._keys_view > _DELETED_KEY)
+        homes = _home_slots(self._keys_view[slots], self._shift)
+
+        # Linear probes are one per slot from home
+        if self.probing == 'linear':
+            return (((slots - homes) & mask) + 1).tolist()
+
+        # Quadratic probes are walked from home, a round at a time
+        lengths = np.ones(len(slots), dtype=np.int64)
+        pending = np.flatnonzero(homes != slots)
+        while len(pending):
+            homes[pending] = (homes[pending] + lengths[pending]) & mask
+            lengths[pending] += 1
+            pending = pending[homes[pending] != slots[pending]]
+
+        return lengths.tolist()
+
+    def _used_slots(self):
+        '''
+        Return a boolean NumPy array of the slots holding a key or a
+        tombstone
+        '''
+        return self._keys_view != _EMPTY_KEY
+
+    @property
+    def nbytes(self):
+        '''
+        Number of bytes in the key and value buffers
+        '''
+        return self._keys_view.nbytes + self._vals_view.nbytes
+
+    def __contains__(self, key):
+        try:
+            key = self._check_key(key)
+        except KeyError:
+            return False
+        return self._find(key) >= 0
+
+    def __iter__(self):
+        '''
+        Iterate over the keys in the table, in slot order
+        '''
+        for key in self.key_slots:
+            if key > _DELETED_KEY:
+                yield key
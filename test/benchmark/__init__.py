@@ -0,0 +1,9 @@
+# test/benchmark/__init__.py
+#
+# Author: Daniel Clark, 2016
+
+'''
+This package contains scripts to benchmark the pytools package; they
+are not unit tests and are run by hand, e.g.
+python -m test.benchmark.graphs_trees.graphs_bench
+'''
@@ -0,0 +1,7 @@
+# test/benchmark/graphs_trees/__init__.py
+#
+# Author: Daniel Clark, 2016
+
+'''
+Benchmarks for the pytools.graphs_trees package
+'''
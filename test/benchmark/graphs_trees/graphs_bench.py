@@ -0,0 +1,228 @@
+# test/benchmark/graphs_trees/graphs_bench.py
+#
+# Author: Daniel Clark, 2016
+
+'''
+Benchmark script for the graphs module
+
+Usage: python -m test.benchmark.graphs_trees.graphs_bench [-v <vertices>]
+                                                          [-e <edges>]
+                                                          [-w <num_words>]
+                                                          [-s <sources>]
+'''
+
+
+def random_edges(num_vertices, num_edges, rnd_seed=0):
+    '''
+    Generate a list of random weighted (from, to, weight) edges
+    '''
+
+    # Import packages
+    import random
+
+    # Init variables
+    rand = random.Random(rnd_seed)
+
+    # Return the edges
+    return [(rand.randrange(num_vertices), rand.randrange(num_vertices),
+             rand.random()) for _ in xrange(num_edges)]
+
+
+def graph_nbytes(graph):
+    '''
+    Estimate the bytes used by a Graph object's vertices and edge dicts
+    '''
+
+    # Import packages
+    import sys
+
+    # Count every vertex, its attribute dict and its connection dict
+    num_bytes = sys.getsizeof(graph.vert_dict)
+    for key, vertex in graph.vert_dict.items():
+        num_bytes += sys.getsizeof(vertex) + sys.getsizeof(vertex.__dict__)
+        num_bytes += sys.getsizeof(vertex.connected_to)
+        for wght in vertex.connected_to.values():
+            num_bytes += sys.getsizeof(wght)
+
+    # Return the estimate
+    return num_bytes
+
+
+def bench_compact_graph(num_vertices, num_edges):
+    '''
+    Compare memory per edge and BFS/DFS time of Graph vs CompactGraph
+    '''
+
+    # Import packages
+    import time
+    from pytools.graphs_trees import graphs
+
+    # Build both graph types
+    edges = random_edges(num_vertices, num_edges)
+    graph = graphs.DFSGraph()
+    for from_key, to_key, weight in edges:
+        graph.add_edge(from_key, to_key, weight)
+    compact = graphs.CompactGraph.from_graph(graph)
+    num_edges = compact.num_edges
+
+    # Memory
+    print 'Graph:        %8.1f bytes/edge' % (graph_nbytes(graph)/float(num_edges))
+    print 'CompactGraph: %8.1f bytes/edge' % (compact.nbytes()/float(num_edges))
+
+    # Traversal
+    start = time.time()
+    graphs.breadth_first_search(graph, graph.get_vertex(edges[0][0]))
+    print 'Graph BFS:        %.3fs' % (time.time() - start)
+    start = time.time()
+    graphs.breadth_first_search(compact, edges[0][0])
+    print 'CompactGraph BFS: %.3fs' % (time.time() - start)
+    start = time.time()
+    graph.depth_first_search()
+    print 'Graph DFS:        %.3fs' % (time.time() - start)
+    start = time.time()
+    compact.depth_first_search()
+    print 'CompactGraph DFS: %.3fs' % (time.time() - start)
+
+
+def random_words(num_words, word_len=5, alphabet='abcdefghijklmnop',
+                 rnd_seed=0):
+    '''
+    Generate a list of unique random words to build word ladders from
+    '''
+
+    # Import packages
+    import random
+
+    # Init variables
+    rand = random.Random(rnd_seed)
+    words = set()
+
+    # Draw words until there are enough unique ones
+    while len(words) < num_words:
+        words.add(''.join(rand.choice(alphabet) for _ in xrange(word_len)))
+
+    # Return the words
+    return sorted(words)
+
+
+def bench_word_ladder(words_fp, num_queries=200):
+    '''
+    Compare point-to-point ladder latency of a full BFS vs bidirectional
+    BFS vs A* on the word-ladder graph built from words_fp
+    '''
+
+    # Import packages
+    import random
+    import time
+    from pytools.graphs_trees import graphs
+
+    # Build graph and random queries
+    graph = graphs.build_wordladder_graph(words_fp)
+    words = sorted(graph.get_vertices())
+    rand = random.Random(0)
+    queries = [(rand.choice(words), rand.choice(words))
+               for _ in xrange(num_queries)]
+    print 'Word ladder graph: %d words' % len(words)
+
+    # Full BFS from the start word, then read off the path
+    start = time.time()
+    for start_word, end_word in queries:
+        result = graphs.bfs(graph, [start_word])
+        if end_word in result:
+            result.path_to(end_word)
+    full_time = time.time() - start
+    print '  full bfs:      %8.3f ms/query' % (1e3*full_time/num_queries)
+
+    # Point-to-point searches
+    for method in ['bfs', 'bidirectional', 'astar']:
+        start = time.time()
+        for start_word, end_word in queries:
+            graphs.find_word_ladder(graph, start_word, end_word, method)
+        method_time = time.time() - start
+        print '  %-14s %8.3f ms/query' % (method + ':',
+                                          1e3*method_time/num_queries)
+
+
+def bench_implicit_word_ladder(words_fp):
+    '''
+    Compare build time of the explicit Graph vs the implicit
+    WordLadderGraph for the words in words_fp
+    '''
+
+    # Import packages
+    import time
+    from pytools.graphs_trees import graphs
+
+    # Implicit graph only indexes the buckets
+    start = time.time()
+    implicit = graphs.build_wordladder_graph(words_fp, implicit=True)
+    print 'Implicit word ladder build (%d words): %.3fs' \
+          % (len(implicit), time.time() - start)
+
+    # Explicit graph adds every edge of every bucket clique
+    start = time.time()
+    graphs.build_wordladder_graph(words_fp)
+    print 'Explicit word ladder build (%d words): %.3fs' \
+          % (len(implicit), time.time() - start)
+
+
+def bench_distance_matrix(num_vertices, num_edges, num_sources):
+    '''
+    Measure bfs_distance_matrix scaling from 1 to cpu_count processes
+    '''
+
+    # Import packages
+    import multiprocessing
+    import time
+    from pytools.graphs_trees import graphs
+
+    # Build the compact graph once
+    compact = graphs.CompactGraph.from_edges(
+        random_edges(num_vertices, num_edges), num_vertices=num_vertices,
+        weighted=False)
+    start_keys = range(min(num_sources, num_vertices))
+
+    # Time each process count
+    base_time = None
+    processes = 1
+    while processes <= multiprocessing.cpu_count():
+        start = time.time()
+        graphs.bfs_distance_matrix(compact, start_keys, processes=processes)
+        run_time = time.time() - start
+        base_time = base_time or run_time
+        print 'Distance matrix, %2d processes: %.3fs (%.2fx)' \
+              % (processes, run_time, base_time/run_time)
+        processes *= 2
+
+
+# Make executable
+if __name__ == '__main__':
+
+    # Import packages
+    import argparse
+
+    # Init argparser
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-v', '--vertices', type=int, default=2000,
+                        help='Number of vertices in the random graph')
+    parser.add_argument('-e', '--edges', type=int, default=20000,
+                        help='Number of edges in the random graph')
+    parser.add_argument('-w', '--words', type=int, default=20000,
+                        help='Number of words in the synthetic word list')
+    parser.add_argument('-s', '--sources', type=int, default=200,
+                        help='Number of sources for the distance matrix')
+    args = parser.parse_args()
+
+    # Run benchmarks
+    import os
+    import tempfile
+    bench_compact_graph(args.vertices, args.edges)
+    bench_distance_matrix(args.vertices, args.edges, args.sources)
+    words_fp = os.path.join(os.path.dirname(__file__), os.pardir, os.pardir,
+                            'unit', 'graphs_trees', 'words.txt')
+    bench_word_ladder(words_fp)
+    with tempfile.NamedTemporaryFile(suffix='.txt') as wfile:
+        wfile.write('\n'.join(random_words(args.words)) + '\n')
+        wfile.flush()
+        bench_word_ladder(wfile.name)
+        bench_implicit_word_ladder(wfile.name)
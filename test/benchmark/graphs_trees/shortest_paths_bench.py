@@ -0,0 +1,66 @@
+# test/benchmark/graphs_trees/shortest_paths_bench.py
+#
+# Author: Daniel Clark, 2016
+
+'''
+Benchmark script for the shortest_paths module
+
+Usage: python -m test.benchmark.graphs_trees.shortest_paths_bench
+           [-v <vertices>] [-e <edges>] [-q <queries>]
+'''
+
+
+def bench_dijkstra(num_vertices, num_edges, num_queries):
+    '''
+    Time single-source and point-to-point Dijkstra on a random weighted
+    CompactGraph
+    '''
+
+    # Import packages
+    import random
+    import time
+    from pytools.graphs_trees import graphs, shortest_paths
+    from test.benchmark.graphs_trees import graphs_bench
+
+    # Build graph straight from the edge list
+    start = time.time()
+    edges = graphs_bench.random_edges(num_vertices, num_edges)
+    compact = graphs.CompactGraph.from_edges(edges, num_vertices=num_vertices)
+    del edges
+    print 'Built %d vertex/%d edge CompactGraph: %.3fs' \
+          % (num_vertices, compact.num_edges, time.time() - start)
+
+    # Single source, all targets
+    start = time.time()
+    result = shortest_paths.dijkstra(compact, 0)
+    print 'Dijkstra all targets:   %.3fs (%d reached)' \
+          % (time.time() - start, len(result.reached()))
+
+    # Point-to-point with early stop
+    rand = random.Random(0)
+    start = time.time()
+    for _ in xrange(num_queries):
+        shortest_paths.shortest_path(compact, rand.randrange(num_vertices),
+                                     rand.randrange(num_vertices))
+    print 'Dijkstra point-to-point: %.3fs/query' \
+          % ((time.time() - start)/num_queries)
+
+
+# Make executable
+if __name__ == '__main__':
+
+    # Import packages
+    import argparse
+
+    # Init argparser
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-v', '--vertices', type=int, default=100000,
+                        help='Number of vertices in the random graph')
+    parser.add_argument('-e', '--edges', type=int, default=1000000,
+                        help='Number of edges in the random graph')
+    parser.add_argument('-q', '--queries', type=int, default=10,
+                        help='Number of point-to-point queries to run')
+    args = parser.parse_args()
+
+    # Run benchmarks
+    bench_dijkstra(args.vertices, args.edges, args.queries)
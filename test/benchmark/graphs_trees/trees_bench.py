@@ -0,0 +1,456 @@
+# test/benchmark/graphs_trees/trees_bench.py
+#
+# Author: Daniel Clark, 2016
+
+'''
+Benchmark script for the trees module
+
+Usage: python -m test.benchmark.graphs_trees.trees_bench [-w <words>]
+           [-k <max_k>] [-p <paths>] [-n <keys>] [-q <heap items>]
+           [-t <top k>]
+'''
+
+
+def random_strings(num_words, min_len=3, max_len=12, seed=0):
+    '''
+    Generate a list of random lowercase words
+    '''
+
+    # Import packages
+    import random
+    import string
+
+    # Init variables
+    rand = random.Random(seed)
+    letters = string.ascii_lowercase
+
+    # Return the words
+    return [''.join(rand.choice(letters)
+                    for _ in xrange(rand.randint(min_len, max_len)))
+            for _ in xrange(num_words)]
+
+
+def bench_trie(num_words):
+    '''
+    Time insert and lookup throughput of Trie against CompactTrie
+    '''
+
+    # Import packages
+    import time
+    from pytools.graphs_trees import trees
+
+    # Init variables
+    words = random_strings(num_words)
+    prefixes = [word[:3] for word in words]
+
+    # Object-per-char Trie
+    start = time.time()
+    trie = trees.Trie()
+    for word in words:
+        trie.insert(word)
+    insert_secs = time.time() - start
+    start = time.time()
+    for word in words:
+        trie.retrieve(word)
+    lookup_secs = time.time() - start
+    print 'Trie insert:               %.0f words/s' % (num_words/insert_secs)
+    print 'Trie retrieve:             %.0f words/s' % (num_words/lookup_secs)
+    del trie
+
+    # Flat node table, one insert at a time
+    start = time.time()
+    trie = trees.CompactTrie()
+    for word in words:
+        trie.insert(word)
+    insert_secs = time.time() - start
+    del trie
+
+    # Flat node table, sorted bulk load
+    start = time.time()
+    trie = trees.CompactTrie.from_iterable(words)
+    bulk_secs = time.time() - start
+    start = time.time()
+    for word in words:
+        trie.retrieve(word)
+    lookup_secs = time.time() - start
+    start = time.time()
+    for prefix in prefixes:
+        trie.retrieve(prefix)
+    prefix_secs = time.time() - start
+    print 'CompactTrie insert:        %.0f words/s' % (num_words/insert_secs)
+    print 'CompactTrie from_iterable: %.0f words/s' % (num_words/bulk_secs)
+    print 'CompactTrie retrieve:      %.0f words/s' % (num_words/lookup_secs)
+    print 'CompactTrie prefix lookup: %.0f prefixes/s' \
+          % (num_words/prefix_secs)
+    print 'CompactTrie nodes:         %d' % trie.num_nodes()
+
+
+def bench_autocomplete(num_words, max_k):
+    '''
+    Time building an AutocompleteTrie and the latency of complete()
+    '''
+
+    # Import packages
+    import random
+    import time
+    from pytools.graphs_trees import trees
+
+    # Zipf-like frequencies, as in search logs
+    words = random_strings(num_words)
+    counts = dict((word, num_words//(rank + 1))
+                  for rank, word in enumerate(words))
+
+    # Bulk load
+    start = time.time()
+    trie = trees.AutocompleteTrie.from_counts(counts, max_k=max_k)
+    print 'AutocompleteTrie from_counts: %.3fs (%d terms, %d nodes)' \
+          % (time.time() - start, len(trie), trie.num_nodes())
+
+    # Latency of completing 1 to 4 char prefixes of the words
+    rand = random.Random(0)
+    prefixes = [word[:rand.randint(1, 4)] for word in words[:100000]]
+    start = time.time()
+    for prefix in prefixes:
+        trie.complete(prefix)
+    print 'AutocompleteTrie complete:    %.2fus/query (k=%d)' \
+          % (1e6*(time.time() - start)/len(prefixes), max_k)
+
+    # Incremental updates
+    start = time.time()
+    for word in words[:100000]:
+        trie.insert(word)
+    print 'AutocompleteTrie insert:      %.2fus/update' \
+          % (1e6*(time.time() - start)/min(num_words, 100000))
+
+
+def random_paths(num_paths, seed=0):
+    '''
+    Generate a list of random URL-like paths sharing long prefixes
+    '''
+
+    # Import packages
+    import random
+
+    # Init variables
+    rand = random.Random(seed)
+    hosts = ['https://www.example.com', 'https://api.example.com/v2',
+             'https://static.example.org/assets']
+    sections = ['users', 'projects', 'images', 'docs', 'reports']
+
+    # Return the paths
+    return ['%s/%s/%06d/%s/%d' % (rand.choice(hosts), rand.choice(sections),
+                                  rand.randrange(100000),
+                                  rand.choice(sections),
+                                  rand.randrange(1000))
+            for _ in xrange(num_paths)]
+
+
+def trie_num_nodes(trie):
+    '''
+    Count the nodes of an object-per-char Trie
+    '''
+
+    # Init variables
+    num_nodes = 0
+    node_stack = [trie]
+
+    # Count every node
+    while node_stack:
+        node = node_stack.pop()
+        num_nodes += 1
+        node_stack.extend(node.children)
+
+    # Return the count
+    return num_nodes
+
+
+def bench_radix_trie(num_paths):
+    '''
+    Report nodes per key of Trie against RadixTrie on URL-like paths,
+    and time RadixTrie insert and lookup
+    '''
+
+    # Import packages
+    import time
+    from pytools.graphs_trees import trees
+
+    # Init variables
+    paths = random_paths(num_paths)
+
+    # Object-per-char Trie
+    trie = trees.Trie()
+    for path in paths:
+        trie.insert(path)
+    num_nodes = trie_num_nodes(trie)
+    del trie
+    print 'Trie nodes:          %d (%.2f per key)' \
+          % (num_nodes, float(num_nodes)/num_paths)
+
+    # Path-compressed trie
+    start = time.time()
+    trie = trees.RadixTrie()
+    for path in paths:
+        trie.insert(path)
+    insert_secs = time.time() - start
+    start = time.time()
+    for path in paths:
+        path in trie
+    lookup_secs = time.time() - start
+    num_nodes = trie.num_nodes()
+    print 'RadixTrie nodes:     %d (%.2f per key)' \
+          % (num_nodes, float(num_nodes)/num_paths)
+    print 'RadixTrie insert:    %.0f keys/s' % (num_paths/insert_secs)
+    print 'RadixTrie contains:  %.0f keys/s' % (num_paths/lookup_secs)
+
+
+def bench_avl_tree(num_keys):
+    '''
+    Time AVLTree insert, retrieve and delete on sorted, reversed and
+    random keys at growing sizes; the time per operation should grow
+    with log(n), and BinarySearchTree is timed too on random keys, the
+    only order it can take without recursing n deep
+    '''
+
+    # Import packages
+    import math
+    import random
+    import time
+    from pytools.graphs_trees import trees
+
+    # Init variables
+    sizes = []
+    size = num_keys
+    while size >= 1000 and len(sizes) < 3:
+        sizes.insert(0, size)
+        size //= 10
+
+    # Time each key order at each size
+    for size in sizes:
+        random_keys = range(size)
+        random.Random(0).shuffle(random_keys)
+        orders = [('sorted', xrange(size)),
+                  ('reversed', xrange(size - 1, -1, -1)),
+                  ('random', random_keys)]
+        for order, keys in orders:
+            tree = trees.AVLTree()
+            start = time.time()
+            for key in keys:
+                tree[key] = key
+            insert_secs = time.time() - start
+            start = time.time()
+            for key in keys:
+                tree.retrieve(key)
+            retrieve_secs = time.time() - start
+            height = tree.height()
+            start = time.time()
+            for key in keys:
+                tree.delete(key)
+            delete_secs = time.time() - start
+            print 'AVLTree %8s n=%-8d height=%-3d (log2 n=%4.1f) ' \
+                  'insert %.2fus retrieve %.2fus delete %.2fus' \
+                  % (order, size, height, math.log(size, 2),
+                     1e6*insert_secs/size, 1e6*retrieve_secs/size,
+                     1e6*delete_secs/size)
+            del tree
+
+        # Unbalanced tree on random keys for reference
+        tree = trees.BinarySearchTree(random_keys[0], random_keys[0])
+        start = time.time()
+        for key in random_keys:
+            tree[key] = key
+        insert_secs = time.time() - start
+        start = time.time()
+        for key in random_keys:
+            tree.retrieve(key)
+        print 'BinarySearchTree random n=%-8d insert %.2fus retrieve %.2fus' \
+              % (size, 1e6*insert_secs/size,
+                 1e6*(time.time() - start)/size)
+        del tree
+
+
+def bench_bulk_build(num_keys):
+    '''
+    Time the from_sorted bulk loaders against inserting the same sorted
+    keys one at a time into an AVLTree
+    '''
+
+    # Import packages
+    import time
+    import numpy as np
+    from pytools.graphs_trees import trees
+
+    # Init variables
+    keys = np.arange(num_keys, dtype=np.int64)*10
+
+    # Bulk load both trees straight from the NumPy array
+    for tree_class in [trees.BinarySearchTree, trees.AVLTree]:
+        start = time.time()
+        tree = tree_class.from_sorted(keys)
+        print '%16s.from_sorted n=%d: %.3fs' \
+              % (tree_class.__name__, len(tree), time.time() - start)
+        del tree
+
+    # One insert at a time
+    start = time.time()
+    tree = trees.AVLTree()
+    for key in keys.tolist():
+        tree.insert(key, None)
+    print '%16s.insert     n=%d: %.3fs' \
+          % ('AVLTree', len(tree), time.time() - start)
+
+
+def bench_heaps(num_items):
+    '''
+    Time push/pop and decrease-key workloads on BinaryHeap and
+    IndexedBinaryHeap at a few arities against heapq
+    '''
+
+    # Import packages
+    import heapq
+    import random
+    import time
+    from pytools.graphs_trees import trees
+
+    # Init variables
+    rand = random.Random(0)
+    keys = [rand.random() for _ in xrange(num_items)]
+    decreases = [(rand.randrange(num_items), rand.random()/2)
+                 for _ in xrange(num_items)]
+
+    # heapq baseline: push everything, then pop everything
+    start = time.time()
+    heap = []
+    for key in keys:
+        heapq.heappush(heap, key)
+    while heap:
+        heapq.heappop(heap)
+    heapq_secs = time.time() - start
+    print '%28s push/pop: %.3fs' % ('heapq', heapq_secs)
+
+    # Plain and indexed heaps
+    for arity in (2, 4):
+        start = time.time()
+        binary_heap = trees.BinaryHeap(arity=arity)
+        for key in keys:
+            binary_heap.insert(key)
+        while len(binary_heap):
+            binary_heap.dequeue_min()
+        secs = time.time() - start
+        print '%28s push/pop: %.3fs (%.1fx heapq)' \
+              % ('BinaryHeap(arity=%d)' % arity, secs, secs/heapq_secs)
+        start = time.time()
+        binary_heap = trees.IndexedBinaryHeap(arity=arity)
+        for idx, key in enumerate(keys):
+            binary_heap.insert(idx, key)
+        while len(binary_heap):
+            binary_heap.dequeue_min()
+        secs = time.time() - start
+        print '%28s push/pop: %.3fs (%.1fx heapq)' \
+              % ('IndexedBinaryHeap(arity=%d)' % arity, secs,
+                 secs/heapq_secs)
+
+    # Decrease-key: heapq pushes duplicates and skips stale entries
+    start = time.time()
+    priorities = list(keys)
+    heap = [(key, idx) for idx, key in enumerate(keys)]
+    heapq.heapify(heap)
+    for idx, priority in decreases:
+        if priority < priorities[idx]:
+            priorities[idx] = priority
+            heapq.heappush(heap, (priority, idx))
+    while heap:
+        priority, idx = heapq.heappop(heap)
+        if priority != priorities[idx]:
+            continue
+    heapq_secs = time.time() - start
+    print '%28s decrease-key: %.3fs (lazy deletion, %d entries)' \
+          % ('heapq', heapq_secs, num_items + len(decreases))
+    for arity in (2, 4):
+        start = time.time()
+        binary_heap = trees.IndexedBinaryHeap(arity=arity)
+        binary_heap.build_heap(enumerate(keys))
+        for idx, priority in decreases:
+            if priority < binary_heap.priority(idx):
+                binary_heap.decrease_key(idx, priority)
+        while len(binary_heap):
+            binary_heap.dequeue_min()
+        secs = time.time() - start
+        print '%28s decrease-key: %.3fs (%.1fx heapq)' \
+              % ('IndexedBinaryHeap(arity=%d)' % arity, secs,
+                 secs/heapq_secs)
+
+
+def bench_top_k_merge(num_items, num_keys, num_runs=500):
+    '''
+    Time streaming the num_keys smallest and largest of num_items keys,
+    and lazily merging num_runs sorted runs of them, against heapq and
+    sorting everything
+    '''
+
+    # Import packages
+    import heapq
+    import itertools
+    import random
+    import time
+    from pytools.graphs_trees import trees
+
+    # Init variables
+    rand = random.Random(0)
+    keys = [rand.random() for _ in xrange(num_items)]
+    runs = [sorted(keys[idx::num_runs]) for idx in xrange(num_runs)]
+
+    # Top-k over a stream
+    timings = [('sorted', lambda: sorted(keys)[:num_keys]),
+               ('heapq.nsmallest',
+                lambda: heapq.nsmallest(num_keys, iter(keys))),
+               ('k_smallest', lambda: trees.k_smallest(iter(keys), num_keys)),
+               ('k_largest', lambda: trees.k_largest(iter(keys), num_keys))]
+    for name, func in timings:
+        start = time.time()
+        func()
+        print '%28s %d of %d: %.3fs' % (name, num_keys, num_items,
+                                        time.time() - start)
+
+    # Lazy merge of sorted runs
+    timings = [('sorted(chain)', lambda: sorted(itertools.chain(*runs))),
+               ('heapq.merge', lambda: list(heapq.merge(*runs))),
+               ('merge_sorted', lambda: list(trees.merge_sorted(runs))),
+               ('merge_sorted(arity=4)',
+                lambda: list(trees.merge_sorted(runs, arity=4)))]
+    for name, func in timings:
+        start = time.time()
+        func()
+        print '%28s merge %d runs: %.3fs' % (name, num_runs,
+                                             time.time() - start)
+
+
+# Make executable
+if __name__ == '__main__':
+
+    # Import packages
+    import argparse
+
+    # Init argparser
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-w', '--words', type=int, default=100000,
+                        help='Number of random words to insert')
+    parser.add_argument('-k', '--max_k', type=int, default=10,
+                        help='Completions cached per autocomplete node')
+    parser.add_argument('-p', '--paths', type=int, default=100000,
+                        help='Number of random URL paths for the radix trie')
+    parser.add_argument('-n', '--keys', type=int, default=1000000,
+                        help='Largest number of keys in the search trees')
+    parser.add_argument('-q', '--heap_items', type=int, default=1000000,
+                        help='Number of items pushed through the heaps')
+    parser.add_argument('-t', '--top_k', type=int, default=100,
+                        help='Number of keys kept by the top-k streams')
+    args = parser.parse_args()
+
+    # Run benchmarks
+    bench_trie(args.words)
+    bench_autocomplete(args.words, args.max_k)
+    bench_radix_trie(args.paths)
+    bench_avl_tree(args.keys)
+    bench_bulk_build(args.keys)
+    bench_heaps(args.heap_items)
+    bench_top_k_merge(args.heap_items, args.top_k)
@@ -0,0 +1,174 @@
+# test/benchmark/graphs_trees/utils_bench.py
+#
+# Author: Daniel Clark, 2016
+
+'''
+Benchmark script for the graphs_trees utils module
+
+Usage: python -m test.benchmark.graphs_trees.utils_bench [-n <nodes>]
+           [-c <check nodes>]
+'''
+
+
+def degenerate_array_tree(num_nodes):
+    '''
+    Build an ArrayTree that is a single chain of right children
+    '''
+
+    # Import packages
+    import numpy as np
+    from pytools.graphs_trees import utils
+
+    # Node i has node i+1 as its right child
+    right = np.arange(1, num_nodes + 1, dtype=np.int64)
+    right[-1] = -1
+    return utils.ArrayTree(np.arange(num_nodes),
+                           np.full(num_nodes, -1, dtype=np.int64), right)
+
+
+def bench_array_tree(num_nodes):
+    '''
+    Time the ArrayTree utilities on balanced and degenerate trees
+    '''
+
+    # Import packages
+    import time
+    import numpy as np
+    from pytools.graphs_trees import utils
+
+    # Balanced tree from a sorted array
+    start = time.time()
+    balanced = utils.ArrayTree.from_sorted(np.arange(num_nodes))
+    print 'ArrayTree.from_sorted n=%d: %.3fs' \
+          % (num_nodes, time.time() - start)
+    degenerate = degenerate_array_tree(num_nodes)
+
+    # Time each utility on both shapes
+    for name, array_tree in [('balanced', balanced),
+                             ('degenerate', degenerate)]:
+        start = time.time()
+        max_height, min_height = array_tree._height_bounds()
+        height_secs = time.time() - start
+        start = time.time()
+        array_tree.traverse('in')
+        traverse_secs = time.time() - start
+        start = time.time()
+        array_tree.is_bst()
+        bst_secs = time.time() - start
+        print '%10s heights %d/%d: %.3fs, in-order: %.3fs, is_bst: %.3fs' \
+              % (name, max_height, min_height, height_secs, traverse_secs,
+                 bst_secs)
+
+
+def bench_tree_checks(num_nodes):
+    '''
+    Time the single pass tree checks on a balanced BinaryTree, where
+    they visit every node, and on a degenerate chain, where they stop
+    at the first violation
+    '''
+
+    # Import packages
+    import time
+    import numpy as np
+    from pytools.graphs_trees import trees, utils
+
+    # Balanced tree and a chain of right children
+    balanced = utils.ArrayTree.from_sorted(np.arange(num_nodes))
+    balanced = balanced.to_binary_tree()
+    degenerate = node = trees.BinaryTree(0)
+    for value in xrange(1, num_nodes):
+        node.right_child = trees.BinaryTree(value)
+        node = node.right_child
+    # Chain that is a valid BST but breaks it at the last node
+    node.value = -1
+
+    # Time each check on both shapes
+    checks = [('check_tree_balanced', utils.check_tree_balanced),
+              ('check_height_balanced', utils.check_height_balanced),
+              ('validate_bst', utils.validate_bst)]
+    for name, bin_tree in [('balanced', balanced),
+                           ('degenerate', degenerate)]:
+        for check_name, check in checks:
+            start = time.time()
+            result = check(bin_tree)
+            print '%10s %22s: %-5s %.3fs' \
+                  % (name, check_name, bool(result), time.time() - start)
+
+
+def bench_traversals(num_nodes):
+    '''
+    Time streaming every value of a balanced BinaryTree through each
+    traversal generator, and the joined string form
+    '''
+
+    # Import packages
+    import collections
+    import time
+    import numpy as np
+    from pytools.graphs_trees import utils
+
+    # Balanced tree
+    bin_tree = utils.ArrayTree.from_sorted(np.arange(num_nodes))
+    bin_tree = bin_tree.to_binary_tree()
+
+    # Drain each generator without keeping the values
+    for name, iter_func in [('pre-order', utils.iter_pre_order),
+                            ('in-order', utils.iter_in_order),
+                            ('post-order', utils.iter_post_order),
+                            ('level-order', utils.iter_level_order),
+                            ('morris in-order', utils.iter_morris_in_order)]:
+        start = time.time()
+        collections.deque(iter_func(bin_tree), maxlen=0)
+        print '%16s: %.3fs' % (name, time.time() - start)
+    start = time.time()
+    utils.in_order_traverse(bin_tree)
+    print '%16s: %.3fs' % ('in_order_traverse', time.time() - start)
+
+
+def bench_levels(num_nodes):
+    '''
+    Time per-depth statistics on a BinarySearchTree, collecting the
+    levels as NumPy arrays against the linked lists of llists_from_bst
+    '''
+
+    # Import packages
+    import time
+    import numpy as np
+    from pytools.graphs_trees import trees, utils
+
+    # Balanced search tree
+    bst = trees.BinarySearchTree.from_sorted(np.arange(num_nodes),
+                                             np.random.rand(num_nodes))
+
+    # Mean value per depth from the arrays
+    start = time.time()
+    means = [level.mean() for level in utils.iter_levels(bst, 'array')]
+    print 'iter_levels arrays, %d level means: %.3fs' \
+          % (len(means), time.time() - start)
+
+    # Linked lists
+    start = time.time()
+    llists = utils.llists_from_bst(bst)
+    print 'llists_from_bst, %d linked lists:  %.3fs' \
+          % (len(llists), time.time() - start)
+
+
+# Make executable
+if __name__ == '__main__':
+
+    # Import packages
+    import argparse
+
+    # Init argparser
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', '--nodes', type=int, default=10000000,
+                        help='Number of nodes in the trees')
+    parser.add_argument('-c', '--check_nodes', type=int, default=1000000,
+                        help='Number of nodes in the trees to check')
+    args = parser.parse_args()
+
+    # Run benchmarks
+    bench_array_tree(args.nodes)
+    bench_tree_checks(args.check_nodes)
+    bench_traversals(args.check_nodes)
+    bench_levels(args.check_nodes)
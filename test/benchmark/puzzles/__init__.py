@@ -0,0 +1,7 @@
+# test/benchmark/puzzles/__init__.py
+#
+# Author: Daniel Clark, 2016
+
+'''
+Benchmarks for the pytools.puzzles package
+'''
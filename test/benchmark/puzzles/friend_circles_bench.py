@@ -0,0 +1,88 @@
+# test/benchmark/puzzles/friend_circles_bench.py
+#
+# Author: Daniel Clark, 2016
+
+'''
+Benchmark script for the friend_circles module
+
+Usage: python -m test.benchmark.puzzles.friend_circles_bench
+           [-n <num_students> [<num_students> ...]] [-f <friends_each>]
+'''
+
+
+def random_friends(num_students, friends_each=2, rnd_seed=0):
+    '''
+    Generate a random symmetric boolean friendship matrix where every
+    student is friends with themselves and about friends_each others
+    '''
+
+    # Import packages
+    import numpy as np
+
+    # Init variables
+    rand = np.random.RandomState(rnd_seed)
+    matrix = np.zeros((num_students, num_students), dtype=bool)
+    students = np.arange(num_students)
+
+    # Set the diagonal and random symmetric friendships
+    matrix[students, students] = True
+    rows = rand.randint(0, num_students, num_students*friends_each//2)
+    cols = rand.randint(0, num_students, num_students*friends_each//2)
+    matrix[rows, cols] = True
+    matrix[cols, rows] = True
+
+    # Return the matrix
+    return matrix
+
+
+def bench_friend_circles(num_students, friends_each):
+    '''
+    Compare the 'Y'/'N' row function against the boolean and bit-packed
+    NumPy matrix functions
+    '''
+
+    # Import packages
+    import time
+    import numpy as np
+    from pytools.puzzles import friend_circles
+
+    # Build the inputs
+    matrix = random_friends(num_students, friends_each)
+    packed = np.packbits(matrix, axis=1)
+    rows = np.where(matrix, 'Y', 'N').view('S%d' % num_students).ravel()
+    print 'n=%d' % num_students
+
+    # Time each form
+    start = time.time()
+    num_circles = friend_circles.friend_circles(rows)
+    print '  friend_circles (rows):   %8.3fs, %d circles' \
+          % (time.time() - start, num_circles)
+    start = time.time()
+    num_circles = friend_circles.friend_circles_matrix(matrix)
+    print '  friend_circles_matrix:   %8.3fs, %d circles' \
+          % (time.time() - start, num_circles)
+    start = time.time()
+    num_circles = friend_circles.friend_circles_matrix(
+        packed, num_students=num_students)
+    print '  friend_circles_matrix (packed): %.3fs, %d circles' \
+          % (time.time() - start, num_circles)
+
+
+# Make executable
+if __name__ == '__main__':
+
+    # Import packages
+    import argparse
+
+    # Init argparser
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', '--num_students', type=int, nargs='+',
+                        default=[1000, 10000],
+                        help='Matrix sizes to run, e.g. 1000 10000 50000')
+    parser.add_argument('-f', '--friends_each', type=int, default=2,
+                        help='Average number of friends per student')
+    args = parser.parse_args()
+
+    # Run benchmarks
+    for num_students in args.num_students:
+        bench_friend_circles(num_students, args.friends_each)
@@ -0,0 +1,105 @@
+# test/benchmark/puzzles/maze_bench.py
+#
+# Author: Daniel Clark, 2016
+
+'''
+Benchmark script for the maze module
+
+Usage: python -m test.benchmark.puzzles.maze_bench [-s <side>]
+                                                   [-w <wall_fraction>]
+                                                   [-c <corridor side>]
+'''
+
+
+def serpentine_grid(side):
+    '''
+    Build a side x side maze that is one corridor winding back and
+    forth across the rows, so every level of a search is a single cell
+    '''
+
+    # Import packages
+    import numpy as np
+
+    # Every odd row is a wall with a gap at alternating ends
+    grid = np.zeros((side, side), dtype=np.int8)
+    grid[1::2] = 1
+    grid[1::4, -1] = 0
+    grid[3::4, 0] = 0
+
+    return grid
+
+
+def bench_grid_search(side, wall_fraction):
+    '''
+    Time grid_bfs and grid_astar corner to corner on a random
+    side x side grid
+    '''
+
+    # Import packages
+    import time
+    import numpy as np
+    from pytools.puzzles import maze
+
+    # Build a random grid with open corners
+    rand = np.random.RandomState(0)
+    grid = (rand.random_sample((side, side)) < wall_fraction).astype(np.int8)
+    grid[0, 0] = grid[-1, -1] = 0
+    end = (side - 1, side - 1)
+    print '%d x %d grid, %.0f%% walls' % (side, side, 100*wall_fraction)
+
+    # Full BFS
+    start = time.time()
+    dist, parent = maze.grid_bfs(grid, (0, 0))
+    print '  grid_bfs (all cells):  %.3fs, %d moves to corner' \
+          % (time.time() - start, dist[end])
+
+    # Point-to-point searches
+    for method in ['bfs', 'astar']:
+        start = time.time()
+        path = maze.shortest_path(grid, (0, 0), end, method)
+        print '  shortest_path (%s): %.3fs, %s moves' \
+              % (method, time.time() - start,
+                 len(path) - 1 if path else None)
+
+
+def bench_corridor(side):
+    '''
+    Time grid_bfs and grid_astar end to end along a serpentine maze,
+    where the path is about side*side/2 moves
+    '''
+
+    # Import packages
+    import time
+    from pytools.puzzles import maze
+
+    # The corridor ends in a bottom corner
+    grid = serpentine_grid(side)
+    end = (side - 1, side - 1 if (side - 1) % 4 == 0 else 0)
+    print '%d x %d serpentine corridor' % (side, side)
+    for method in ['bfs', 'astar']:
+        start = time.time()
+        path = maze.shortest_path(grid, (0, 0), end, method)
+        print '  shortest_path (%s): %.3fs, %s moves' \
+              % (method, time.time() - start,
+                 len(path) - 1 if path else None)
+
+
+# Make executable
+if __name__ == '__main__':
+
+    # Import packages
+    import argparse
+
+    # Init argparser
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-s', '--side', type=int, default=4096,
+                        help='Number of rows and columns of the grid')
+    parser.add_argument('-w', '--wall_fraction', type=float, default=.2,
+                        help='Fraction of cells that are walls')
+    parser.add_argument('-c', '--corridor_side', type=int, default=4001,
+                        help='Number of rows and columns of the corridor')
+    args = parser.parse_args()
+
+    # Run benchmarks
+    bench_grid_search(args.side, args.wall_fraction)
+    bench_corridor(args.corridor_side)
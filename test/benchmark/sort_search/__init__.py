@@ -0,0 +1,7 @@
+# test/benchmark/sort_search/__init__.py
+#
+# Author: Daniel Clark, 2016
+
+'''
+Benchmarks for the pytools.sort_search package
+'''
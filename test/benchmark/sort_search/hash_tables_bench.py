@@ -0,0 +1,289 @@
+# test/benchmark/sort_search/hash_tables_bench.py
+#
+# Author: Daniel Clark, 2016
+
+'''
+Benchmark script for the hash_tables module
+
+Usage: python -m test.benchmark.sort_search.hash_tables_bench [-n <keys>]
+           [-c <counter keys>] [-s <stats keys>] [-t <strided keys>]
+'''
+
+
+def probe_summary(probe_lengths):
+    '''
+    Summarize a list of probe lengths as mean, 99th percentile, max
+    and the fraction of keys found on each of the first few probes
+    '''
+
+    # Init variables
+    probe_lengths = sorted(probe_lengths)
+    num_keys = len(probe_lengths)
+    counts = [0]*5
+    for length in probe_lengths:
+        counts[min(length, 5) - 1] += 1
+
+    # Format the summary
+    buckets = ' '.join('%s:%.2f' % (str(idx + 1) if idx < 4 else '5+',
+                                    float(count)/num_keys)
+                       for idx, count in enumerate(counts))
+    return 'mean %.2f, p99 %d, max %d, [%s]' \
+           % (float(sum(probe_lengths))/num_keys,
+              probe_lengths[int(num_keys*0.99)], probe_lengths[-1], buckets)
+
+
+def bench_hash_table(num_keys):
+    '''
+    Time put, get and missed lookups of random int keys for every
+    probing strategy against dict, and print the probe length
+    distribution each one ends up with
+    '''
+
+    # Import packages
+    import random
+    import time
+    from pytools.sort_search import hash_tables
+
+    # Init variables; misses are odd, keys are even
+    rand = random.Random(0)
+    keys = [rand.getrandbits(62)*2 for _ in xrange(num_keys)]
+    misses = [key + 1 for key in keys]
+
+    # dict baseline
+    start = time.time()
+    table = {}
+    for key in keys:
+        table[key] = key
+    put_secs = time.time() - start
+    start = time.time()
+    for key in keys:
+        table[key]
+    get_secs = time.time() - start
+    start = time.time()
+    for key in misses:
+        key in table
+    miss_secs = time.time() - start
+    print '%12s put: %.2fM/s, get: %.2fM/s, miss: %.2fM/s' \
+          % ('dict', num_keys/put_secs/1e6, num_keys/get_secs/1e6,
+             num_keys/miss_secs/1e6)
+    del table
+
+    # Each probing strategy
+    for probing in ('linear', 'quadratic', 'robin_hood'):
+        start = time.time()
+        table = hash_tables.HashTable(probing=probing)
+        for key in keys:
+            table.put(key, key)
+        put_secs = time.time() - start
+        start = time.time()
+        for key in keys:
+            table.get(key)
+        get_secs = time.time() - start
+        start = time.time()
+        for key in misses:
+            key in table
+        miss_secs = time.time() - start
+        print '%12s put: %.2fM/s, get: %.2fM/s, miss: %.2fM/s' \
+              % (probing, num_keys/put_secs/1e6, num_keys/get_secs/1e6,
+                 num_keys/miss_secs/1e6)
+        print '%12s probes: %s (load %.2f)' \
+              % ('', probe_summary(table.probe_lengths()),
+                 float(len(table))/table.size)
+        del table
+
+
+def bench_strided(num_keys):
+    '''
+    Time put and get of int keys 2**16 apart, which differ only above
+    the slot bits, for every table against dict, and print the probe
+    length distribution each one ends up with
+    '''
+
+    # Import packages
+    import time
+    import numpy as np
+    from pytools.sort_search import hash_tables
+
+    # Init variables
+    keys = [idx*2**16 for idx in xrange(num_keys)]
+    key_array = np.array(keys, dtype=np.int64)
+
+    # One key at a time
+    tables = [('dict', lambda: {})] + \
+             [(probing, lambda probing=probing:
+               hash_tables.HashTable(probing=probing))
+              for probing in ('linear', 'quadratic', 'robin_hood')] + \
+             [('IntHashTable', hash_tables.IntHashTable)]
+    for name, make_table in tables:
+        start = time.time()
+        table = make_table()
+        for key in keys:
+            table[key] = key
+        put_secs = time.time() - start
+        start = time.time()
+        for key in keys:
+            table[key]
+        get_secs = time.time() - start
+        print '%24s put: %.2fs, get: %.2fs' % (name, put_secs, get_secs)
+        if name != 'dict':
+            print '%24s probes: %s' \
+                  % ('', probe_summary(table.probe_lengths()))
+
+    # Vectorized batches
+    start = time.time()
+    int_table = hash_tables.IntHashTable()
+    int_table.put_many(key_array, key_array)
+    put_secs = time.time() - start
+    start = time.time()
+    int_table.get_many(key_array)
+    get_secs = time.time() - start
+    print '%24s put: %.2fs, get: %.2fs' \
+          % ('IntHashTable *_many', put_secs, get_secs)
+
+
+def deep_bytes(containers, contents):
+    '''
+    Total bytes of the containers plus every distinct object in the
+    contents iterables; shared objects, such as cached small ints, are
+    counted once
+    '''
+
+    # Import packages
+    import sys
+
+    # Containers, then distinct objects
+    total = sum(sys.getsizeof(container) for container in containers)
+    seen = set()
+    for objects in contents:
+        for obj in objects:
+            if id(obj) not in seen:
+                seen.add(id(obj))
+                total += sys.getsizeof(obj)
+
+    return total
+
+
+def bench_int_hash_table(num_keys):
+    '''
+    Time building and querying an int counter with IntHashTable, one
+    key at a time and in vectorized batches, against HashTable and
+    dict, and report the bytes each takes per entry
+    '''
+
+    # Import packages
+    import random
+    import time
+    import numpy as np
+    from pytools.sort_search import hash_tables
+
+    # Init variables; counts are small ints, as in a counter
+    rand = random.Random(0)
+    keys = [int(rand.getrandbits(62)) for _ in xrange(num_keys)]
+    counts = [rand.randrange(1, 100) for _ in xrange(num_keys)]
+    key_array = np.array(keys, dtype=np.int64)
+    count_array = np.array(counts, dtype=np.int64)
+
+    # One key at a time
+    tables = [('dict', {}), ('HashTable', hash_tables.HashTable()),
+              ('IntHashTable', hash_tables.IntHashTable())]
+    for name, table in tables:
+        start = time.time()
+        for key, count in zip(keys, counts):
+            table[key] = count
+        put_secs = time.time() - start
+        start = time.time()
+        for key in keys:
+            table[key]
+        get_secs = time.time() - start
+        print '%24s put: %.2fM/s, get: %.2fM/s' \
+              % (name, num_keys/put_secs/1e6, num_keys/get_secs/1e6)
+
+    # Vectorized batches
+    start = time.time()
+    int_table = hash_tables.IntHashTable()
+    int_table.put_many(key_array, count_array)
+    put_secs = time.time() - start
+    start = time.time()
+    int_table.get_many(key_array)
+    get_secs = time.time() - start
+    print '%24s put: %.2fM/s, get: %.2fM/s' \
+          % ('IntHashTable *_many', num_keys/put_secs/1e6,
+             num_keys/get_secs/1e6)
+
+    # Memory per entry
+    table = tables[0][1]
+    dict_bytes = deep_bytes([table], [table.iterkeys(), table.itervalues()])
+    table = tables[1][1]
+    list_bytes = deep_bytes([table.hash_slots, table.key_slots,
+                             table.val_slots],
+                            [table.hash_slots, table.key_slots,
+                             table.val_slots])
+    for name, num_bytes in [('dict', dict_bytes), ('HashTable', list_bytes),
+                            ('IntHashTable', int_table.nbytes)]:
+        print '%24s %.1f bytes/entry' % (name, float(num_bytes)/num_keys)
+
+
+def bench_stats(num_keys):
+    '''
+    Time put and get with and without track_stats for every probing,
+    and the cost of exporting the stats
+    '''
+
+    # Import packages
+    import random
+    import time
+    from pytools.sort_search import hash_tables
+
+    # Init variables
+    rand = random.Random(0)
+    keys = [rand.getrandbits(62) for _ in xrange(num_keys)]
+
+    # Each probing, untracked then tracked
+    for probing in ('linear', 'quadratic', 'robin_hood'):
+        op_secs = []
+        for track_stats in (False, True):
+            table = hash_tables.HashTable(probing=probing,
+                                          track_stats=track_stats)
+            start = time.time()
+            for key in keys:
+                table[key] = key
+            for key in keys:
+                table[key]
+            op_secs.append(time.time() - start)
+        start = time.time()
+        stats = table.stats()
+        stats_secs = time.time() - start
+        print '%12s put+get: %.2fs, tracked: %.2fs (+%.0f%%), ' \
+              'stats: %.2fs' % (probing, op_secs[0], op_secs[1],
+                                100*(op_secs[1]/op_secs[0] - 1), stats_secs)
+        print '%12s load %.2f, mean probes %.2f (lookups %.2f), max %d, ' \
+              'longest cluster %d, %d resizes in %.2fs' \
+              % ('', stats['load_factor'], stats['mean_probes'],
+                 stats['mean_lookup_probes'], stats['max_probes'],
+                 stats['longest_cluster'], stats['num_resizes'],
+                 stats['resize_secs'])
+
+
+# Make executable
+if __name__ == '__main__':
+
+    # Import packages
+    import argparse
+
+    # Init argparser
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', '--keys', type=int, default=10000000,
+                        help='Number of random keys to put in the tables')
+    parser.add_argument('-c', '--counter_keys', type=int, default=1000000,
+                        help='Number of keys in the int counter tables')
+    parser.add_argument('-s', '--stats_keys', type=int, default=1000000,
+                        help='Number of keys in the tables with stats')
+    parser.add_argument('-t', '--strided_keys', type=int, default=1000000,
+                        help='Number of keys 2**16 apart in the tables')
+    args = parser.parse_args()
+
+    # Run benchmarks
+    bench_hash_table(args.keys)
+    bench_int_hash_table(args.counter_keys)
+    bench_stats(args.stats_keys)
+    bench_strided(args.strided_keys)
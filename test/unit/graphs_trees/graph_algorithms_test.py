@@ -0,0 +1,173 @@
+# test/unit/graph_trees/graph_algorithms_test.py
+#
+# Author: Daniel Clark, 2016
+
+'''
+Unit test module to perform testing on the graph_algorithms module
+'''
+
+# Import packages
+import unittest
+
+
+class UnionFindTestCase(unittest.TestCase):
+    '''
+    TestCase for the UnionFind class from the graph_algorithms.py module
+    '''
+
+    # Set up test case
+    def setUp(self):
+        '''
+        Initialize test case with attributes
+        '''
+
+        # Init instance attributes
+        pass
+
+    def test_union_find(self):
+        '''
+        Test merging sets and counting them
+        '''
+
+        # Import packages
+        from pytools.graphs_trees import graph_algorithms
+
+        # Init union find
+        union_find = graph_algorithms.UnionFind(6)
+        self.assertEqual(union_find.num_sets, 6)
+
+        # Merge sets
+        self.assertTrue(union_find.union(0, 1))
+        self.assertTrue(union_find.union(2, 3))
+        self.assertTrue(union_find.union(1, 3))
+        self.assertFalse(union_find.union(0, 2))
+        self.assertEqual(union_find.num_sets, 3)
+        self.assertTrue(union_find.connected(0, 3))
+        self.assertFalse(union_find.connected(0, 4))
+        self.assertEqual(union_find.find(4), 4)
+
+
+class GraphAlgorithmsTestCase(unittest.TestCase):
+    '''
+    TestCase for the component and ordering functions from the
+    graph_algorithms.py module
+    '''
+
+    # Set up test case
+    def setUp(self):
+        '''
+        Initialize test case with attributes
+        '''
+
+        # Import packages
+        from pytools.graphs_trees import graphs
+
+        # Init a graph with cycles {a, b, c} and {d, e}, and a lone f
+        graph = graphs.Graph()
+        graph.add_edge('a', 'b')
+        graph.add_edge('b', 'c')
+        graph.add_edge('c', 'a')
+        graph.add_edge('c', 'd')
+        graph.add_edge('d', 'e')
+        graph.add_edge('e', 'd')
+        graph.add_vertex('f')
+
+        # Init a dag of getting dressed
+        dag = graphs.Graph()
+        dag.add_edge('undershorts', 'pants')
+        dag.add_edge('undershorts', 'shoes')
+        dag.add_edge('pants', 'belt')
+        dag.add_edge('pants', 'shoes')
+        dag.add_edge('shirt', 'belt')
+        dag.add_edge('shirt', 'tie')
+        dag.add_edge('tie', 'jacket')
+        dag.add_edge('belt', 'jacket')
+        dag.add_edge('socks', 'shoes')
+        dag.add_vertex('watch')
+
+        # Set attributes
+        self.graph = graph
+        self.dag = dag
+
+    def test_connected_components(self):
+        '''
+        Test weakly connected components on both graph types
+        '''
+
+        # Import packages
+        from pytools.graphs_trees import graph_algorithms, graphs
+
+        # Init variables
+        compact = graphs.CompactGraph.from_graph(self.graph)
+
+        for graph in (self.graph, compact):
+            components = graph_algorithms.connected_components(graph)
+            components = sorted(sorted(comp) for comp in components)
+            self.assertEqual(components, [['a', 'b', 'c', 'd', 'e'], ['f']])
+
+    def test_strongly_connected_components(self):
+        '''
+        Test the strongly connected components and their order
+        '''
+
+        # Import packages
+        from pytools.graphs_trees import graph_algorithms, graphs
+
+        # Init variables
+        compact = graphs.CompactGraph.from_graph(self.graph)
+
+        for graph in (self.graph, compact):
+            components = graph_algorithms.strongly_connected_components(graph)
+            components = [sorted(comp) for comp in components]
+            self.assertEqual(sorted(components),
+                             [['a', 'b', 'c'], ['d', 'e'], ['f']])
+            # {d, e} is downstream of {a, b, c}, so it comes first
+            self.assertLess(components.index(['d', 'e']),
+                            components.index(['a', 'b', 'c']))
+
+    def test_strongly_connected_components_deep(self):
+        '''
+        Test a cycle far longer than the recursion limit
+        '''
+
+        # Import packages
+        import sys
+        from pytools.graphs_trees import graph_algorithms, graphs
+
+        # Init a long ring
+        num_vertices = sys.getrecursionlimit()*5
+        graph = graphs.Graph()
+        for key in xrange(num_vertices):
+            graph.add_edge(key, (key+1) % num_vertices)
+
+        # One big component
+        components = graph_algorithms.strongly_connected_components(graph)
+        self.assertEqual(len(components), 1)
+        self.assertEqual(len(components[0]), num_vertices)
+
+    def test_topological_sort(self):
+        '''
+        Test every edge goes forward in the topological order
+        '''
+
+        # Import packages
+        from pytools.graphs_trees import graph_algorithms, graphs
+
+        # Init variables
+        compact = graphs.CompactGraph.from_graph(self.dag)
+
+        for graph in (self.dag, compact):
+            order = graph_algorithms.topological_sort(graph)
+            self.assertEqual(sorted(order), sorted(self.dag.get_vertices()))
+            position = dict((key, idx) for idx, key in enumerate(order))
+            for key in order:
+                for nbr_key in graph.get_connections(key):
+                    self.assertLess(position[key], position[nbr_key])
+
+        # Graphs with cycles cannot be sorted
+        self.assertRaises(ValueError, graph_algorithms.topological_sort,
+                          self.graph)
+
+
+if __name__ == '__main__':
+    unittest.main()
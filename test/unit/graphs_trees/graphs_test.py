@@ -123,5 +123,469 @@ class GraphTestCase(unittest.TestCase):
         self.graph.clear_visited()
 
 
+class DFSTestCase(unittest.TestCase):
+    '''
+    TestCase for the dfs functions and DFSGraph class from the graphs.py
+    module
+    '''
+
+    # Set up test case
+    def setUp(self):
+        '''
+        Initialize test case with attributes
+        '''
+
+        # Import packages
+        from pytools.graphs_trees import graphs
+
+        # Init a small graph with a known DFS ordering
+        graph = graphs.DFSGraph()
+        graph.add_edge('a', 'b')
+        graph.add_edge('b', 'c')
+        graph.add_edge('a', 'd')
+
+        # Set attributes
+        self.graph = graph
+
+    def test_timestamps(self):
+        '''
+        Test the discovery/finish times follow the parenthesis structure
+        of a DFS and match the vertex attributes
+        '''
+
+        # Import packages
+        from pytools.graphs_trees import graphs
+
+        # Search from a only
+        result = graphs.dfs(self.graph, ['a'])
+        self.assertEqual(result.discovery('a'), 1)
+        self.assertEqual(result.finish('a'), 8)
+        for key in ['b', 'c', 'd']:
+            self.assertTrue(result.discovery('a') < result.discovery(key) <
+                            result.finish(key) < result.finish('a'))
+        self.assertEqual(result.predecessor('c'), 'b')
+        self.assertIsNone(result.predecessor('a'))
+
+        # Full search populates the vertices
+        result = self.graph.depth_first_search()
+        for vertex in self.graph:
+            self.assertEqual(vertex.disc, result.discovery(vertex.key))
+            self.assertEqual(vertex.fin, result.finish(vertex.key))
+
+    def test_deep_graph(self):
+        '''
+        Test searching a path far longer than the recursion limit
+        '''
+
+        # Import packages
+        import sys
+        from pytools.graphs_trees import graphs
+
+        # Init a long path graph
+        num_vertices = sys.getrecursionlimit()*5
+        graph = graphs.DFSGraph()
+        for key in xrange(num_vertices - 1):
+            graph.add_edge(key, key+1)
+
+        # Search and find routes without recursion
+        result = graph.depth_first_search()
+        self.assertEqual(result.predecessor(num_vertices-1), num_vertices-2)
+        self.assertTrue(graph.find_route_dfs(0, num_vertices-1))
+        self.assertFalse(graph.find_route_dfs(num_vertices-1, 0))
+
+    def test_dfs_events(self):
+        '''
+        Test the event generator order and stopping early
+        '''
+
+        # Import packages
+        from pytools.graphs_trees import graphs
+
+        # Gather all events from a
+        events = list(graphs.dfs_events(self.graph, ['a']))
+        self.assertEqual(len(events), 8)
+        self.assertEqual(events[0], ('a', 'discover'))
+        self.assertEqual(events[-1], ('a', 'finish'))
+        self.assertIn(('c', 'finish'), events)
+        self.assertLess(events.index(('c', 'finish')),
+                        events.index(('b', 'finish')))
+
+        # Stop as soon as c is discovered
+        compact = graphs.CompactGraph.from_graph(self.graph)
+        for graph in (self.graph, compact):
+            seen = []
+            for key, event in graphs.dfs_events(graph, ['a']):
+                seen.append(key)
+                if key == 'c':
+                    break
+            self.assertEqual(seen[-1], 'c')
+            self.assertLess(len(seen), 8)
+
+
+class WordLadderTestCase(unittest.TestCase):
+    '''
+    TestCase for the word-ladder functions from the graphs.py module
+    '''
+
+    # Set up test case
+    def setUp(self):
+        '''
+        Initialize test case with attributes
+        '''
+
+        # Import packages
+        import os
+        from pytools.graphs_trees import graphs
+
+        # Init variables
+        self.words_fp = os.path.join(os.path.dirname(__file__), 'words.txt')
+        self.graph = graphs.build_wordladder_graph(self.words_fp)
+
+    def test_find_word_ladder(self):
+        '''
+        Test every search method finds the same shortest ladders
+        '''
+
+        # Import packages
+        from pytools.graphs_trees import graphs
+
+        for method in ['bidirectional', 'astar', 'bfs']:
+            ladder = graphs.find_word_ladder(self.graph, 'haul', 'tall',
+                                             method=method)
+            self.assertEqual(ladder, ['haul', 'hall', 'tall'])
+            ladder = graphs.find_word_ladder(self.graph, 'show', 'thaw',
+                                             method=method)
+            self.assertEqual(ladder, ['show', 'shaw', 'thaw'])
+            ladder = graphs.find_word_ladder(self.graph, 'ball', 'ball',
+                                             method=method)
+            self.assertEqual(ladder, ['ball'])
+            ladder = graphs.find_word_ladder(self.graph, 'haul', 'know',
+                                             method=method)
+            self.assertIsNone(ladder)
+        self.assertRaises(ValueError, graphs.find_word_ladder, self.graph,
+                          'haul', 'tall', 'dfs')
+
+    def test_implicit_graph(self):
+        '''
+        Test the implicit word-ladder graph has the same connections as
+        the explicit one and can be searched directly
+        '''
+
+        # Import packages
+        from pytools.graphs_trees import graphs
+
+        # Read in tiny chunks to exercise the streaming loader
+        implicit = graphs.WordLadderGraph.from_file(self.words_fp,
+                                                    chunk_size=8)
+        self.assertEqual(len(implicit), 13)
+        self.assertIn('haul', implicit)
+        self.assertNotIn('hail', implicit)
+        for word in self.graph.get_vertices():
+            self.assertEqual(sorted(implicit.get_connections(word)),
+                             sorted(self.graph.get_connections(word)))
+
+        # Search without materializing edges
+        implicit = graphs.build_wordladder_graph(self.words_fp, implicit=True)
+        for method in ['bidirectional', 'astar', 'bfs']:
+            ladder = graphs.find_word_ladder(implicit, 'haul', 'tall',
+                                             method=method)
+            self.assertEqual(ladder, ['haul', 'hall', 'tall'])
+        self.assertEqual(graphs.bfs(implicit, ['glow']).distance('blow'), 1)
+
+        # Words can be added incrementally; repeats are ignored
+        implicit.add_words(['hail', 'haul', ''])
+        self.assertEqual(len(implicit), 14)
+        self.assertEqual(graphs.find_word_ladder(implicit, 'hail', 'ball'),
+                         ['hail', 'hall', 'ball'])
+
+    def test_bidirectional_bfs_directed(self):
+        '''
+        Test bidirectional search on a directed graph with the reverse
+        connections specified
+        '''
+
+        # Import packages
+        from pytools.graphs_trees import graphs
+
+        # Init a directed ring 0 -> 1 -> ... -> 9 -> 0
+        graph = graphs.Graph()
+        reverse = {}
+        for key in range(10):
+            graph.add_edge(key, (key+1) % 10)
+            reverse[(key+1) % 10] = [key]
+
+        # Path must follow the edge directions
+        path = graphs.bidirectional_bfs(graph, 8, 2,
+                                        reverse_connections=reverse.get)
+        self.assertEqual(path, [8, 9, 0, 1, 2])
+
+    def test_astar_inconsistent_heuristic(self):
+        '''
+        Test A* finds a shortest path with a heuristic that never
+        overestimates but is not consistent, so a vertex that was
+        already expanded is reached again by a shorter path
+        '''
+
+        # Import packages
+        from pytools.graphs_trees import graphs
+
+        # Shortest path S-A-X-Y-G; the estimate at A holds it back
+        # until the longer path through B and C has expanded X
+        graph = graphs.Graph()
+        for from_key, to_key in [('S', 'A'), ('S', 'B'), ('B', 'C'),
+                                 ('C', 'X'), ('A', 'X'), ('X', 'Y'),
+                                 ('Y', 'G')]:
+            graph.add_edge(from_key, to_key)
+        heuristic = lambda key, end_key: 3 if key == 'A' else 0
+        path = graphs.astar_search(graph, 'S', 'G', heuristic)
+        self.assertEqual(path, ['S', 'A', 'X', 'Y', 'G'])
+
+    def test_hamming_distance(self):
+        '''
+        Test the hamming distance between words
+        '''
+
+        # Import packages
+        from pytools.graphs_trees import graphs
+
+        self.assertEqual(graphs.hamming_distance('fall', 'fall'), 0)
+        self.assertEqual(graphs.hamming_distance('fall', 'tall'), 1)
+        self.assertEqual(graphs.hamming_distance('know', 'glow'), 2)
+
+
+class BFSTestCase(unittest.TestCase):
+    '''
+    TestCase for the bfs function and BFSResult class from the graphs.py
+    module
+    '''
+
+    # Set up test case
+    def setUp(self):
+        '''
+        Initialize test case with attributes
+        '''
+
+        # Import packages
+        from pytools.graphs_trees import graphs
+
+        # Init a path graph 0 -> 1 -> ... -> 9 with a shortcut 0 -> 5
+        graph = graphs.Graph()
+        for key in range(9):
+            graph.add_edge(key, key+1)
+        graph.add_edge(0, 5)
+
+        # Set attributes
+        self.graph = graph
+        self.compact = graphs.CompactGraph.from_graph(graph)
+
+    def test_bfs_paths(self):
+        '''
+        Test shortest distances and path reconstruction on both graph
+        types, without touching the vertices
+        '''
+
+        # Import packages
+        from pytools.graphs_trees import graphs
+
+        for graph in (self.graph, self.compact):
+            result = graphs.bfs(graph, [0])
+            self.assertEqual(result.distance(9), 5)
+            self.assertEqual(result.path_to(9), [0, 5, 6, 7, 8, 9])
+            self.assertEqual(result.path_to(0), [0])
+            self.assertEqual(sorted(result.reached()), range(10))
+
+            # A second search is not affected by the first
+            result = graphs.bfs(graph, [6])
+            self.assertNotIn(5, result)
+            self.assertRaises(KeyError, result.path_to, 5)
+
+        # Vertex state is untouched
+        self.assertEqual(self.graph.get_vertex(9).color, 'white')
+
+    def test_bfs_options(self):
+        '''
+        Test early exit on a target, multiple sources and depth limits
+        '''
+
+        # Import packages
+        from pytools.graphs_trees import graphs
+
+        for graph in (self.graph, self.compact):
+            # Early exit leaves further vertices unsearched
+            result = graphs.bfs(graph, [0], target_key=5)
+            self.assertTrue(result.found)
+            self.assertEqual(result.path_to(5), [0, 5])
+            self.assertNotIn(7, result)
+
+            # Unreachable target
+            result = graphs.bfs(graph, [6], target_key=2)
+            self.assertFalse(result.found)
+
+            # Multiple sources
+            result = graphs.bfs(graph, [2, 7])
+            self.assertEqual(result.distance(4), 2)
+            self.assertEqual(result.distance(9), 2)
+            self.assertEqual(result.path_to(8), [7, 8])
+
+            # Depth limit
+            result = graphs.bfs(graph, [0], max_depth=2)
+            self.assertEqual(sorted(result.reached()), [0, 1, 2, 5, 6])
+
+            # Missing keys
+            self.assertRaises(KeyError, graphs.bfs, graph, [42])
+
+    def test_bfs_distance_matrix(self):
+        '''
+        Test the parallel distance matrix matches single searches, with
+        and without worker processes
+        '''
+
+        # Import packages
+        from pytools.graphs_trees import graphs
+
+        # Init variables
+        start_keys = [0, 3, 9, 5]
+
+        for processes in (1, 2):
+            dist_matrix, keys = graphs.bfs_distance_matrix(
+                self.graph, start_keys, processes=processes)
+            self.assertEqual(dist_matrix.shape, (4, 10))
+            for row, start_key in enumerate(start_keys):
+                result = graphs.bfs(self.graph, [start_key])
+                for col, key in enumerate(keys):
+                    dist = result.distance(key)
+                    self.assertEqual(dist_matrix[row, col],
+                                     -1 if dist is None else dist)
+
+        # No sources and missing sources
+        dist_matrix, keys = graphs.bfs_distance_matrix(self.compact, [])
+        self.assertEqual(dist_matrix.shape, (0, 10))
+        self.assertRaises(KeyError, graphs.bfs_distance_matrix, self.graph,
+                          [42])
+
+
+class CompactGraphTestCase(unittest.TestCase):
+    '''
+    TestCase for the CompactGraph class from the graphs.py module
+    '''
+
+    # Set up test case
+    def setUp(self):
+        '''
+        Initialize test case with attributes
+        '''
+
+        # Import packages
+        from pytools.graphs_trees import graphs
+
+        # Init variables
+        graph = graphs.DFSGraph()
+        edges = [('a', 'b', 1), ('a', 'c', 2), ('b', 'd', 3),
+                 ('c', 'd', 4), ('d', 'e', 5), ('f', 'a', 6)]
+        for from_key, to_key, weight in edges:
+            graph.add_edge(from_key, to_key, weight)
+
+        # Set attributes
+        self.edges = edges
+        self.graph = graph
+        self.compact = graphs.CompactGraph.from_graph(graph)
+
+    def test_from_graph(self):
+        '''
+        Test the compact graph keeps every vertex, edge and weight
+        '''
+
+        # Same vertices and number of edges
+        self.assertEqual(sorted(self.compact.get_vertices()),
+                         sorted(self.graph.get_vertices()))
+        self.assertEqual(self.compact.num_edges, len(self.edges))
+
+        # Same connections and weights
+        for from_key, to_key, weight in self.edges:
+            self.assertIn(to_key, self.compact.get_connections(from_key))
+            self.assertEqual(self.compact.get_weight(from_key, to_key),
+                             weight)
+        self.assertRaises(KeyError, self.compact.get_weight, 'e', 'a')
+
+    def test_from_edges(self):
+        '''
+        Test building a compact graph from an edge list, with and
+        without integer ids
+        '''
+
+        # Import packages
+        from pytools.graphs_trees import graphs
+
+        # Keyed edges
+        compact = graphs.CompactGraph.from_edges(iter(self.edges))
+        self.assertEqual(compact.num_vertices, 6)
+        self.assertEqual(sorted(compact.get_connections('a')), ['b', 'c'])
+        self.assertEqual(compact.get_weight('d', 'e'), 5)
+
+        # Integer id edges, unweighted
+        compact = graphs.CompactGraph.from_edges([(2, 0), (0, 1), (2, 1)],
+                                                 num_vertices=4,
+                                                 weighted=False)
+        self.assertEqual(compact.get_connections(2), [0, 1])
+        self.assertEqual(compact.get_connections(3), [])
+        self.assertEqual(compact.get_weight(0, 1), 0)
+        self.assertIn(3, compact)
+        self.assertNotIn(4, compact)
+
+    def test_breadth_first_search(self):
+        '''
+        Test BFS distances and predecessors on the compact graph match
+        the ones found on the Graph
+        '''
+
+        # Import packages
+        from pytools.graphs_trees import graphs
+
+        # Search both graphs
+        graphs.breadth_first_search(self.graph, self.graph.get_vertex('a'))
+        result = graphs.breadth_first_search(self.compact, 'a')
+
+        # Compare distances
+        for key in ['a', 'b', 'c', 'd', 'e']:
+            self.assertEqual(result.distance(key),
+                             self.graph.get_vertex(key).dist)
+        self.assertIsNone(result.distance('f'))
+        self.assertIsNone(result.predecessor('a'))
+        self.assertEqual(result.predecessor('e'), 'd')
+        self.assertEqual(result.path_to('e')[0], 'a')
+        self.assertEqual(len(result.path_to('e')), 4)
+
+    def test_depth_first_search(self):
+        '''
+        Test DFS timestamps on the compact graph match DFSGraph
+        '''
+
+        # Search both graphs
+        self.graph.depth_first_search()
+        result = self.compact.depth_first_search()
+
+        # Compare timestamps and predecessor tree
+        for vertex in self.graph:
+            self.assertEqual(result.discovery(vertex.key), vertex.disc)
+            self.assertEqual(result.finish(vertex.key), vertex.fin)
+            if vertex.pred:
+                self.assertEqual(result.predecessor(vertex.key),
+                                 vertex.pred.key)
+            else:
+                self.assertIsNone(result.predecessor(vertex.key))
+
+    def test_find_route_dfs(self):
+        '''
+        Test the find_route via depth-first searching function
+        '''
+
+        # Routes exist regardless of previous searches
+        self.assertTrue(self.compact.find_route_dfs('a', 'e'))
+        self.assertTrue(self.compact.find_route_dfs('f', 'd'))
+        self.assertFalse(self.compact.find_route_dfs('e', 'a'))
+        self.assertFalse(self.compact.find_route_dfs('a', 'a'))
+        self.assertRaises(ValueError, self.compact.find_route_dfs, 'a', 'z')
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
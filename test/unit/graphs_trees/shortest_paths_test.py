@@ -0,0 +1,113 @@
+# test/unit/graph_trees/shortest_paths_test.py
+#
+# Author: Daniel Clark, 2016
+
+'''
+Unit test module to perform testing on the shortest_paths module
+'''
+
+# Import packages
+import unittest
+
+
+class DijkstraTestCase(unittest.TestCase):
+    '''
+    TestCase for the dijkstra functions from the shortest_paths.py module
+    '''
+
+    # Set up test case
+    def setUp(self):
+        '''
+        Initialize test case with attributes
+        '''
+
+        # Import packages
+        from pytools.graphs_trees import graphs
+
+        # Init a graph where the fewest-edge path is not the lightest
+        graph = graphs.Graph()
+        graph.add_edge('a', 'b', 7)
+        graph.add_edge('a', 'c', 9)
+        graph.add_edge('a', 'f', 14)
+        graph.add_edge('b', 'c', 10)
+        graph.add_edge('b', 'd', 15)
+        graph.add_edge('c', 'd', 11)
+        graph.add_edge('c', 'f', 2)
+        graph.add_edge('d', 'e', 6)
+        graph.add_edge('e', 'f', 9)
+        graph.add_edge('f', 'e', 9)
+        graph.add_vertex('g')
+
+        # Set attributes
+        self.graph = graph
+        self.compact = graphs.CompactGraph.from_graph(graph)
+
+    def test_single_source(self):
+        '''
+        Test the distances to every target from a single source
+        '''
+
+        # Import packages
+        from pytools.graphs_trees import shortest_paths
+
+        # Init variables
+        expected = {'a': 0, 'b': 7, 'c': 9, 'd': 20, 'e': 20, 'f': 11}
+
+        for graph in (self.graph, self.compact):
+            result = shortest_paths.dijkstra(graph, 'a')
+            for key, dist in expected.items():
+                self.assertEqual(result.distance(key), dist)
+            self.assertIsNone(result.distance('g'))
+            self.assertEqual(result.path_to('e'), ['a', 'c', 'f', 'e'])
+            self.assertEqual(result.path_to('d'), ['a', 'c', 'd'])
+
+    def test_point_to_point(self):
+        '''
+        Test the point-to-point query stops early and finds the lightest
+        path
+        '''
+
+        # Import packages
+        from pytools.graphs_trees import shortest_paths
+
+        for graph in (self.graph, self.compact):
+            path, weight = shortest_paths.shortest_path(graph, 'a', 'f')
+            self.assertEqual(path, ['a', 'c', 'f'])
+            self.assertEqual(weight, 11)
+
+            # d and e are further than f, so they are never settled
+            result = shortest_paths.dijkstra(graph, 'a', target_key='f')
+            self.assertTrue(result.found)
+            self.assertNotIn('e', result)
+
+            # Unreachable vertex
+            path, weight = shortest_paths.shortest_path(graph, 'a', 'g')
+            self.assertIsNone(path)
+            self.assertIsNone(weight)
+            self.assertRaises(KeyError, shortest_paths.dijkstra, graph, 'z')
+
+    def test_negative_weight(self):
+        '''
+        Test a negative edge weight is rejected
+        '''
+
+        # Import packages
+        from pytools.graphs_trees import graphs, shortest_paths
+
+        # Add a negative edge
+        self.graph.add_edge('a', 'g', -1)
+        compact = graphs.CompactGraph.from_graph(self.graph)
+        for graph in (self.graph, compact):
+            self.assertRaises(ValueError, shortest_paths.dijkstra, graph, 'a')
+
+        # Negative edge back into a vertex that is already settled
+        graph = graphs.Graph()
+        graph.add_edge('a', 'b', 1)
+        graph.add_edge('b', 'a', -5)
+        compact = graphs.CompactGraph.from_graph(graph)
+        for graph in (graph, compact):
+            self.assertRaises(ValueError, shortest_paths.dijkstra, graph, 'a')
+
+
+if __name__ == '__main__':
+    unittest.main()
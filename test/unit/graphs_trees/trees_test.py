@@ -185,6 +185,265 @@ class TrieTestCase(unittest.TestCase):
         trie.print_contents()
 
 
+class CompactTrieTestCase(unittest.TestCase):
+    '''
+    TestCase for the CompactTrie class from the trees.py module
+    '''
+
+    # Set up test case
+    def setUp(self):
+        '''
+        Initialize test case with attributes
+        '''
+
+        # Init instance attributes
+        self.words = ['hello', 'howdy', 'panda', 'polarbear', 'polar',
+                      'hell', 'helsinki']
+
+    def _check_retrieve(self, trie):
+        '''
+        Check retrieval matches the Trie class on the test words
+        '''
+
+        # Retrieve full words and prefixes
+        err_msg = 'Retrieval returned: %s, expected: %s'
+        for prefix, expected in [('howdy', 'howdy'), ('panda', 'panda'),
+                                 ('polarb', 'polarbear'), ('pol', 'polar'),
+                                 ('hel', 'hell'), ('hell', 'hell'),
+                                 ('hello', 'hello'), ('hels', 'helsinki'),
+                                 ('', 'hell')]:
+            found = trie.retrieve(prefix)
+            self.assertEqual(found, expected, msg=err_msg % (found, expected))
+
+        # Assert that a KeyError is raised for non-existent prefix
+        self.assertRaises(KeyError, trie.retrieve, 'helb')
+        self.assertRaises(KeyError, trie.retrieve, 'hellos')
+
+    def test_insert_retrieve(self):
+        '''
+        Test we can insert and retrieve strings into CompactTrie properly
+        '''
+
+        # Import packages
+        from pytools.graphs_trees import trees
+
+        # Insert the strings one at a time
+        trie = trees.CompactTrie()
+        for word in self.words:
+            trie.insert(word)
+        trie.insert('hell')
+
+        # Check retrieval, membership and size
+        self._check_retrieve(trie)
+        self.assertEqual(len(trie), len(self.words))
+        self.assertTrue('polar' in trie)
+        self.assertFalse('pola' in trie)
+        self.assertFalse('polarbears' in trie)
+
+    def test_from_iterable(self):
+        '''
+        Test bulk loading builds the same trie as inserting one at a time
+        '''
+
+        # Import packages
+        from pytools.graphs_trees import trees
+
+        # Bulk load, with a repeated word
+        trie = trees.CompactTrie.from_iterable(self.words + ['panda'])
+        inserted = trees.CompactTrie()
+        for word in self.words:
+            inserted.insert(word)
+
+        # Same words and node count
+        self._check_retrieve(trie)
+        self.assertEqual(len(trie), len(self.words))
+        self.assertEqual(trie.num_nodes(), inserted.num_nodes())
+        for word in self.words:
+            self.assertTrue(word in trie)
+
+        # Words added after a bulk load reuse the existing nodes
+        num_nodes = trie.num_nodes()
+        trie.insert('hel')
+        self.assertEqual(trie.num_nodes(), num_nodes)
+        self.assertEqual(trie.retrieve('he'), 'hel')
+
+
+class AutocompleteTrieTestCase(unittest.TestCase):
+    '''
+    TestCase for the AutocompleteTrie class from the trees.py module
+    '''
+
+    # Set up test case
+    def setUp(self):
+        '''
+        Initialize test case with attributes
+        '''
+
+        # Init instance attributes
+        self.counts = {'hello': 5, 'hell': 2, 'helsinki': 7, 'help': 5,
+                       'howdy': 1, 'panda': 3, 'polar': 4, 'polarbear': 9}
+
+    def _brute_complete(self, counts, prefix, k):
+        '''
+        Rank the completions of prefix by sorting every matching word
+        '''
+        matches = [(-freq, word) for word, freq in counts.iteritems()
+                   if word.startswith(prefix)]
+        return [word for _, word in sorted(matches)[:k]]
+
+    def test_complete(self):
+        '''
+        Test completions are ranked by frequency, then string order
+        '''
+
+        # Import packages
+        from pytools.graphs_trees import trees
+
+        # Insert the words one at a time
+        trie = trees.AutocompleteTrie(max_k=3)
+        for word, freq in self.counts.iteritems():
+            trie.insert(word, freq)
+
+        # Check the completions
+        self.assertEqual(trie.complete('hel'), ['helsinki', 'hello', 'help'])
+        self.assertEqual(trie.complete('hel', 2), ['helsinki', 'hello'])
+        self.assertEqual(trie.complete('p'), ['polarbear', 'polar', 'panda'])
+        self.assertEqual(trie.complete('howdy'), ['howdy'])
+        self.assertEqual(trie.complete('x'), [])
+        self.assertRaises(ValueError, trie.complete, 'h', 4)
+
+        # Raising a frequency re-ranks it on the whole path
+        trie.insert('hell', 6)
+        self.assertEqual(trie.frequency('hell'), 8)
+        self.assertEqual(trie.complete('h'), ['hell', 'helsinki', 'hello'])
+        self.assertEqual(trie.retrieve('he'), 'hell')
+        self.assertRaises(ValueError, trie.insert, 'hell', 0)
+
+    def test_from_counts(self):
+        '''
+        Test bulk loading matches a brute force ranking at every prefix
+        '''
+
+        # Import packages
+        import random
+        from pytools.graphs_trees import trees
+
+        # Random words with repeated frequencies so ties get exercised
+        rand = random.Random(0)
+        counts = dict((''.join(rand.choice('abc')
+                               for _ in xrange(rand.randint(1, 6))),
+                       rand.randint(1, 5)) for _ in xrange(200))
+        bulk = trees.AutocompleteTrie.from_counts(counts, max_k=4)
+        inserted = trees.AutocompleteTrie(max_k=4)
+        for word, freq in counts.iteritems():
+            for _ in xrange(freq):
+                inserted.insert(word)
+
+        # Both tries give the brute force answer for every prefix
+        self.assertEqual(len(bulk), len(counts))
+        for word in counts:
+            for end in xrange(len(word) + 1):
+                prefix = word[:end]
+                expected = self._brute_complete(counts, prefix, 4)
+                self.assertEqual(bulk.complete(prefix), expected)
+                self.assertEqual(inserted.complete(prefix), expected)
+
+        # Counting repeated strings sets the frequencies
+        trie = trees.AutocompleteTrie.from_iterable(['b', 'a', 'b', 'ab'])
+        self.assertEqual(trie.complete(''), ['b', 'a', 'ab'])
+        self.assertEqual(trie.frequency('b'), 2)
+
+
+class RadixTrieTestCase(unittest.TestCase):
+    '''
+    TestCase for the RadixTrie class from the trees.py module
+    '''
+
+    # Set up test case
+    def setUp(self):
+        '''
+        Initialize test case with attributes
+        '''
+
+        # Init instance attributes
+        self.words = ['hello', 'howdy', 'panda', 'polarbear', 'polar',
+                      'hell', 'helsinki']
+
+    def test_insert_retrieve(self):
+        '''
+        Test we can insert and retrieve strings into RadixTrie properly
+        '''
+
+        # Import packages
+        from pytools.graphs_trees import trees
+
+        # Insert several strings
+        trie = trees.RadixTrie()
+        for word in self.words:
+            trie.insert(word)
+        trie.insert('polar')
+
+        # Retrieve full words and prefixes, including ones ending part
+        # way into a label
+        err_msg = 'Retrieval returned: %s, expected: %s'
+        for prefix, expected in [('howdy', 'howdy'), ('panda', 'panda'),
+                                 ('polarb', 'polarbear'), ('po', 'polar'),
+                                 ('hel', 'hell'), ('hell', 'hell'),
+                                 ('hello', 'hello'), ('hels', 'helsinki'),
+                                 ('', 'hell')]:
+            found = trie.retrieve(prefix)
+            self.assertEqual(found, expected, msg=err_msg % (found, expected))
+
+        # Assert that a KeyError is raised for non-existent prefix
+        self.assertRaises(KeyError, trie.retrieve, 'helb')
+        self.assertRaises(KeyError, trie.retrieve, 'hellos')
+
+        # Membership, size and sorted iteration
+        self.assertEqual(len(trie), len(self.words))
+        self.assertTrue('polar' in trie)
+        self.assertFalse('pola' in trie)
+        self.assertFalse('polarbears' in trie)
+        self.assertEqual(list(trie), sorted(self.words))
+
+    def test_delete(self):
+        '''
+        Test deleting words keeps the rest and re-compresses the paths
+        '''
+
+        # Import packages
+        from pytools.graphs_trees import trees
+
+        # Paths sharing long prefixes
+        paths = ['/usr/lib/python2.7/os.py', '/usr/lib/python2.7/re.py',
+                 '/usr/lib/python2.7', '/usr/bin/python']
+        trie = trees.RadixTrie()
+        for path in paths:
+            trie.insert(path)
+        num_nodes = trie.num_nodes()
+
+        # Remove a word that only marks an inner node
+        trie.delete('/usr/lib/python2.7')
+        self.assertFalse('/usr/lib/python2.7' in trie)
+        self.assertEqual(trie.retrieve('/usr/lib'),
+                         '/usr/lib/python2.7/os.py')
+        self.assertRaises(KeyError, trie.delete, '/usr/lib/python2.7')
+        self.assertRaises(KeyError, trie.delete, '/usr/lib')
+
+        # Removing a leaf merges its sibling back into the parent edge
+        trie.delete('/usr/lib/python2.7/os.py')
+        self.assertEqual(list(trie), ['/usr/bin/python',
+                                      '/usr/lib/python2.7/re.py'])
+        self.assertEqual(trie.num_nodes(), 4)
+        self.assertTrue(trie.num_nodes() < num_nodes)
+
+        # Removing everything leaves only the root
+        trie.delete('/usr/bin/python')
+        trie.delete('/usr/lib/python2.7/re.py')
+        self.assertEqual(len(trie), 0)
+        self.assertEqual(trie.num_nodes(), 1)
+        self.assertEqual(list(trie), [])
+
+
 class BinarySearchTreeTestCase(unittest.TestCase):
     '''
     TestCase for the BinarySearchTree class from the trees.py module
@@ -231,6 +490,41 @@ class BinarySearchTreeTestCase(unittest.TestCase):
         # Return BST populated
         return binary_search_tree
 
+    def _check_ordered_queries(self, tree, keys):
+        '''
+        Check the ordered queries of tree against the sorted keys
+        '''
+
+        # Import packages
+        import bisect
+
+        # Min, max, select and len
+        keys = sorted(keys)
+        self.assertEqual(len(tree), len(keys))
+        self.assertEqual(tree.min().key, keys[0])
+        self.assertEqual(tree.max().key, keys[-1])
+        self.assertEqual([tree.select(idx).key for idx in xrange(len(keys))],
+                         keys)
+        self.assertEqual(tree.select(-1).key, keys[-1])
+        self.assertRaises(IndexError, tree.select, len(keys))
+
+        # Queries between, on and outside the keys
+        probes = [keys[0] - 1, keys[-1] + 1] + keys + \
+                 [(low + high)/2.0 for low, high in zip(keys, keys[1:])]
+        for probe in probes:
+            idx = bisect.bisect_left(keys, probe)
+            self.assertEqual(tree.rank(probe), idx)
+            floor = tree.floor(probe)
+            ceiling = tree.ceiling(probe)
+            right = bisect.bisect_right(keys, probe)
+            self.assertEqual(floor.key if floor else None,
+                             keys[right-1] if right else None)
+            self.assertEqual(ceiling.key if ceiling else None,
+                             keys[idx] if idx < len(keys) else None)
+        for low, high in zip(probes, reversed(probes)):
+            expected = [key for key in keys if low <= key <= high]
+            self.assertEqual(list(tree.range(low, high)), expected)
+
     def test_insert_retrieve(self):
         '''
         Test the BST insert function
@@ -322,6 +616,348 @@ class BinarySearchTreeTestCase(unittest.TestCase):
         keys = [key for key in binary_search_tree]
         self.assertEqual(keys, sorted(keys))
 
+    def test_ordered_queries(self):
+        '''
+        Test range, floor, ceiling, rank, select, min and max, and that
+        subtree sizes stay correct through deletes
+        '''
+
+        # Import packages
+        import random
+        from pytools.graphs_trees import trees
+
+        # Populate the BST
+        binary_search_tree = self._populate_bst()
+        keys = [key for key, value in [self.kv1, self.kv2, self.kv3,
+                                       self.kv4, self.kv5, self.kv6,
+                                       self.kv7, self.kv8, self.kv9,
+                                       self.kv10]]
+        self._check_ordered_queries(binary_search_tree, keys)
+
+        # Delete nodes with every number of children, including the root
+        for key in [self.kv6[0], self.kv7[0], self.kv2[0],
+                    binary_search_tree.key]:
+            binary_search_tree.delete(key)
+            keys.remove(key)
+            self._check_ordered_queries(binary_search_tree, keys)
+
+        # Random keys, repeatedly deleting the root
+        rand = random.Random(0)
+        keys = rand.sample(xrange(1000), 200)
+        binary_search_tree = trees.BinarySearchTree(keys[0], keys[0])
+        for key in keys:
+            binary_search_tree[key] = key
+        self._check_ordered_queries(binary_search_tree, keys)
+        for _ in xrange(100):
+            keys.remove(binary_search_tree.key)
+            binary_search_tree.delete(binary_search_tree.key)
+        self._check_ordered_queries(binary_search_tree, keys)
+
+        # Delete the root while it has one child
+        root = trees.BinarySearchTree(2, '2')
+        root[1] = '1'
+        root[0] = '0'
+        root.delete(2)
+        self.assertEqual(list(root), [0, 1])
+        self.assertEqual(root.retrieve(0).parent, root)
+
+        # Empty the tree and refill it
+        root.delete(0)
+        root.delete(1)
+        self.assertEqual(len(root), 0)
+        self.assertEqual(list(root), [])
+        self.assertEqual(root.min(), None)
+        root[5] = '5'
+        self.assertEqual(list(root), [5])
+
+    def test_from_sorted(self):
+        '''
+        Test the bulk loader links parents, flags and sizes correctly
+        '''
+
+        # Import packages
+        import numpy as np
+        from pytools.graphs_trees import trees
+
+        # Build from a NumPy array, past the recursion limit
+        keys = np.arange(0, 6000, 2)
+        values = [str(key) for key in keys]
+        binary_search_tree = trees.BinarySearchTree.from_sorted(keys, values)
+        self.assertEqual(list(binary_search_tree), keys.tolist())
+        self.assertEqual(len(binary_search_tree), len(keys))
+        self.assertEqual(binary_search_tree.select(500).key, 1000)
+        self.assertEqual(binary_search_tree[1000].value, '1000')
+        small_tree = trees.BinarySearchTree.from_sorted(keys[:50])
+        self._check_ordered_queries(small_tree, keys[:50].tolist())
+
+        # Every link agrees with the parent pointer and child flags, and
+        # the depth is the minimum
+        node_stack = [(binary_search_tree, 1)]
+        max_depth = 0
+        while node_stack:
+            node, depth = node_stack.pop()
+            max_depth = max(max_depth, depth)
+            if node.left_child:
+                self.assertTrue(node.left_child.parent is node)
+                self.assertTrue(node.left_child.is_left_child)
+                self.assertFalse(node.left_child.is_right_child)
+                node_stack.append((node.left_child, depth + 1))
+            if node.right_child:
+                self.assertTrue(node.right_child.parent is node)
+                self.assertTrue(node.right_child.is_right_child)
+                self.assertFalse(node.right_child.is_left_child)
+                node_stack.append((node.right_child, depth + 1))
+        self.assertEqual(max_depth, len(keys).bit_length())
+
+        # It can be updated like any other tree
+        binary_search_tree.delete(binary_search_tree.key)
+        binary_search_tree[1] = '1'
+        self.assertEqual(binary_search_tree.rank(3), 3)
+
+        # Empty and unsorted input
+        empty = trees.BinarySearchTree.from_sorted([])
+        self.assertEqual(list(empty), [])
+        empty[1] = '1'
+        self.assertEqual(list(empty), [1])
+        self.assertRaises(ValueError, trees.BinarySearchTree.from_sorted,
+                          [1, 3, 2])
+        self.assertRaises(ValueError, trees.BinarySearchTree.from_sorted,
+                          [1, 1])
+        self.assertRaises(ValueError, trees.BinarySearchTree.from_sorted,
+                          [1, 2], ['1'])
+
+
+class AVLTreeTestCase(unittest.TestCase):
+    '''
+    TestCase for the AVLTree class from the trees.py module
+    '''
+
+    # Set up test case
+    def setUp(self):
+        '''
+        Initialize test case with attributes
+        '''
+
+        # Init instance attributes
+        self.kvs = [(32, '32'), (12, '12'), (72, '72'), (21, '21'),
+                    (100, '100'), (3.14, 'pi'), (99, 'red balloons'),
+                    (98, '98'), (101, 'dalmations'), (25, 'cents')]
+
+    def _check_balanced(self, tree):
+        '''
+        Check the ordering, stored heights and balance of every node
+        '''
+
+        # Init variables
+        heights = {None: 0}
+        sizes = {None: 0}
+        node_stack = [(tree.root, False)]
+
+        # Post-order walk so children are checked before parents
+        while node_stack:
+            node, visited = node_stack.pop()
+            if node is None:
+                continue
+            if not visited:
+                node_stack.extend([(node, True), (node.left_child, False),
+                                   (node.right_child, False)])
+                continue
+            left_height = heights[node.left_child]
+            right_height = heights[node.right_child]
+            self.assertTrue(abs(left_height - right_height) <= 1)
+            self.assertEqual(node.height, 1 + max(left_height, right_height))
+            self.assertEqual(node.size, 1 + sizes[node.left_child] +
+                             sizes[node.right_child])
+            heights[node] = node.height
+            sizes[node] = node.size
+        keys = list(tree)
+        self.assertEqual(keys, sorted(set(keys)))
+        self.assertEqual(len(keys), len(tree))
+
+    def _check_ordered_queries(self, tree, keys):
+        '''
+        Check the ordered queries of tree against the sorted keys
+        '''
+
+        # Import packages
+        import bisect
+
+        # Min, max, select and len
+        keys = sorted(keys)
+        self.assertEqual(len(tree), len(keys))
+        self.assertEqual(tree.min().key, keys[0])
+        self.assertEqual(tree.max().key, keys[-1])
+        self.assertEqual([tree.select(idx).key for idx in xrange(len(keys))],
+                         keys)
+        self.assertEqual(tree.select(-1).key, keys[-1])
+        self.assertRaises(IndexError, tree.select, len(keys))
+
+        # Queries between, on and outside the keys
+        probes = [keys[0] - 1, keys[-1] + 1] + keys + \
+                 [(low + high)/2.0 for low, high in zip(keys, keys[1:])]
+        for probe in probes:
+            idx = bisect.bisect_left(keys, probe)
+            self.assertEqual(tree.rank(probe), idx)
+            floor = tree.floor(probe)
+            ceiling = tree.ceiling(probe)
+            right = bisect.bisect_right(keys, probe)
+            self.assertEqual(floor.key if floor else None,
+                             keys[right-1] if right else None)
+            self.assertEqual(ceiling.key if ceiling else None,
+                             keys[idx] if idx < len(keys) else None)
+        for low, high in zip(probes, reversed(probes)):
+            expected = [key for key in keys if low <= key <= high]
+            self.assertEqual(list(tree.range(low, high)), expected)
+
+    def test_insert_retrieve(self):
+        '''
+        Test the AVLTree insert and retrieve functions
+        '''
+
+        # Import packages
+        from pytools.graphs_trees import trees
+
+        # Init tree and insert
+        tree = trees.AVLTree()
+        for key, value in self.kvs:
+            tree[key] = value
+        self._check_balanced(tree)
+
+        # And retrieve values
+        for key, value in self.kvs:
+            self.assertEqual(tree[key].value, value)
+            self.assertTrue(key in tree)
+        self.assertFalse(33 in tree)
+        self.assertEqual(tree.retrieve(33), None)
+        self.assertRaises(KeyError, tree.insert, 'a', 1)
+
+        # Overwrite and retrieve again
+        tree[3.14] = '3.14'
+        self.assertEqual(tree[3.14].value, '3.14')
+        self.assertEqual(len(tree), len(self.kvs))
+
+    def test_sorted_inserts(self):
+        '''
+        Test sorted and reversed keys still give a logarithmic height
+        '''
+
+        # Import packages
+        import math
+        from pytools.graphs_trees import trees
+
+        # Insert sorted and reversed runs past the recursion limit
+        num_keys = 5000
+        max_height = 1.44*math.log(num_keys + 2, 2)
+        for keys in [xrange(num_keys), xrange(num_keys, 0, -1)]:
+            tree = trees.AVLTree()
+            for key in keys:
+                tree.insert(key, str(key))
+            self.assertTrue(tree.height() <= max_height)
+            self._check_balanced(tree)
+
+    def test_delete(self):
+        '''
+        Test deleting nodes with every number of children, and random
+        deletes against a dict, keeps the tree balanced
+        '''
+
+        # Import packages
+        import random
+        from pytools.graphs_trees import trees
+
+        # Delete a leaf, a node with two children and the root
+        tree = trees.AVLTree()
+        for key, value in self.kvs:
+            tree[key] = value
+        for key in [3.14, 72, tree.root.key]:
+            tree.delete(key)
+            self.assertFalse(key in tree)
+            self._check_balanced(tree)
+        self.assertEqual(len(tree), len(self.kvs) - 3)
+        self.assertRaises(KeyError, tree.delete, 3.14)
+
+        # Random inserts and deletes
+        rand = random.Random(0)
+        tree = trees.AVLTree()
+        expected = {}
+        for _ in xrange(2000):
+            key = rand.randrange(300)
+            if key in expected and rand.random() < 0.5:
+                tree.delete(key)
+                del expected[key]
+            else:
+                tree[key] = key
+                expected[key] = key
+        self._check_balanced(tree)
+        self.assertEqual(list(tree), sorted(expected))
+
+        # Delete down to an empty tree
+        for key in expected:
+            tree.delete(key)
+        self.assertEqual(tree.root, None)
+        self.assertEqual(list(tree), [])
+
+    def test_ordered_queries(self):
+        '''
+        Test range, floor, ceiling, rank, select, min and max
+        '''
+
+        # Import packages
+        import random
+        from pytools.graphs_trees import trees
+
+        # Random keys
+        rand = random.Random(0)
+        keys = rand.sample(xrange(1000), 300)
+        tree = trees.AVLTree()
+        for key in keys:
+            tree[key] = key
+        self._check_ordered_queries(tree, keys)
+
+        # Sizes stay right through rotations on delete
+        for key in keys[:150]:
+            tree.delete(key)
+        self._check_balanced(tree)
+        self._check_ordered_queries(tree, keys[150:])
+
+        # Empty tree
+        tree = trees.AVLTree()
+        self.assertEqual(tree.min(), None)
+        self.assertEqual(tree.floor(1), None)
+        self.assertEqual(tree.rank(1), 0)
+        self.assertEqual(list(tree.range(0, 1)), [])
+        self.assertRaises(IndexError, tree.select, 0)
+
+    def test_from_sorted(self):
+        '''
+        Test the bulk loader builds a valid AVL tree that stays valid
+        through updates
+        '''
+
+        # Import packages
+        import numpy as np
+        from pytools.graphs_trees import trees
+
+        # Every size up to a few levels, from lists and NumPy arrays
+        for num_keys in range(1, 70):
+            keys = range(num_keys)
+            tree = trees.AVLTree.from_sorted(keys, [-key for key in keys])
+            self._check_balanced(tree)
+            self.assertEqual(tree.height(), num_keys.bit_length())
+        tree = trees.AVLTree.from_sorted(np.linspace(0, 1, 5000))
+        self._check_balanced(tree)
+        self.assertEqual(tree.select(4999).key, 1.0)
+
+        # Updates after a bulk load
+        tree = trees.AVLTree.from_sorted(xrange(0, 200, 2))
+        for key in xrange(1, 200, 4):
+            tree[key] = key
+        for key in xrange(0, 100, 2):
+            tree.delete(key)
+        self._check_balanced(tree)
+        self.assertEqual(len(trees.AVLTree.from_sorted([])), 0)
+        self.assertRaises(ValueError, trees.AVLTree.from_sorted, [2, 1])
+
 
 class BinaryHeapTestCase(unittest.TestCase):
     '''
@@ -363,6 +999,282 @@ class BinaryHeapTestCase(unittest.TestCase):
 
         self.assertEqual(dequeued_out, sorted_in)
 
+    def test_arity_batches(self):
+        '''
+        Test d-ary heaps, batch operations and the empty heap
+        '''
+
+        # Import packages
+        import random
+        from pytools.graphs_trees import trees
+
+        # Random keys through each arity
+        rand = random.Random(0)
+        in_keys = [rand.randrange(1000) for _ in xrange(500)]
+        for arity in (2, 3, 4, 8):
+            binary_heap = trees.BinaryHeap(arity=arity)
+            binary_heap.push_many(in_keys[:300])
+            binary_heap.push_many(in_keys[300:])
+            self.assertEqual(binary_heap.peek_min(), min(in_keys))
+            self.assertEqual(binary_heap.pop_many(100), sorted(in_keys)[:100])
+            binary_heap.build_heap(in_keys)
+            self.assertEqual(binary_heap.pop_many(1000), sorted(in_keys))
+
+        # Empty heap raises instead of crashing
+        binary_heap = trees.BinaryHeap()
+        self.assertRaises(IndexError, binary_heap.dequeue_min)
+        self.assertRaises(IndexError, binary_heap.peek_min)
+        self.assertEqual(binary_heap.pop_many(3), [])
+        self.assertRaises(ValueError, trees.BinaryHeap, 1)
+
+    def test_bounded(self):
+        '''
+        Test a bounded heap keeps only its max_size largest keys
+        '''
+
+        # Import packages
+        import random
+        from pytools.graphs_trees import trees
+
+        # Stream random keys through bounded heaps
+        rand = random.Random(0)
+        in_keys = [rand.randrange(1000) for _ in xrange(500)]
+        for arity in (2, 4):
+            binary_heap = trees.BinaryHeap(arity=arity, max_size=20)
+            binary_heap.push_many(iter(in_keys[:5]))
+            for key in in_keys[5:50]:
+                binary_heap.insert(key)
+            binary_heap.push_many(iter(in_keys[50:]))
+            self.assertEqual(len(binary_heap), 20)
+            self.assertEqual(binary_heap.pop_many(20), sorted(in_keys)[-20:])
+            binary_heap.build_heap(in_keys)
+            self.assertEqual(binary_heap.pop_many(20), sorted(in_keys)[-20:])
+
+        # Push pop hands back the smaller key without growing the heap
+        binary_heap = trees.BinaryHeap()
+        self.assertEqual(binary_heap.push_pop(4), 4)
+        binary_heap.push_many([3, 5])
+        self.assertEqual(binary_heap.push_pop(1), 1)
+        self.assertEqual(binary_heap.push_pop(4), 3)
+        self.assertEqual(binary_heap.pop_many(3), [4, 5])
+        self.assertRaises(ValueError, trees.BinaryHeap, 2, 0)
+
+
+class IndexedBinaryHeapTestCase(unittest.TestCase):
+    '''
+    TestCase for the IndexedBinaryHeap class from the trees.py module
+    '''
+
+    # Set up test case
+    def setUp(self):
+        '''
+        Initialize test case with attributes
+        '''
+
+        # Init instance attributes
+        self.in_pairs = [('e', 5), ('i', 9), ('k', 11), ('n', 14),
+                         ('r', 18), ('s', 19), ('u', 21), ('g', 33),
+                         ('q', 17), ('a', 27)]
+
+    def test_insert_dequeue(self):
+        '''
+        Test items come out in priority order, via insert or build_heap
+        '''
+
+        # Import packages
+        from pytools.graphs_trees import trees
+
+        # Init heaps
+        insert_heap = trees.IndexedBinaryHeap()
+        for item, priority in self.in_pairs:
+            insert_heap.insert(item, priority)
+        built_heap = trees.IndexedBinaryHeap()
+        built_heap.build_heap(self.in_pairs)
+
+        # Dequeue everything
+        expected = sorted(self.in_pairs, key=lambda pair: pair[1])
+        for binary_heap in (insert_heap, built_heap):
+            self.assertEqual(len(binary_heap), len(self.in_pairs))
+            self.assertIn('q', binary_heap)
+            dequeued_out = [binary_heap.dequeue_min()
+                            for idx in range(len(self.in_pairs))]
+            self.assertEqual(dequeued_out, expected)
+            self.assertNotIn('q', binary_heap)
+            self.assertRaises(IndexError, binary_heap.dequeue_min)
+
+    def test_decrease_key(self):
+        '''
+        Test decreasing an item's priority moves it up the heap
+        '''
+
+        # Import packages
+        from pytools.graphs_trees import trees
+
+        # Init heap
+        binary_heap = trees.IndexedBinaryHeap()
+        binary_heap.build_heap(self.in_pairs)
+
+        # Decrease keys and check the order
+        binary_heap.decrease_key('g', 1)
+        binary_heap.decrease_key('a', 10)
+        self.assertRaises(ValueError, binary_heap.decrease_key, 'e', 6)
+        self.assertRaises(KeyError, binary_heap.insert, 'e', 3)
+        dequeued_out = [binary_heap.dequeue_min()[0] for idx in range(4)]
+        self.assertEqual(dequeued_out, ['g', 'e', 'i', 'a'])
+
+    def test_remove_batches(self):
+        '''
+        Test remove, batch operations and d-ary layouts against a dict
+        of the expected priorities
+        '''
+
+        # Import packages
+        import random
+        from pytools.graphs_trees import trees
+
+        # Small batches insert one at a time, big ones rebuild
+        binary_heap = trees.IndexedBinaryHeap()
+        binary_heap.push_many(self.in_pairs[:6])
+        binary_heap.push_many(self.in_pairs[6:])
+        self.assertEqual(binary_heap.remove('n'), 14)
+        self.assertEqual(binary_heap.priority('q'), 17)
+        self.assertRaises(KeyError, binary_heap.remove, 'n')
+        self.assertRaises(KeyError, binary_heap.push_many, [('x', 1)]*2)
+        num_items = len(binary_heap)
+        self.assertRaises(KeyError, binary_heap.build_heap, [('x', 1)]*2)
+        self.assertEqual(len(binary_heap), num_items)
+        self.assertEqual(binary_heap.priority('q'), 17)
+        self.assertEqual(binary_heap.push_pop('b', 2), ('b', 2))
+        self.assertEqual(binary_heap.push_pop('b', 6), ('e', 5))
+        self.assertNotIn('e', binary_heap)
+        self.assertEqual(binary_heap.dequeue_min(), ('b', 6))
+        binary_heap.insert('e', 5)
+        self.assertRaises(KeyError, binary_heap.push_many, [('e', 1)])
+        self.assertEqual(len(binary_heap), len(self.in_pairs) - 1)
+        self.assertEqual([item for item, priority in binary_heap.pop_many(3)],
+                         ['e', 'i', 'k'])
+
+        # Random operations at each arity
+        rand = random.Random(0)
+        for arity in (2, 3, 4, 8):
+            binary_heap = trees.IndexedBinaryHeap(arity=arity)
+            expected = {}
+            for step in xrange(2000):
+                choice = rand.random()
+                if choice < 0.4:
+                    item = rand.randrange(500)
+                    if item not in expected:
+                        expected[item] = rand.random()
+                        binary_heap.insert(item, expected[item])
+                elif choice < 0.6 and expected:
+                    item = rand.choice(expected.keys())
+                    expected[item] /= 2.0
+                    binary_heap.decrease_key(item, expected[item])
+                elif choice < 0.8 and expected:
+                    item = rand.choice(expected.keys())
+                    self.assertEqual(binary_heap.remove(item),
+                                     expected.pop(item))
+                elif expected:
+                    item, priority = binary_heap.dequeue_min()
+                    self.assertEqual(priority, min(expected.values()))
+                    self.assertEqual(expected.pop(item), priority)
+            self.assertEqual(len(binary_heap), len(expected))
+            out = binary_heap.pop_many(len(expected))
+            self.assertEqual(out, sorted(expected.items(),
+                                         key=lambda pair: pair[1]))
+
+
+class HeapUtilsTestCase(unittest.TestCase):
+    '''
+    TestCase for the top-k and merge functions from the trees.py module
+    '''
+
+    # Set up test case
+    def setUp(self):
+        '''
+        Initialize test case with attributes
+        '''
+
+        # Import packages
+        import random
+
+        # Init instance attributes
+        rand = random.Random(0)
+        self.in_keys = [rand.randrange(1000) for _ in xrange(2000)]
+
+    def test_k_smallest_largest(self):
+        '''
+        Test the top-k functions against sorting, including streams
+        shorter than k
+        '''
+
+        # Import packages
+        from pytools.graphs_trees import trees
+
+        # Compare with sorted keys
+        sorted_keys = sorted(self.in_keys)
+        for num_keys in (1, 10, 100):
+            self.assertEqual(trees.k_smallest(iter(self.in_keys), num_keys),
+                             sorted_keys[:num_keys])
+            self.assertEqual(trees.k_largest(iter(self.in_keys), num_keys,
+                                             arity=4),
+                             sorted_keys[::-1][:num_keys])
+        self.assertEqual(trees.k_smallest([3, 1, 2], 5), [1, 2, 3])
+        self.assertEqual(trees.k_largest([3, 1, 2], 5), [3, 2, 1])
+        self.assertEqual(trees.k_smallest(self.in_keys, 0), [])
+        self.assertEqual(trees.k_largest([], 3), [])
+
+    def test_merge_sorted(self):
+        '''
+        Test merging sorted iterables, including empty and one-item
+        ones, is lazy and stable
+        '''
+
+        # Import packages
+        from pytools.graphs_trees import trees
+
+        # Split the keys into sorted runs of different lengths
+        runs = [sorted(self.in_keys[start:start + size])
+                for start, size in ((0, 700), (700, 1), (701, 0),
+                                    (701, 1000), (1701, 299))]
+        merged = trees.merge_sorted([iter(run) for run in runs])
+        self.assertEqual(merged.next(), min(self.in_keys))
+        self.assertEqual(list(merged), sorted(self.in_keys)[1:])
+        self.assertEqual(list(trees.merge_sorted([])), [])
+        self.assertEqual(list(trees.merge_sorted([[], [2, 3]])), [2, 3])
+
+        # Equal keys come out in the order of their iterables
+        pairs = [[(1, 'a'), (2, 'a')], [(1, 'b')], [(0, 'c'), (2, 'c')]]
+        merged = trees.merge_sorted(pairs)
+        keys = [(key, run) for key, run in merged]
+        self.assertEqual(keys, sorted(keys))
+
+    def test_merge_sorted_files(self):
+        '''
+        Test merging sorted text files line by line
+        '''
+
+        # Import packages
+        import os
+        import shutil
+        import tempfile
+        from pytools.graphs_trees import trees
+
+        # Write sorted runs of words to files
+        temp_dir = tempfile.mkdtemp()
+        try:
+            words = ['%04d' % key for key in self.in_keys]
+            file_paths = []
+            for idx in xrange(4):
+                file_path = os.path.join(temp_dir, 'run%d.txt' % idx)
+                with open(file_path, 'w') as run_file:
+                    run_file.write('\n'.join(sorted(words[idx::4])))
+                file_paths.append(file_path)
+            merged = list(trees.merge_sorted_files(file_paths, arity=3))
+            self.assertEqual(merged, sorted(words))
+        finally:
+            shutil.rmtree(temp_dir)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -11,6 +11,33 @@ import unittest
 
 from pytools.graphs_trees import utils
 
+
+def _random_tree(num_nodes, seed):
+    '''
+    Build a BinaryTree of random shape by hanging each new node off
+    a random free child slot
+    '''
+
+    # Import packages
+    import random
+    from pytools.graphs_trees import trees
+
+    # Init variables
+    rand = random.Random(seed)
+    root = trees.BinaryTree(rand.randrange(100))
+    free_slots = [(root, 'left_child'), (root, 'right_child')]
+
+    # Fill random slots
+    for _ in xrange(num_nodes - 1):
+        node, attr = free_slots.pop(rand.randrange(len(free_slots)))
+        child = trees.BinaryTree(rand.randrange(100))
+        setattr(node, attr, child)
+        free_slots.extend([(child, 'left_child'), (child, 'right_child')])
+
+    # Return the root
+    return root
+
+
 class GraphTreesUtilsTestCase(unittest.TestCase):
     '''
     TestCase for the utils module
@@ -96,6 +123,39 @@ class GraphTreesUtilsTestCase(unittest.TestCase):
                 node = node.next_node
                 node2 = node2.next_node
 
+    def test_iter_levels(self):
+        '''
+        Test the levels come out left to right in every container
+        '''
+
+        # Import packages
+        import numpy as np
+
+        # Init tree
+        bin_tree = utils.binary_tree_from_arr(self.sorted_arr, 0,
+                                              len(self.sorted_arr)-1)
+        expected = [[9], [0, 21], [-4, 3, 12, 23], [24]]
+
+        # Lists, arrays and linked lists of values
+        self.assertEqual(list(utils.iter_levels(bin_tree)), expected)
+        arrays = list(utils.iter_levels(bin_tree, container='array'))
+        self.assertEqual([arr.tolist() for arr in arrays], expected)
+        self.assertTrue(all(isinstance(arr, np.ndarray) for arr in arrays))
+        for idx, llist in enumerate(utils.iter_levels(bin_tree, 'llist')):
+            node = llist.head
+            values = []
+            while node:
+                values.append(node.data)
+                node = node.next_node
+            self.assertEqual(values, expected[idx])
+
+        # Nodes, an empty tree and a bad container
+        levels = list(utils.iter_levels(bin_tree, values=False))
+        self.assertTrue(levels[0][0] is bin_tree)
+        self.assertEqual(list(utils.iter_levels(None)), [])
+        self.assertRaises(ValueError, list,
+                          utils.iter_levels(bin_tree, container='set'))
+
     def test_pre_order_traverse(self):
         '''
         Test the pre-order traversal function
@@ -166,6 +226,255 @@ class GraphTreesUtilsTestCase(unittest.TestCase):
 
         self.assertEqual(3, utils.max_depth2(bin_tree))
 
+    def test_check_tree_balanced(self):
+        '''
+        Test the single pass balance check agrees with the max and min
+        heights, and stops on a chain deeper than the recursion limit
+        '''
+
+        # Import packages
+        from pytools.graphs_trees import trees
+
+        # Random small shapes
+        for seed in xrange(40):
+            bin_tree = _random_tree(1 + seed % 15, seed)
+            expected = (utils._get_max_height(bin_tree) -
+                        utils._get_min_height(bin_tree)) <= 1
+            self.assertEqual(utils.check_tree_balanced(bin_tree), expected)
+        self.assertTrue(utils.check_tree_balanced(None))
+
+        # Degenerate chain
+        root = node = trees.BinaryTree(0)
+        for value in xrange(1, 5000):
+            node.right_child = trees.BinaryTree(value)
+            node = node.right_child
+        self.assertFalse(utils.check_tree_balanced(root))
+
+    def test_check_height_balanced(self):
+        '''
+        Test the height balance check and the path it reports
+        '''
+
+        # Import packages
+        from pytools.graphs_trees import trees
+
+        # Minimum height trees are height balanced
+        bin_tree = utils.binary_tree_from_arr(self.sorted_arr, 0,
+                                              len(self.sorted_arr) - 1)
+        report = utils.check_height_balanced(bin_tree)
+        self.assertTrue(report)
+        self.assertEqual(report.path, [])
+
+        # Hang a chain of two off the right of 24 (9, 21, 23, 24, ...)
+        node = bin_tree.right_child.right_child.right_child
+        node.right_child = trees.BinaryTree(25)
+        node.right_child.right_child = trees.BinaryTree(26)
+        report = utils.check_height_balanced(bin_tree)
+        self.assertFalse(report)
+        self.assertEqual(report.path_values(), [9, 21, 23, 24])
+
+        # Chain deeper than the recursion limit
+        root = node = trees.BinaryTree(0)
+        for value in xrange(1, 5000):
+            node.left_child = trees.BinaryTree(value)
+            node = node.left_child
+        report = utils.check_height_balanced(root)
+        self.assertEqual(report.path_values(), range(4998))
+
+    def test_validate_bst(self):
+        '''
+        Test the BST check uses the bounds of every ancestor
+        '''
+
+        # Import packages
+        from pytools.graphs_trees import trees
+
+        # Valid tree
+        bin_tree = utils.binary_tree_from_arr(self.sorted_arr, 0,
+                                              len(self.sorted_arr) - 1)
+        self.assertTrue(utils.validate_bst(bin_tree))
+
+        # 3 -> 10 is above its parent 0 but also above its grandparent 9
+        bin_tree.left_child.right_child.value = 10
+        report = utils.validate_bst(bin_tree)
+        self.assertFalse(report)
+        self.assertEqual(report.path_values(), [9, 0, 10])
+        self.assertFalse(utils.verify_tree_property(bin_tree))
+
+        # Search tree nodes compare keys
+        bst = trees.BinarySearchTree.from_sorted(range(100))
+        self.assertTrue(utils.validate_bst(bst, attr='key'))
+        bst.max().key = 50
+        report = utils.validate_bst(bst, attr='key')
+        self.assertEqual(report.path[-1].key, 50)
+        self.assertTrue(utils.validate_bst(trees.AVLTree().root))
+
+    def test_iter_traversals(self):
+        '''
+        Test the generator traversals against the array tree orders,
+        and that Morris traversal leaves the tree as it found it
+        '''
+
+        # Import packages
+        import itertools
+        from pytools.graphs_trees import trees
+
+        # Sorted array tree
+        bin_tree = utils.binary_tree_from_arr(self.sorted_arr, 0,
+                                              len(self.sorted_arr) - 1)
+        self.assertEqual(list(utils.iter_level_order(bin_tree)),
+                         [9, 0, 21, -4, 3, 12, 23, 24])
+        nodes = list(utils.iter_in_order(bin_tree, values=False))
+        self.assertEqual([node.value for node in nodes], self.sorted_arr)
+        self.assertTrue(nodes[3] is bin_tree)
+
+        # Random shapes against the array tree orders
+        iter_funcs = [('pre', utils.iter_pre_order),
+                      ('in', utils.iter_in_order),
+                      ('in', utils.iter_morris_in_order),
+                      ('post', utils.iter_post_order),
+                      ('level', utils.iter_level_order)]
+        for seed in xrange(10):
+            bin_tree = _random_tree(1 + 3*seed, seed)
+            array_tree = utils.ArrayTree.from_binary_tree(bin_tree)
+            for order, iter_func in iter_funcs:
+                expected = array_tree.values[array_tree.traverse(order)]
+                self.assertEqual(list(iter_func(bin_tree)), expected.tolist())
+            self.assertEqual(list(iter_func(None)), [])
+
+        # Stopping Morris traversal part way removes its threads
+        bin_tree = _random_tree(30, 0)
+        pre_order = utils.pre_order_traverse(bin_tree)
+        morris = utils.iter_morris_in_order(bin_tree)
+        list(itertools.islice(morris, 10))
+        morris.close()
+        self.assertEqual(utils.pre_order_traverse(bin_tree), pre_order)
+
+        # Chains deeper than the recursion limit
+        root = node = trees.BinaryTree(0)
+        for value in xrange(1, 5000):
+            node.left_child = trees.BinaryTree(value)
+            node = node.left_child
+        for order, iter_func in iter_funcs:
+            self.assertEqual(len(list(iter_func(root))), 5000)
+        self.assertEqual(utils.in_order_traverse(None), '')
+
+
+class ArrayTreeTestCase(unittest.TestCase):
+    '''
+    TestCase for the ArrayTree class from the utils module
+    '''
+
+    # Set up test case
+    def setUp(self):
+        '''
+        Initialize test case with attributes
+        '''
+        self.sorted_arr = [-4, 0, 3, 9, 12, 21, 23, 24]
+
+    def test_converters(self):
+        '''
+        Test converting to and from BinaryTree, and building from a
+        sorted array, give the same shapes
+        '''
+
+        # Import packages
+        import numpy as np
+
+        # Sorted build matches binary_tree_from_arr
+        for num_nodes in xrange(20):
+            arr = range(num_nodes)
+            bin_tree = utils.binary_tree_from_arr(arr, 0, num_nodes - 1)
+            expected = utils.ArrayTree.from_binary_tree(bin_tree)
+            array_tree = utils.ArrayTree.from_sorted(arr)
+            self.assertEqual(len(array_tree), num_nodes)
+            self.assertTrue(np.array_equal(array_tree.values, expected.values))
+            self.assertTrue(np.array_equal(array_tree.left, expected.left))
+            self.assertTrue(np.array_equal(array_tree.right, expected.right))
+
+        # Round trip a random shape
+        bin_tree = _random_tree(50, 0)
+        array_tree = utils.ArrayTree.from_binary_tree(bin_tree)
+        round_trip = array_tree.to_binary_tree()
+        self.assertEqual(utils.pre_order_traverse(round_trip),
+                         utils.pre_order_traverse(bin_tree))
+        self.assertEqual(utils.in_order_traverse(round_trip),
+                         utils.in_order_traverse(bin_tree))
+        empty = utils.ArrayTree.from_binary_tree(None)
+        self.assertEqual(empty.to_binary_tree(), None)
+        self.assertRaises(ValueError, utils.ArrayTree, [1, 2], [-1], [-1])
+
+    def test_traverse(self):
+        '''
+        Test the traversal orders match the BinaryTree traversals
+        '''
+
+        # Import packages
+        import numpy as np
+
+        # Sorted array tree
+        array_tree = utils.ArrayTree.from_sorted(np.array(self.sorted_arr))
+        for order, expected in [('pre', '9 0 -4 3 21 12 23 24 '),
+                                ('in', '-4 0 3 9 12 21 23 24 '),
+                                ('post', '-4 3 0 12 24 23 21 9 '),
+                                ('level', '9 0 21 -4 3 12 23 24 ')]:
+            values = array_tree.values[array_tree.traverse(order)]
+            out_str = ''.join('%d ' % value for value in values)
+            self.assertEqual(out_str, expected)
+        self.assertRaises(ValueError, array_tree.traverse, 'sideways')
+
+        # Random shapes against the pointer traversals
+        for seed in xrange(5):
+            bin_tree = _random_tree(40, seed)
+            array_tree = utils.ArrayTree.from_binary_tree(bin_tree)
+            for order, traverse in [('pre', utils.pre_order_traverse),
+                                    ('in', utils.in_order_traverse),
+                                    ('post', utils.post_order_traverse)]:
+                values = array_tree.values[array_tree.traverse(order)]
+                self.assertEqual(''.join('%d ' % val for val in values),
+                                 traverse(bin_tree))
+
+    def test_heights(self):
+        '''
+        Test depths, heights and the balance and BST checks match the
+        pointer based functions
+        '''
+
+        # Import packages
+        import numpy as np
+
+        # Random shapes against the recursive functions
+        for seed in xrange(20):
+            bin_tree = _random_tree(1 + seed % 12, seed)
+            array_tree = utils.ArrayTree.from_binary_tree(bin_tree)
+            self.assertEqual(array_tree.max_height(),
+                             utils._get_max_height(bin_tree))
+            self.assertEqual(array_tree.max_height(),
+                             utils.max_depth2(bin_tree))
+            self.assertEqual(array_tree.min_height(),
+                             utils._get_min_height(bin_tree))
+            self.assertEqual(array_tree.is_balanced(),
+                             utils.check_tree_balanced(bin_tree))
+
+        # A degenerate chain deeper than the recursion limit
+        num_nodes = 5000
+        chain = utils.ArrayTree(np.arange(num_nodes),
+                                np.full(num_nodes, -1),
+                                np.append(np.arange(1, num_nodes), -1))
+        self.assertTrue(np.array_equal(chain.depths(), np.arange(num_nodes)))
+        self.assertEqual(chain.max_height(), num_nodes - 1)
+        self.assertEqual(chain.min_height(), 1)
+        self.assertFalse(chain.is_balanced())
+        self.assertTrue(chain.is_bst())
+
+        # BST check looks past the direct children
+        array_tree = utils.ArrayTree.from_sorted(self.sorted_arr)
+        self.assertTrue(array_tree.is_bst())
+        array_tree.values[4] = 10
+        self.assertFalse(array_tree.is_bst())
+        self.assertFalse(utils.verify_tree_property(
+            array_tree.to_binary_tree()))
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,94 @@
+# test/unit/puzzles/friend_circles_test.py
+#
+# Author: Daniel Clark, 2016
+
+'''
+Unit test module to perform testing on the friend_circles module
+'''
+
+# Import packages
+import unittest
+
+from pytools.puzzles import friend_circles
+
+class FriendCirclesTestCase(unittest.TestCase):
+    '''
+    TestCase for the friend_circles.py module
+    '''
+
+    # Set up test case
+    def setUp(self):
+        '''
+        Initialize test case with attributes
+        '''
+
+        # Init instance attributes
+        self.friends = [['Y', 'Y', 'N', 'N'],
+                        ['Y', 'Y', 'Y', 'N'],
+                        ['N', 'Y', 'Y', 'N'],
+                        ['N', 'N', 'N', 'Y']]
+
+    def test_friend_circles(self):
+        '''
+        Test counting circles from lists and strings of 'Y'/'N'
+        '''
+
+        # Lists of chars
+        self.assertEqual(friend_circles.friend_circles(self.friends), 2)
+
+        # Strings
+        friends = [''.join(stu) for stu in self.friends]
+        self.assertEqual(friend_circles.friend_circles(friends), 2)
+
+        # Everyone alone, and everyone friends through a chain
+        self.assertEqual(friend_circles.friend_circles(['YN', 'NY']), 2)
+        chain = ['YYNNN', 'YYYNN', 'NYYYN', 'NNYYY', 'NNNYY']
+        self.assertEqual(friend_circles.friend_circles(chain), 1)
+        self.assertEqual(friend_circles.friend_circles([]), 0)
+
+    def test_friend_circles_matrix(self):
+        '''
+        Test counting circles from NumPy boolean and bit-packed matrices
+        '''
+
+        # Import packages
+        import numpy as np
+
+        # Boolean matrix, expanded a row at a time
+        matrix = np.array(self.friends) == 'Y'
+        self.assertEqual(friend_circles.friend_circles_matrix(matrix), 2)
+        self.assertEqual(friend_circles.friend_circles_matrix(
+            matrix, block_rows=1), 2)
+
+        # Bit-packed matrix
+        packed = np.packbits(matrix, axis=1)
+        self.assertEqual(friend_circles.friend_circles_matrix(
+            packed, num_students=4), 2)
+
+    def test_friend_circles_matrix_random(self):
+        '''
+        Test the vectorized count matches the string-row count on a
+        random sparse friendship matrix
+        '''
+
+        # Import packages
+        import numpy as np
+
+        # Init a random symmetric matrix
+        rand = np.random.RandomState(0)
+        num_students = 296
+        matrix = rand.random_sample((num_students, num_students)) < .004
+        matrix = matrix | matrix.T | np.eye(num_students, dtype=bool)
+        rows = [''.join('Y' if frd else 'N' for frd in stu) for stu in matrix]
+
+        # Compare counts
+        expected = friend_circles.friend_circles(rows)
+        self.assertGreater(expected, 1)
+        self.assertEqual(friend_circles.friend_circles_matrix(
+            matrix, block_rows=64), expected)
+        self.assertEqual(friend_circles.friend_circles_matrix(
+            np.packbits(matrix, axis=1), num_students=num_students), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+# test/unit/puzzles/maze_test.py
+#
+# Author: Daniel Clark, 2016
+
+'''
+Unit test module to perform testing on the maze module
+'''
+
+# Import packages
+import unittest
+
+from pytools.puzzles import maze
+
+class MazeTestCase(unittest.TestCase):
+    '''
+    TestCase for the maze.py module
+    '''
+
+    # Set up test case
+    def setUp(self):
+        '''
+        Initialize test case with attributes
+        '''
+
+        # Init instance attributes
+        self.maze = [[0, 0, 0, 0],
+                     [1, 0, 1, 0],
+                     [1, 0, 0, 0]]
+        self.walled = [[0, 0, 0, 0, 0],
+                       [1, 1, 1, 1, 0],
+                       [0, 0, 0, 1, 0],
+                       [0, 1, 0, 0, 0],
+                       [0, 1, 1, 1, 1]]
+
+    def test_find_min_num_steps(self):
+        '''
+        Test the minimum number of steps to the exit
+        '''
+
+        self.assertEqual(maze.findMinNumSteps(self.maze, 3, 4, 1, 1), 2)
+        self.assertEqual(maze.findMinNumSteps(self.maze, 3, 4, 2, 2), 4)
+        self.assertEqual(maze.findMinNumSteps(self.maze, 3, 4, 0, 0), 0)
+        self.assertEqual(maze.findMinNumSteps(self.maze, 3, 4, 1, 0), -1)
+
+    def test_grid_bfs(self):
+        '''
+        Test distances and parent-based path reconstruction
+        '''
+
+        # Search the whole grid
+        dist, parent = maze.grid_bfs(self.walled, (0, 0))
+        self.assertEqual(dist[4, 0], 14)
+        self.assertEqual(dist[1, 0], -1)
+        path = maze.grid_path(parent, (2, 0))
+        self.assertEqual(len(path), dist[2, 0] + 1)
+        self.assertEqual(path[0], (0, 0))
+        self.assertEqual(path[-1], (2, 0))
+
+        # Every step moves to an adjacent open cell
+        for (row1, col1), (row2, col2) in zip(path[:-1], path[1:]):
+            self.assertEqual(abs(row1 - row2) + abs(col1 - col2), 1)
+            self.assertEqual(self.walled[row2][col2], 0)
+
+    def test_grid_bfs_frontiers(self):
+        '''
+        Test narrow frontiers, searched a cell at a time, and wide ones,
+        searched with NumPy, give the same distances
+        '''
+
+        # Import packages
+        import numpy as np
+
+        # Open grid, where the frontier grows past the scalar limit
+        side = 2*maze._SCALAR_FRONTIER + 3
+        dist, parent = maze.grid_bfs(np.zeros((side, side)), (0, 0))
+        rows, cols = np.indices((side, side))
+        self.assertTrue((dist == rows + cols).all())
+        path = maze.grid_path(parent, (side - 1, side - 1))
+        self.assertEqual(len(path), 2*side - 1)
+
+        # Serpentine corridor, one cell per level
+        grid = np.zeros((21, 21), dtype=np.int8)
+        grid[1::2] = 1
+        grid[1::4, -1] = 0
+        grid[3::4, 0] = 0
+        dist, parent = maze.grid_bfs(grid, (0, 0), (20, 20))
+        self.assertEqual(dist[20, 20], 11*21 - 1 + 10)
+        self.assertEqual(len(maze.shortest_path(grid, (0, 0), (20, 20))),
+                         dist[20, 20] + 1)
+
+    def test_shortest_path(self):
+        '''
+        Test BFS and A* agree on path lengths
+        '''
+
+        # Import packages
+        import numpy as np
+
+        # Random grids with open corners
+        rand = np.random.RandomState(0)
+        for trial in range(20):
+            grid = (rand.random_sample((12, 15)) < .3).astype(np.int8)
+            grid[0, 0] = grid[-1, -1] = 0
+            bfs_path = maze.shortest_path(grid, (0, 0), (11, 14))
+            astar_path = maze.shortest_path(grid, (0, 0), (11, 14), 'astar')
+            if bfs_path is None:
+                self.assertIsNone(astar_path)
+            else:
+                self.assertEqual(len(bfs_path), len(astar_path))
+                self.assertEqual(astar_path[-1], (11, 14))
+
+        # Walled-off cells and bad inputs
+        self.assertIsNone(maze.shortest_path(self.walled, (0, 0), (1, 0)))
+        self.assertIsNone(maze.shortest_path(self.walled, (0, 0), (1, 0),
+                                             'astar'))
+        self.assertRaises(IndexError, maze.shortest_path, self.walled,
+                          (0, 0), (5, 0))
+        self.assertRaises(ValueError, maze.shortest_path, self.walled,
+                          (0, 0), (2, 0), 'dfs')
+
+
+if __name__ == '__main__':
+    unittest.main()
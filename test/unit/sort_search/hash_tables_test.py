@@ -60,6 +60,304 @@ class HashTableTestCase(unittest.TestCase):
         self.assertEqual(ret2, val2, msg=err_msg % (str(ret2), key2))
         self.assertEqual(ret3, val3, msg=err_msg % (str(ret3), key3))
 
+    def test_probings(self):
+        '''
+        Test every probing strategy against a dict through random puts,
+        updates and deletes, growing the table past its initial size
+        '''
+
+        # Import packages
+        import random
+        from pytools.sort_search import hash_tables
+
+        # Random operations on small int keys collide and cluster
+        for probing in ('linear', 'quadratic', 'robin_hood'):
+            rand = random.Random(0)
+            hash_table = hash_tables.HashTable(probing=probing)
+            expected = {}
+            for step in xrange(5000):
+                key = rand.randrange(500)*8
+                if rand.random() < 0.3 and key in expected:
+                    del expected[key]
+                    del hash_table[key]
+                else:
+                    expected[key] = step
+                    hash_table[key] = step
+            self.assertEqual(len(hash_table), len(expected))
+            self.assertEqual(sorted(hash_table), sorted(expected))
+            for key in xrange(0, 4000, 8):
+                self.assertEqual(key in hash_table, key in expected)
+                if key in expected:
+                    self.assertEqual(hash_table[key], expected[key])
+            self.assertEqual(len(hash_table.probe_lengths()), len(expected))
+            self.assertTrue(min(hash_table.probe_lengths()) >= 1)
+
+    def test_keys_resize(self):
+        '''
+        Test any hashable key can be used, deleted keys are gone and
+        the table grows and drops its tombstones
+        '''
+
+        # Import packages
+        from pytools.sort_search import hash_tables
+
+        # Mixed key types
+        keys = ['apple', (1, 2), None, 2.5, -7, 10**20, frozenset('ab')]
+        for probing in ('linear', 'quadratic', 'robin_hood'):
+            hash_table = hash_tables.HashTable(size=2, probing=probing)
+            for idx, key in enumerate(keys):
+                hash_table.put(key, idx)
+            self.assertEqual(hash_table.size, 16)
+            self.assertEqual([hash_table[key] for key in keys],
+                             range(len(keys)))
+            del hash_table[None]
+            self.assertNotIn(None, hash_table)
+            self.assertRaises(KeyError, hash_table.get, None)
+            self.assertRaises(KeyError, hash_table.delete, None)
+            self.assertEqual(len(hash_table), len(keys) - 1)
+
+        # Tombstones are reused, then cleared by a rebuild
+        hash_table = hash_tables.HashTable(size=64)
+        for key in xrange(1000):
+            hash_table[key] = key
+            del hash_table[key]
+        self.assertEqual(len(hash_table), 0)
+        self.assertEqual(hash_table.size, 64)
+        self.assertRaises(ValueError, hash_tables.HashTable, 8, 'cuckoo')
+        self.assertRaises(ValueError, hash_tables.HashTable, 8, 'linear', 1)
+
+    def test_stats(self):
+        '''
+        Test the exported stats agree with the table and count every
+        lookup when tracked
+        '''
+
+        # Import packages
+        from pytools.sort_search import hash_tables
+
+        # Clusters wrap around the end of the slots; keys are picked
+        # by their home slot
+        homes = {}
+        for key in xrange(100):
+            homes.setdefault(hash_tables._mix_hash(key) >> 60, key)
+        hash_table = hash_tables.HashTable(size=8)
+        for home in (0, 1, 2, 7, 4):
+            hash_table[homes[home]] = home
+        stats = hash_table.stats()
+        self.assertEqual(stats['longest_cluster'], 4)
+        self.assertEqual(stats['probe_histogram'], {1: 5})
+        self.assertEqual(stats['load_factor'], 5/8.)
+        self.assertNotIn('lookup_histogram', stats)
+
+        # Tracked lookups, for every probing
+        for probing in ('linear', 'quadratic', 'robin_hood'):
+            hash_table = hash_tables.HashTable(probing=probing,
+                                               track_stats=True)
+            for key in xrange(0, 3000, 3):
+                hash_table[key] = key
+            for key in xrange(0, 3000, 2):
+                key in hash_table
+            del hash_table[3]
+            stats = hash_table.stats()
+            self.assertEqual(stats['num_lookups'], 1000 + 1500 + 1)
+            self.assertEqual(sum(stats['lookup_histogram'].values()),
+                             stats['num_lookups'])
+            self.assertEqual(sum(stats['probe_histogram'].values()), 999)
+            self.assertEqual(max(stats['probe_histogram']),
+                             stats['max_probes'])
+            self.assertTrue(stats['mean_lookup_probes'] >= 1)
+            self.assertTrue(stats['num_resizes'] > 0)
+            self.assertTrue(stats['resize_secs'] >= 0)
+            if probing != 'quadratic':
+                self.assertTrue(stats['longest_cluster'] >=
+                                stats['max_probes'])
+
+    def test_strided_keys(self):
+        '''
+        Test int keys that differ only above the slot bits, as ids and
+        aligned offsets do, are spread out instead of sharing a home
+        '''
+
+        # Import packages
+        from pytools.sort_search import hash_tables
+
+        # Keys a power of two apart
+        for stride in (2**16, 2**40):
+            keys = [idx*stride for idx in xrange(5000)]
+            for probing in ('linear', 'quadratic', 'robin_hood'):
+                hash_table = hash_tables.HashTable(probing=probing)
+                for key in keys:
+                    hash_table[key] = key
+                self.assertEqual([hash_table[key] for key in keys], keys)
+                probe_lengths = hash_table.probe_lengths()
+                self.assertTrue(sum(probe_lengths) < 2*len(probe_lengths))
+
+
+class IntHashTableTestCase(unittest.TestCase):
+    '''
+    TestCase for the IntHashTable class from the hash_tables module
+    '''
+
+    # Set up test case
+    def setUp(self):
+        '''
+        Initialize test case with attributes
+        '''
+
+        # Import packages
+        import random
+
+        # Init instance attributes
+        rand = random.Random(0)
+        self.ops = [(rand.randrange(-500, 500)*8, rand.random() < 0.3)
+                    for _ in xrange(5000)]
+
+    def test_put_get_delete(self):
+        '''
+        Test one key at a time against a dict, for both probings
+        '''
+
+        # Import packages
+        from pytools.sort_search import hash_tables
+
+        # Random puts and deletes
+        for probing in ('linear', 'quadratic'):
+            hash_table = hash_tables.IntHashTable(probing=probing)
+            expected = {}
+            for step, (key, is_delete) in enumerate(self.ops):
+                if is_delete and key in expected:
+                    del expected[key]
+                    del hash_table[key]
+                else:
+                    expected[key] = step
+                    hash_table[key] = step
+            self.assertEqual(len(hash_table), len(expected))
+            self.assertEqual(sorted(hash_table), sorted(expected))
+            for key in xrange(-4000, 4000, 8):
+                self.assertEqual(key in hash_table, key in expected)
+                if key in expected:
+                    self.assertEqual(hash_table[key], expected[key])
+            self.assertEqual(sorted(hash_table.probe_lengths()),
+                             sorted(hash_tables.HashTable.probe_lengths(
+                                 self._as_hash_table(hash_table))))
+
+        # Keys must fit in the typed slots
+        hash_table = hash_tables.IntHashTable()
+        self.assertRaises(KeyError, hash_table.put, 'a', 1)
+        self.assertRaises(KeyError, hash_table.put, -2**63 + 1, 1)
+        self.assertRaises(KeyError, hash_table.get, 2**63)
+        self.assertNotIn(-2**63, hash_table)
+        self.assertRaises(ValueError, hash_tables.IntHashTable, 8,
+                          'robin_hood')
+
+    def _as_hash_table(self, int_table):
+        '''
+        Copy the slots of an IntHashTable into a HashTable with the same
+        layout, to compare probe lengths
+        '''
+
+        # Import packages
+        from pytools.sort_search import hash_tables
+
+        # Same slots, with None for empty and deleted ones
+        hash_table = hash_tables.HashTable(int_table.size,
+                                           int_table.probing)
+        hash_table.hash_slots = [hash_tables._mix_hash(key)
+                                 if key > -2**63 + 1 else None
+                                 for key in int_table.key_slots]
+        return hash_table
+
+    def test_put_get_many(self):
+        '''
+        Test vectorized batches match one key at a time, with repeated
+        keys, updates, tombstones and missing keys
+        '''
+
+        # Import packages
+        import numpy as np
+        from pytools.sort_search import hash_tables
+
+        # Batches against single puts
+        keys = np.array([key for key, is_delete in self.ops])
+        values = np.arange(len(keys))
+        for probing in ('linear', 'quadratic'):
+            batch_table = hash_tables.IntHashTable(probing=probing)
+            single_table = hash_tables.IntHashTable(probing=probing)
+            batch_table.put_many(keys[:100], values[:100])
+            for key, value in zip(keys[:100], values[:100]):
+                single_table.put(key, value)
+            for key in set(keys[:50]):
+                batch_table.delete(key)
+                single_table.delete(key)
+            batch_table.put_many(keys[100:], values[100:])
+            for key, value in zip(keys[100:], values[100:]):
+                single_table.put(key, value)
+            self.assertEqual(len(batch_table), len(single_table))
+            self.assertEqual(sorted(batch_table), sorted(single_table))
+            self.assertEqual(batch_table.get_many(keys[100:]).tolist(),
+                             [single_table[key] for key in keys[100:]])
+
+        # Missing keys
+        self.assertRaises(KeyError, batch_table.get_many, [1, 8])
+        self.assertEqual(batch_table.get_many([1, 8, -2**63], -1)[[0, 2]]
+                         .tolist(), [-1, -1])
+        self.assertRaises(ValueError, batch_table.put_many, [1, 2], [1])
+        self.assertRaises(KeyError, batch_table.put_many, [-2**63], [1])
+        self.assertEqual(batch_table.nbytes, 16*batch_table.size)
+
+    def test_stats(self):
+        '''
+        Test the stats of one key at a time and batches agree; a batch
+        looks all of its keys up before placing any, so only the number
+        of lookups is compared, and places them a round at a time, so
+        only the total of the linear probe lengths is
+        '''
+
+        # Import packages
+        import numpy as np
+        from pytools.sort_search import hash_tables
+
+        # Same keys, put singly and as a batch
+        keys = np.unique([key for key, is_delete in self.ops])
+        single_table = hash_tables.IntHashTable(size=4096, track_stats=True)
+        for key in keys:
+            single_table[key] = 1
+        batch_table = hash_tables.IntHashTable(size=4096, track_stats=True)
+        batch_table.put_many(keys, np.ones(len(keys)))
+        single_stats = single_table.stats()
+        batch_stats = batch_table.stats()
+        for name in ('load_factor', 'mean_probes', 'longest_cluster',
+                     'num_lookups'):
+            self.assertEqual(single_stats[name], batch_stats[name])
+        self.assertEqual(batch_stats['num_resizes'], 0)
+
+    def test_strided_keys(self):
+        '''
+        Test int keys that differ only above the slot bits are spread
+        out, one key at a time and in batches
+        '''
+
+        # Import packages
+        import numpy as np
+        from pytools.sort_search import hash_tables
+
+        # Keys a power of two apart, positive and negative
+        for stride in (2**16, -2**40):
+            keys = np.arange(5000)*stride
+            for probing in ('linear', 'quadratic'):
+                single_table = hash_tables.IntHashTable(probing=probing)
+                for key in keys:
+                    single_table[key] = key
+                batch_table = hash_tables.IntHashTable(probing=probing)
+                batch_table.put_many(keys, keys)
+                for hash_table in (single_table, batch_table):
+                    probe_lengths = hash_table.probe_lengths()
+                    self.assertTrue(sum(probe_lengths) <
+                                    2*len(probe_lengths))
+                # Scalar and vectorized probes agree on the home slots
+                self.assertEqual(single_table.get_many(keys).tolist(),
+                                 [batch_table[key] for key in keys])
+
 
 
 